@@ -40,6 +40,27 @@ class Settings:
     pomodoro_work_min: int = 25
     pomodoro_break_min: int = 5
     ics_export_path: str | None = None
+    recurrence_catch_up: bool = True
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = -1
+    db_pre_ping: str = "idle"
+    db_ping_idle_seconds: float = 60.0
+    db_statement_timeout_ms: int | None = None
+    db_prepare_threshold: int | None = 5
+    db_executemany_mode: str = "values"
+    db_executemany_page_size: int = 1000
+
+
+def _optional_int(name: str, default: int | None) -> int | None:
+    """Integer from the environment; empty keeps ``default``, ``none`` or ``off`` means no value."""
+    value = os.getenv(name, "").strip().lower()
+    if not value:
+        return default
+    if value in ("none", "off"):
+        return None
+    return int(value)
 
 
 load_env()
@@ -55,4 +76,15 @@ SETTINGS = Settings(
     pomodoro_work_min=int(os.getenv("POMODORO_WORK_MIN", "25")),
     pomodoro_break_min=int(os.getenv("POMODORO_BREAK_MIN", "5")),
     ics_export_path=os.getenv("ICS_EXPORT_PATH", "").strip() or None,
+    recurrence_catch_up=os.getenv("RECURRENCE_CATCH_UP", "1").strip().lower() not in ("0", "false", "no", "off"),
+    db_pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+    db_max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+    db_pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+    db_pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "-1")),
+    db_pre_ping=os.getenv("DB_PRE_PING", "idle").strip().lower(),
+    db_ping_idle_seconds=float(os.getenv("DB_PING_IDLE_SECONDS", "60")),
+    db_statement_timeout_ms=_optional_int("DB_STATEMENT_TIMEOUT_MS", None),
+    db_prepare_threshold=_optional_int("DB_PREPARE_THRESHOLD", 5),
+    db_executemany_mode=os.getenv("DB_EXECUTEMANY_MODE", "values").strip().lower(),
+    db_executemany_page_size=int(os.getenv("DB_EXECUTEMANY_PAGE_SIZE", "1000")),
 )
@@ -5,9 +5,10 @@ from datetime import date, datetime
 from typing import Optional
 
 from .enums import TaskStatus
+from .filters import TaskCursor
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskEntity:
     id: int | None
     title: str
@@ -24,9 +25,21 @@ class TaskEntity:
     recurrence_end_date: Optional[date]
     archived_at: Optional[datetime]
     sort_order: int
+    # Id of the first task of a recurring series; None on that first task and on one-off tasks.
+    series_id: int | None = None
+    # Date the series' occurrences are counted from; None counts from this task's own due date.
+    series_start: Optional[date] = None
 
+    @property
+    def series_key(self) -> int | None:
+        return self.series_id or self.id
 
-@dataclass(frozen=True)
+    @property
+    def recurrence_start(self) -> Optional[date]:
+        return self.series_start or self.due_date
+
+
+@dataclass(frozen=True, slots=True)
 class SubtaskEntity:
     id: int | None
     task_id: int
@@ -35,3 +48,69 @@ class SubtaskEntity:
     created_at: datetime
     updated_at: datetime
     sort_order: int
+
+
+@dataclass(frozen=True, slots=True)
+class TaskCardRow:
+    """The columns a list or board card shows; the detail panel loads the full ``TaskEntity``."""
+
+    id: int
+    title: str
+    status: TaskStatus
+    priority: int
+    due_date: Optional[date]
+    tags: str
+    sort_order: int
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_entity(cls, task: TaskEntity) -> TaskCardRow:
+        return cls(
+            id=task.id,
+            title=task.title,
+            status=task.status,
+            priority=task.priority,
+            due_date=task.due_date,
+            tags=task.tags,
+            sort_order=task.sort_order,
+            created_at=task.created_at,
+            updated_at=task.updated_at,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SubtaskSummary:
+    """Subtask progress of one task and the titles of its first few subtasks."""
+
+    total: int
+    done: int
+    titles: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class TaskPage:
+    tasks: list[TaskEntity]
+    next_cursor: Optional[TaskCursor]
+    stats: Optional[dict[str, int]] = None
+
+
+@dataclass(frozen=True)
+class TaskCardPage:
+    cards: list[TaskCardRow]
+    next_cursor: Optional[TaskCursor]
+    stats: Optional[dict[str, int]] = None
+
+
+@dataclass(frozen=True)
+class TaskBoard:
+    columns: dict[str, list[TaskCardRow]]
+    subtasks: dict[int, SubtaskSummary]
+
+
+@dataclass(frozen=True)
+class CalendarMarks:
+    """Task counts per day: ``due`` from stored open tasks, ``projected`` from recurring series ahead of them."""
+
+    due: dict[date, int]
+    projected: dict[date, int]
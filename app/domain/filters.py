@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime
 from typing import Optional
 
 
@@ -10,3 +10,13 @@ class TaskFilters:
     filter_key: str = "all"
     search: str | None = None
     due_on: Optional[date] = None
+
+
+@dataclass(frozen=True)
+class TaskCursor:
+    sort_order: int
+    due_date: Optional[date]
+    priority: int
+    created_at: datetime
+    id: int
+    rank: Optional[float] = None
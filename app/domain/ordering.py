@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Sequence
+
+
+def increasing_run(values: Sequence[int]) -> set[int]:
+    """Positions of the longest strictly increasing run of ``values``, in O(n log n).
+
+    When items are moved around, these are the ones that can stay put;
+    only the rest need to move.
+    """
+    tails: list[int] = []
+    tail_positions: list[int] = []
+    parents = [-1] * len(values)
+    for position, value in enumerate(values):
+        slot = bisect_left(tails, value)
+        if slot == len(tails):
+            tails.append(value)
+            tail_positions.append(position)
+        else:
+            tails[slot] = value
+            tail_positions[slot] = position
+        parents[position] = tail_positions[slot - 1] if slot else -1
+
+    run: set[int] = set()
+    position = tail_positions[-1] if tail_positions else -1
+    while position >= 0:
+        run.add(position)
+        position = parents[position]
+    return run
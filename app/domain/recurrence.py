@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Hashable, Mapping, TypeVar
+
+from .enums import RecurrenceRule
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+
+_STEP_DAYS = {RecurrenceRule.DAILY.value: 1, RecurrenceRule.WEEKLY.value: 7}
+
+
+@dataclass(frozen=True, slots=True)
+class Recurrence:
+    """A series that repeats every ``interval`` rule units from ``start`` and stops after ``until``."""
+
+    start: date
+    rule: str
+    interval: int = 1
+    until: date | None = None
+
+    @classmethod
+    def of(cls, task, start: date | None = None) -> Recurrence | None:
+        """The rule of a recurring task counted from ``start``, its series' first date (default: its due date)."""
+        if not task.recurrence_rule or task.due_date is None:
+            return None
+        return cls(
+            start=start or task.due_date,
+            rule=task.recurrence_rule,
+            interval=max(int(task.recurrence_interval or 1), 1),
+            until=task.recurrence_end_date,
+        )
+
+
+def days_in_month(year: int, month: int) -> int:
+    if month == 12:
+        next_month = date(year + 1, 1, 1)
+    else:
+        next_month = date(year, month + 1, 1)
+    return (next_month - timedelta(days=1)).day
+
+
+def next_occurrence(series: Recurrence, after: date) -> date | None:
+    """The first date of ``series`` after ``after``, or None once the series has ended."""
+    # Consecutive dates are never more than 31 days per interval apart, month-end clamping included.
+    horizon = after + timedelta(days=(31 + _STEP_DAYS.get(series.rule, 1)) * series.interval)
+    found = occurrences(series, horizon, after)
+    return found[0] if found else None
+
+
+def occurrences(series: Recurrence, through: date, after: date | None = None) -> list[date]:
+    """Dates of ``series`` after ``after`` (default: its start) up to ``through`` and its ``until``."""
+    return expand({None: series}, through, {None: after} if after else None)[None]
+
+
+def expand(
+    series: Mapping[KeyT, Recurrence],
+    through: date,
+    after: Mapping[KeyT, date] | None = None,
+) -> dict[KeyT, list[date]]:
+    """Occurrence dates of every series in ``series`` up to ``through``, keyed like the input.
+
+    The n-th occurrence is computed directly from the start (day ordinals
+    for daily and weekly rules, month numbers for monthly ones) instead
+    of stepping one date at a time, so a series that is far behind costs
+    one range and the dates before ``after`` are never generated. Monthly
+    dates keep the start's day and fall back to the last day of shorter
+    months, so Jan 31 goes on to Feb 28 and then Mar 31. The start itself
+    is not an occurrence.
+    """
+    expanded: dict[KeyT, list[date]] = {}
+    for key, item in series.items():
+        last = min(through, item.until) if item.until else through
+        first = (after or {}).get(key) or item.start
+        if item.rule == RecurrenceRule.MONTHLY.value:
+            expanded[key] = _monthly(item, first, last)
+            continue
+        step = _STEP_DAYS.get(item.rule, 1) * item.interval
+        origin = item.start.toordinal()
+        low = max((first.toordinal() - origin) // step + 1, 1)
+        high = (last.toordinal() - origin) // step
+        expanded[key] = [date.fromordinal(origin + k * step) for k in range(low, high + 1)]
+    return expanded
+
+
+def _monthly(series: Recurrence, after: date, last: date) -> list[date]:
+    origin = series.start.year * 12 + series.start.month - 1
+    day = series.start.day
+    interval = series.interval
+
+    def nth(k: int) -> date:
+        return _month_date(origin + k * interval, day)
+
+    low = max((after.year * 12 + after.month - 1 - origin) // interval, 1)
+    while nth(low) <= after:
+        low += 1
+    high = (last.year * 12 + last.month - 1 - origin) // interval
+    if high >= low and nth(high) > last:
+        high -= 1
+    return [nth(k) for k in range(low, high + 1)]
+
+
+def _month_date(month_index: int, day: int) -> date:
+    year, month = divmod(month_index, 12)
+    return date(year, month + 1, min(day, days_in_month(year, month + 1)))
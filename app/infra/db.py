@@ -1,13 +1,220 @@
-from sqlalchemy import create_engine, text
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import create_engine, event, exc, text
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import declarative_base, sessionmaker
 
-from app.config import SETTINGS
+from app.config import SETTINGS, Settings
+
+PRE_PING_STRATEGIES = ("always", "idle", "never")
+EXECUTEMANY_MODES = ("values", "plain")
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    checkouts: int
+    connects: int
+    connect_ms: float
+    pings: int
+    ping_ms: float
+    ping_failures: int
+    checkout_wait_ms: float
+    max_checkout_wait_ms: float
+    checkout_timeouts: int
+    checked_out: int
+    idle: int
+
+
+class PoolMonitor:
+    """Counts pool checkouts and times checkout waits, new connections and liveness pings.
+
+    Takes the place of ``pool_pre_ping`` so the ping can be limited to
+    connections that sat in the pool for a while (``idle``), run on every
+    checkout (``always``) or be skipped (``never``), and so the time it
+    costs shows up in ``stats``. The checkout wait runs from the request
+    for a connection until the pool hands one out, opening it included
+    when none was idle; it grows, and checkouts start to time out, once
+    the pool is exhausted.
+    """
+
+    def __init__(self, strategy: str = "idle", idle_seconds: float = 60.0) -> None:
+        if strategy not in PRE_PING_STRATEGIES:
+            raise ValueError(f"Unknown pre-ping strategy {strategy!r}; expected one of {PRE_PING_STRATEGIES}")
+        self._strategy = strategy
+        self._idle_seconds = idle_seconds
+        self._lock = threading.Lock()
+        self._engine: Engine | None = None
+        self._checkouts = 0
+        self._connects = 0
+        self._connect_seconds = 0.0
+        self._pings = 0
+        self._ping_seconds = 0.0
+        self._ping_failures = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._timeouts = 0
+        self._requests = threading.local()
+
+    def attach(self, engine: Engine) -> None:
+        self._engine = engine
+        event.listen(engine, "do_connect", self._before_connect)
+        event.listen(engine.pool, "connect", self._on_connect)
+        event.listen(engine.pool, "checkout", self._on_checkout)
+        event.listen(engine.pool, "checkin", self._on_checkin)
+        # The pool has no event for a checkout request; dispose() replaces the pool, so wrap each new one.
+        event.listen(engine, "engine_disposed", self._time_requests)
+        self._time_requests(engine)
+
+    def stats(self) -> PoolStats:
+        pool = self._engine.pool if self._engine is not None else None
+        # Only QueuePool knows how many connections are out and idle.
+        checkedout = getattr(pool, "checkedout", None)
+        checkedin = getattr(pool, "checkedin", None)
+        with self._lock:
+            return PoolStats(
+                checkouts=self._checkouts,
+                connects=self._connects,
+                connect_ms=self._connect_seconds * 1000,
+                pings=self._pings,
+                ping_ms=self._ping_seconds * 1000,
+                ping_failures=self._ping_failures,
+                checkout_wait_ms=self._wait_seconds * 1000,
+                max_checkout_wait_ms=self._max_wait_seconds * 1000,
+                checkout_timeouts=self._timeouts,
+                checked_out=checkedout() if checkedout else 0,
+                idle=checkedin() if checkedin else 0,
+            )
+
+    def _time_requests(self, engine: Engine) -> None:
+        pool = engine.pool
+        connect = pool.connect
+
+        def timed_connect():
+            self._requests.started = time.perf_counter()
+            try:
+                return connect()
+            except exc.TimeoutError:
+                self._record_wait()
+                with self._lock:
+                    self._timeouts += 1
+                raise
+
+        pool.connect = timed_connect
+
+    def _record_wait(self) -> None:
+        started = getattr(self._requests, "started", None)
+        if started is None:
+            return
+        self._requests.started = None
+        waited = time.perf_counter() - started
+        with self._lock:
+            self._wait_seconds += waited
+            self._max_wait_seconds = max(self._max_wait_seconds, waited)
 
-engine = create_engine(SETTINGS.database_url, pool_pre_ping=True)
+    def _before_connect(self, dialect, connection_record, cargs, cparams) -> None:
+        connection_record.info["connect_started"] = time.perf_counter()
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        started = connection_record.info.pop("connect_started", None)
+        # A connection that was just opened needs no ping on its first checkout.
+        connection_record.info["fresh"] = True
+        with self._lock:
+            self._connects += 1
+            if started is not None:
+                self._connect_seconds += time.perf_counter() - started
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        self._record_wait()
+        with self._lock:
+            self._checkouts += 1
+        if connection_record.info.pop("fresh", False) or self._strategy == "never":
+            return
+        idle_for = time.monotonic() - connection_record.info.get("checked_in_at", 0.0)
+        if self._strategy == "idle" and idle_for < self._idle_seconds:
+            return
+
+        started = time.perf_counter()
+        try:
+            self._engine.dialect.do_ping(dbapi_connection)
+        except Exception as error:  # noqa: BLE001
+            with self._lock:
+                self._ping_failures += 1
+            # The pool discards this connection and retries the checkout with a new one.
+            raise exc.DisconnectionError() from error
+        finally:
+            with self._lock:
+                self._pings += 1
+                self._ping_seconds += time.perf_counter() - started
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+
+def engine_options(settings: Settings) -> dict:
+    """``create_engine`` keyword arguments for the pool and driver settings in ``settings``."""
+    if settings.db_executemany_mode not in EXECUTEMANY_MODES:
+        raise ValueError(
+            f"Unknown executemany mode {settings.db_executemany_mode!r}; expected one of {EXECUTEMANY_MODES}"
+        )
+    url = make_url(settings.database_url)
+    options: dict = {
+        "pool_recycle": settings.db_pool_recycle,
+        # "values" folds executemany INSERTs into multi-row INSERT ... VALUES pages.
+        "use_insertmanyvalues": settings.db_executemany_mode == "values",
+        "insertmanyvalues_page_size": settings.db_executemany_page_size,
+    }
+    if url.get_backend_name() != "sqlite":
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+        )
+    if url.get_backend_name() == "postgresql":
+        connect_args: dict = {}
+        if settings.db_statement_timeout_ms is not None:
+            connect_args["options"] = f"-c statement_timeout={settings.db_statement_timeout_ms}"
+        if url.get_driver_name() == "psycopg":
+            # None turns server-side prepared statements off; 0 prepares every query.
+            connect_args["prepare_threshold"] = settings.db_prepare_threshold
+        options["connect_args"] = connect_args
+    return options
+
+
+def prepare_marked_statements(engine: Engine) -> None:
+    """Pass the ``prepare`` execution option through to psycopg.
+
+    True prepares a statement server-side on its first run instead of its
+    ``prepare_threshold``-th; False never prepares it. The statement
+    registry in the repository sets it on its hot queries. A connection
+    whose ``prepare_threshold`` is None still prepares nothing.
+    """
+
+    @event.listens_for(engine, "do_execute")
+    def _execute(cursor, statement, parameters, context) -> bool | None:
+        prepare = context.execution_options.get("prepare")
+        if prepare is None or (prepare and cursor.connection.prepare_threshold is None):
+            return None
+        cursor.execute(statement, parameters, prepare=prepare)
+        return True
+
+
+engine = create_engine(SETTINGS.database_url, **engine_options(SETTINGS))
+if engine.dialect.driver == "psycopg" and SETTINGS.db_prepare_threshold is not None:
+    prepare_marked_statements(engine)
+pool_monitor = PoolMonitor(SETTINGS.db_pre_ping, SETTINGS.db_ping_idle_seconds)
+pool_monitor.attach(engine)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 Base = declarative_base()
 
 
+def pool_stats() -> PoolStats:
+    return pool_monitor.stats()
+
+
 def init_db() -> None:
     with engine.connect() as connection:
         connection.execute(text("SELECT 1"))
@@ -2,11 +2,37 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Sequence,
+    String,
+    Text,
+    text,
+)
 
 from .db import Base
 
 
+# Tasks are ranked with gaps so a moved card can take a free value between
+# its new neighbours instead of renumbering the column.
+RANK_GAP = 1024
+
+# Postgres hands out append ranks from this sequence (created by 0007).
+TASK_RANK_SEQUENCE = Sequence(
+    "tasks_sort_order_seq",
+    start=RANK_GAP,
+    increment=RANK_GAP,
+    metadata=Base.metadata,
+)
+
+
 def utcnow() -> datetime:
     return datetime.utcnow()
 
@@ -17,7 +43,7 @@ class TaskModel(Base):
     id = Column(Integer, primary_key=True)
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=False, default="")
-    status = Column(String(20), nullable=False, default="inbox", index=True)
+    status = Column(String(20), nullable=False, default="inbox")
     priority = Column(Integer, nullable=False, default=2)
     due_date = Column(Date, nullable=True)
     tags = Column(Text, nullable=False, default="")
@@ -28,7 +54,28 @@ class TaskModel(Base):
     recurrence_rule = Column(String(20), nullable=True)
     recurrence_interval = Column(Integer, nullable=False, default=1)
     recurrence_end_date = Column(Date, nullable=True)
-    sort_order = Column(Integer, nullable=False, default=0)
+    series_id = Column(Integer, nullable=True, index=True)
+    series_start = Column(Date, nullable=True)
+    sort_order = Column(BigInteger, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_tasks_status_sort_order", status, sort_order),
+        Index("ix_tasks_due_date", due_date),
+        Index(
+            "ix_tasks_open_due_date",
+            due_date,
+            postgresql_where=text("due_date IS NOT NULL AND status NOT IN ('done', 'archived')"),
+        ),
+        Index(
+            "ix_tasks_list_order",
+            sort_order,
+            due_date.is_(None),
+            due_date,
+            priority.desc(),
+            created_at.desc(),
+            id,
+        ),
+    )
 
 
 class SubtaskModel(Base):
@@ -1,20 +1,115 @@
 from __future__ import annotations
 
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date, datetime, timedelta
-from typing import Optional
+from functools import partial
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional, Sequence
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import (
+    BigInteger,
+    Date,
+    DateTime,
+    Float,
+    Integer,
+    and_,
+    bindparam,
+    case,
+    column,
+    delete,
+    false,
+    func,
+    insert,
+    null,
+    or_,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.orm import Session
 
-from app.domain.entities import SubtaskEntity, TaskEntity
-from app.domain.filters import TaskFilters
+from app.domain.entities import SubtaskEntity, SubtaskSummary, TaskBoard, TaskCardPage, TaskCardRow, TaskEntity, TaskPage
+from app.domain.filters import TaskCursor, TaskFilters
 from app.domain.enums import TaskStatus
+from app.domain.ordering import increasing_run
 
 from .db import SessionLocal
-from .models import SubtaskModel, TaskModel
+from .models import RANK_GAP, TASK_RANK_SEQUENCE, SubtaskModel, TaskModel, utcnow
+from .search import (
+    SearchCapabilities,
+    detect_search_capabilities,
+    search_params,
+    search_predicate,
+    search_rank,
+    search_shape,
+)
+from .statements import StatementRegistry
 
 STATUS_DONE = TaskStatus.DONE.value
 STATUS_ARCHIVED = TaskStatus.ARCHIVED.value
 
+_LIST_ORDER = (
+    TaskModel.sort_order.asc(),
+    TaskModel.due_date.is_(None),
+    TaskModel.due_date.asc(),
+    TaskModel.priority.desc(),
+    TaskModel.created_at.desc(),
+    TaskModel.id.asc(),
+)
+
+DEFAULT_PAGE_SIZE = 200
+BULK_BATCH_SIZE = 5000
+STREAM_BATCH_SIZE = 1000
+ID_CHUNK_SIZE = 900
+# Rows per UPDATE ... FROM (VALUES ...); two bind parameters each.
+RANK_UPDATE_CHUNK = 5000
+# Cards list this many subtask titles; the rest only count towards the totals.
+SUBTASK_PREVIEW_TITLES = 3
+
+# Every column a bulk insert writes; COPY does not apply the model's Python defaults.
+_BULK_COLUMNS = (
+    "title",
+    "description",
+    "status",
+    "priority",
+    "due_date",
+    "tags",
+    "created_at",
+    "updated_at",
+    "recurrence_rule",
+    "recurrence_interval",
+    "recurrence_end_date",
+    "sort_order",
+    "series_id",
+    "series_start",
+)
+
+
+# Hot queries, built once per shape; see ``_page_key`` for what a shape is.
+_statements = StatementRegistry()
+
+# Session of the unit of work open on this thread, if any.
+_active_session: ContextVar[Session | None] = ContextVar("active_session", default=None)
+
+
+@contextmanager
+def _session_scope() -> Iterator[Session]:
+    """The open unit of work's session, or a new one that commits when the block ends."""
+    session = _active_session.get()
+    if session is not None:
+        yield session
+        return
+    with SessionLocal() as session:
+        yield session
+        session.commit()
+
+
+def _intern(value: str | None) -> str | None:
+    # Tags and rules repeat across thousands of rows; share one copy of each.
+    return sys.intern(value) if value else value
+
 
 def _to_entity(model: TaskModel) -> TaskEntity:
     return TaskEntity(
@@ -24,15 +119,45 @@ def _to_entity(model: TaskModel) -> TaskEntity:
         status=TaskStatus(model.status),
         priority=model.priority,
         due_date=model.due_date,
-        tags=model.tags,
+        tags=_intern(model.tags),
         created_at=model.created_at,
         updated_at=model.updated_at,
         completed_at=model.completed_at,
-        recurrence_rule=model.recurrence_rule,
+        recurrence_rule=_intern(model.recurrence_rule),
         recurrence_interval=model.recurrence_interval,
         recurrence_end_date=model.recurrence_end_date,
         archived_at=model.archived_at,
         sort_order=model.sort_order,
+        series_id=model.series_id,
+        series_start=model.series_start,
+    )
+
+
+# Only what a card paints; the unbounded description stays in the database.
+_CARD_COLUMNS = (
+    TaskModel.id,
+    TaskModel.title,
+    TaskModel.status,
+    TaskModel.priority,
+    TaskModel.due_date,
+    TaskModel.tags,
+    TaskModel.sort_order,
+    TaskModel.created_at,
+    TaskModel.updated_at,
+)
+
+
+def _to_card(row) -> TaskCardRow:
+    return TaskCardRow(
+        id=row.id,
+        title=row.title,
+        status=TaskStatus(row.status),
+        priority=row.priority,
+        due_date=row.due_date,
+        tags=_intern(row.tags),
+        sort_order=row.sort_order,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
     )
 
 
@@ -48,8 +173,10 @@ def _to_subtask_entity(model: SubtaskModel) -> SubtaskEntity:
     )
 
 
-def _apply_filters(stmt, filters: TaskFilters) -> object:
-    today = date.today()
+def _apply_filters(stmt, filters: TaskFilters, search: SearchCapabilities | None = None) -> object:
+    """Add the ``filters`` conditions; dates and search terms are named bind parameters (see ``_filter_params``)."""
+    params = _filter_params(filters)
+    today = bindparam("today", params["today"], type_=Date)
 
     if filters.filter_key == "inbox":
         stmt = stmt.where(TaskModel.status == TaskStatus.INBOX.value)
@@ -66,7 +193,7 @@ def _apply_filters(stmt, filters: TaskFilters) -> object:
             TaskModel.status.notin_([STATUS_DONE, STATUS_ARCHIVED]),
         )
     elif filters.filter_key == "upcoming":
-        horizon = today + timedelta(days=7)
+        horizon = bindparam("horizon", params["horizon"], type_=Date)
         stmt = stmt.where(
             TaskModel.due_date.is_not(None),
             TaskModel.due_date.between(today, horizon),
@@ -74,53 +201,626 @@ def _apply_filters(stmt, filters: TaskFilters) -> object:
         )
 
     if filters.due_on:
-        stmt = stmt.where(TaskModel.due_date == filters.due_on)
+        stmt = stmt.where(TaskModel.due_date == bindparam("due_on", filters.due_on, type_=Date))
 
     if filters.search:
-        pattern = f"%{filters.search}%"
-        stmt = stmt.where(
-            or_(
-                TaskModel.title.ilike(pattern),
-                TaskModel.description.ilike(pattern),
-                TaskModel.tags.ilike(pattern),
-            )
-        )
+        stmt = stmt.where(search_predicate(filters.search, search or SearchCapabilities()))
 
     return stmt
 
 
+def _filter_params(filters: TaskFilters) -> dict:
+    today = date.today()
+    params = {"today": today, "horizon": today + timedelta(days=7)}
+    if filters.due_on:
+        params["due_on"] = filters.due_on
+    if filters.search:
+        params.update(search_params(filters.search))
+    return params
+
+
+def _cursor_for(task: TaskEntity | TaskCardRow, rank: float | None = None) -> TaskCursor:
+    return TaskCursor(
+        sort_order=task.sort_order,
+        due_date=task.due_date,
+        priority=task.priority,
+        created_at=task.created_at,
+        id=task.id,
+        rank=rank,
+    )
+
+
+def _after_cursor(cursor: TaskCursor, rank=None):
+    """Rows strictly after ``cursor`` in ``_LIST_ORDER``, led by ``rank`` when searching."""
+    values = _cursor_params(cursor)
+    sort_order = bindparam("after_sort_order", values["after_sort_order"], type_=BigInteger)
+    priority = bindparam("after_priority", values["after_priority"], type_=Integer)
+    created_at = bindparam("after_created_at", values["after_created_at"], type_=DateTime)
+    task_id = bindparam("after_id", values["after_id"], type_=Integer)
+    if cursor.due_date is None:
+        due_step = (TaskModel.due_date.is_(None), false())
+    else:
+        due_date = bindparam("after_due_date", values["after_due_date"], type_=Date)
+        due_step = (
+            TaskModel.due_date == due_date,
+            or_(TaskModel.due_date.is_(None), TaskModel.due_date > due_date),
+        )
+    steps = []
+    if rank is not None and cursor.rank is not None:
+        after_rank = bindparam("after_rank", values["after_rank"], type_=Float)
+        steps.append((rank == after_rank, rank < after_rank))
+    steps += [
+        (TaskModel.sort_order == sort_order, TaskModel.sort_order > sort_order),
+        due_step,
+        (TaskModel.priority == priority, TaskModel.priority < priority),
+        (TaskModel.created_at == created_at, TaskModel.created_at < created_at),
+        (TaskModel.id == task_id, TaskModel.id > task_id),
+    ]
+
+    clauses = []
+    equal_prefix = []
+    for equal, after in steps:
+        clauses.append(and_(*equal_prefix, after))
+        equal_prefix.append(equal)
+    return or_(*clauses)
+
+
+def _cursor_params(cursor: TaskCursor) -> dict:
+    return {
+        "after_sort_order": cursor.sort_order,
+        "after_due_date": cursor.due_date,
+        "after_priority": cursor.priority,
+        "after_created_at": cursor.created_at,
+        "after_id": cursor.id,
+        "after_rank": cursor.rank,
+    }
+
+
+def _page_statement(
+    filters: TaskFilters,
+    after: TaskCursor | None,
+    limit: int,
+    search: SearchCapabilities | None = None,
+    columns: Sequence = (TaskModel,),
+):
+    rank = search_rank(filters.search, search) if filters.search and search else None
+    stmt = select(*columns, (rank if rank is not None else null()).label("search_rank"))
+    stmt = _apply_filters(stmt, filters, search)
+    if after is not None:
+        stmt = stmt.where(_after_cursor(after, rank))
+    order = (rank.desc(), *_LIST_ORDER) if rank is not None else _LIST_ORDER
+    return stmt.order_by(*order).limit(bindparam("limit", limit, type_=Integer))
+
+
+def _page_key(kind: str, filters: TaskFilters, after: TaskCursor | None, search: SearchCapabilities):
+    """What makes two page queries differ in SQL text rather than only in parameter values."""
+    return (
+        kind,
+        filters.filter_key,
+        filters.due_on is not None,
+        search_shape(filters.search, search) if filters.search else None,
+        None if after is None else (after.due_date is None, after.rank is not None),
+    )
+
+
+def _read_page(session, kind: str, columns: Sequence, filters: TaskFilters, after: TaskCursor | None, limit: int):
+    """The next ``limit + 1`` rows of a task or card listing, through the statement registry."""
+    search = detect_search_capabilities(session)
+    stmt = _statements.get(
+        _page_key(kind, filters, after, search),
+        lambda: _page_statement(filters, after, limit + 1, search, columns),
+    )
+    params = _filter_params(filters)
+    if after is not None:
+        params.update(_cursor_params(after))
+    params["limit"] = limit + 1
+    return session.execute(stmt, params).all()
+
+
+def _max_sort_order_statement(status: str):
+    return select(func.max(TaskModel.sort_order)).where(TaskModel.status == status)
+
+
+def _next_subtask_sort_order(task_id: int):
+    max_order = select(func.max(SubtaskModel.sort_order)).where(SubtaskModel.task_id == task_id)
+    return func.coalesce(max_order.scalar_subquery(), 0) + 1
+
+
+def _uses_rank_sequence(session) -> bool:
+    return session.get_bind().dialect.name == "postgresql"
+
+
+def _append_rank(session, status: str):
+    """SQL for a rank after every task in ``status``, evaluated inside the INSERT or UPDATE.
+
+    Postgres draws it from ``TASK_RANK_SEQUENCE`` without looking at the
+    table; other databases fall back to the column maximum plus a gap.
+    """
+    if _uses_rank_sequence(session):
+        return TASK_RANK_SEQUENCE.next_value()
+    return func.coalesce(_max_sort_order_statement(status).scalar_subquery(), 0) + RANK_GAP
+
+
+def _reserve_ranks(session, count: int) -> list[int]:
+    if not count:
+        return []
+    stmt = select(TASK_RANK_SEQUENCE.next_value()).select_from(func.generate_series(1, count))
+    return sorted(session.scalars(stmt))
+
+
+def _restart_series(data: dict) -> dict:
+    """Count a recurring task's series from its due date again when its due date, rule or interval changes.
+
+    Applies to any instance, so moving the open one re-anchors the series
+    just like moving the first. Left alone when the values stay the same
+    or recurrence is switched off; the first task of a series always
+    counts from its own due date.
+    """
+    edited = [name for name in ("due_date", "recurrence_rule", "recurrence_interval") if name in data]
+    if not edited or ("recurrence_rule" in data and data["recurrence_rule"] is None):
+        return data
+    unchanged = and_(*(getattr(TaskModel, name).is_not_distinct_from(data[name]) for name in edited))
+    due_date = bindparam("restart_due_date", data["due_date"], type_=Date) if "due_date" in data else TaskModel.due_date
+    series_start = case(
+        (unchanged, TaskModel.series_start),
+        (TaskModel.series_id.is_(None), null()),
+        else_=due_date,
+    )
+    return {**data, "series_start": series_start}
+
+
+def _returning_update(model, condition, data: dict):
+    """``UPDATE ... RETURNING`` the whole row, in place of a load, a flush and a refresh."""
+    return (
+        update(model)
+        .where(condition)
+        .values(**data)
+        .returning(model)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+
+
+def _write_ranks(session, ranks: dict[int, int]) -> None:
+    """Set many ``sort_order`` values in one statement instead of one UPDATE per row."""
+    items = list(ranks.items())
+    if not items:
+        return
+    connection = session.connection()
+    if not _uses_rank_sequence(session):
+        # No UPDATE ... FROM (VALUES ...) here: one statement, executemany parameters.
+        stmt = (
+            update(TaskModel.__table__)
+            .where(TaskModel.id == bindparam("task_id"))
+            .values(sort_order=bindparam("rank"))
+        )
+        connection.execute(stmt, [{"task_id": task_id, "rank": rank} for task_id, rank in items])
+        return
+    for start in range(0, len(items), RANK_UPDATE_CHUNK):
+        ranked = values(column("id", Integer), column("sort_order", BigInteger), name="ranked").data(
+            items[start:start + RANK_UPDATE_CHUNK]
+        )
+        stmt = (
+            update(TaskModel.__table__)
+            .where(TaskModel.id == ranked.c.id)
+            .values(sort_order=ranked.c.sort_order)
+        )
+        connection.execute(stmt)
+
+
+def _rerank(
+    task_ids: list[int],
+    ranks: dict[int, int],
+    outer_rank: Callable[[int, bool], int | None],
+    tail_ranks: Callable[[int], list[int]] | None = None,
+) -> dict[int, int] | None:
+    """New ranks for the fewest tasks that put ``task_ids`` in order; None once a gap is used up.
+
+    Tasks on the longest run already in rank order keep their ranks, so a
+    single drag changes one row. The others are spread between their new
+    neighbours; ``outer_rank(rank, above)`` gives the closest rank of the
+    column just above or below ``rank`` for runs at either end. A run
+    moved past the end of the column takes ``tail_ranks(count)`` when
+    given, so it never collides with the next append.
+    """
+    stable = increasing_run([ranks[task_id] for task_id in task_ids])
+    changes: dict[int, int] = {}
+    position = 0
+    while position < len(task_ids):
+        if position in stable:
+            position += 1
+            continue
+        start = position
+        while position < len(task_ids) and position not in stable:
+            position += 1
+        run = task_ids[start:position]
+        low = ranks[task_ids[start - 1]] if start else None
+        high = ranks[task_ids[position]] if position < len(task_ids) else None
+        if low is None:
+            low = outer_rank(high, False)
+        elif high is None:
+            high = outer_rank(low, True)
+
+        if high is None and tail_ranks is not None:
+            values = tail_ranks(len(run))
+        elif high is None:
+            values = [low + RANK_GAP * (offset + 1) for offset in range(len(run))]
+        elif low is None:
+            values = [high - RANK_GAP * (len(run) - offset) for offset in range(len(run))]
+        else:
+            step = (high - low) // (len(run) + 1)
+            if step < 1:
+                return None
+            values = [low + step * (offset + 1) for offset in range(len(run))]
+        changes.update(zip(run, values))
+    return changes
+
+
+def _subtask_summary_statement(condition, preview: int):
+    """Per-task totals plus the first ``preview`` subtasks, counted with window functions."""
+    per_task = {"partition_by": SubtaskModel.task_id}
+    ranked = (
+        select(
+            SubtaskModel.task_id,
+            SubtaskModel.title,
+            func.row_number()
+            .over(**per_task, order_by=(SubtaskModel.sort_order.asc(), SubtaskModel.created_at.asc()))
+            .label("position"),
+            func.count().over(**per_task).label("total"),
+            func.sum(case((SubtaskModel.is_done, 1), else_=0)).over(**per_task).label("done"),
+        )
+        .where(condition)
+        .subquery()
+    )
+    # Every task keeps its first row so tasks with only untitled subtasks are still counted.
+    return (
+        select(ranked)
+        .where(ranked.c.position <= bindparam("preview_rows", max(preview, 1), type_=Integer))
+        .order_by(ranked.c.task_id.asc(), ranked.c.position.asc())
+    )
+
+
+def _stats_statement():
+    today = bindparam("today", type_=Date)
+    open_task = TaskModel.status.notin_([STATUS_DONE, STATUS_ARCHIVED])
+    return select(
+        func.count().label("total"),
+        func.count()
+        .filter(TaskModel.status == TaskStatus.IN_PROGRESS.value)
+        .label("in_progress"),
+        func.count().filter(TaskModel.status == STATUS_DONE).label("done"),
+        func.count()
+        .filter(TaskModel.due_date < today, open_task)
+        .label("overdue"),
+        func.count().filter(TaskModel.due_date == today).label("due_today"),
+    ).select_from(TaskModel)
+
+
+def _board_cards_statement():
+    on_board = TaskModel.status.in_(bindparam("statuses", expanding=True))
+    return select(*_CARD_COLUMNS).where(on_board).order_by(*_LIST_ORDER)
+
+
+def _board_subtasks_statement(preview: int):
+    on_board = select(TaskModel.id).where(TaskModel.status.in_(bindparam("statuses", expanding=True)))
+    return _subtask_summary_statement(SubtaskModel.task_id.in_(on_board), preview)
+
+
+def _group_summaries(rows, preview: int) -> dict[int, SubtaskSummary]:
+    counts: dict[int, tuple[int, int]] = {}
+    titles: dict[int, list[str]] = {}
+    for row in rows:
+        task_id = int(row.task_id)
+        counts[task_id] = (int(row.total), int(row.done or 0))
+        title = (row.title or "").strip()
+        if title and row.position <= preview:
+            titles.setdefault(task_id, []).append(title)
+    return {
+        task_id: SubtaskSummary(total=total, done=done, titles=tuple(titles.get(task_id, ())))
+        for task_id, (total, done) in counts.items()
+    }
+
+
+def _insert_tasks(session, values: list[dict]) -> None:
+    session.execute(insert(TaskModel), values)
+
+
+def _copy_tasks(session, values: list[dict]) -> None:
+    # The raw psycopg connection shares the session's transaction.
+    connection = session.connection().connection.driver_connection
+    with connection.cursor() as cursor:
+        with cursor.copy(f"COPY tasks ({', '.join(_BULK_COLUMNS)}) FROM STDIN") as copy:
+            for row in values:
+                copy.write_row([row[column] for column in _BULK_COLUMNS])
+
+
+def _bulk_insert(
+    session,
+    rows: Iterable[dict],
+    batch_size: int = BULK_BATCH_SIZE,
+    progress: Callable[[int], None] | None = None,
+) -> int:
+    """Insert ``rows`` in batches on ``session`` without committing; returns the count.
+
+    New tasks are ranked after the existing ones: on Postgres with one
+    sequence round trip per batch, elsewhere from each status' maximum
+    tracked in memory. On psycopg 3 each batch is streamed with ``COPY``;
+    other drivers get an executemany ``INSERT``.
+    """
+    use_sequence = _uses_rank_sequence(session)
+    next_order = {}
+    if not use_sequence:
+        next_order = dict(
+            session.execute(
+                select(TaskModel.status, func.max(TaskModel.sort_order)).group_by(TaskModel.status)
+            ).all()
+        )
+    write = _copy_tasks if session.get_bind().dialect.driver == "psycopg" else _insert_tasks
+    now = utcnow()
+    created = 0
+    iterator = iter(rows)
+    while batch := list(islice(iterator, batch_size)):
+        reserved = iter(
+            _reserve_ranks(session, sum(1 for row in batch if row.get("sort_order") is None))
+            if use_sequence
+            else ()
+        )
+        values = []
+        for row in batch:
+            status = row.get("status") or TaskStatus.INBOX.value
+            sort_order = row.get("sort_order")
+            if sort_order is None:
+                sort_order = next(reserved, None) or (next_order.get(status) or 0) + RANK_GAP
+            next_order[status] = max(next_order.get(status) or 0, sort_order)
+            values.append(
+                {
+                    "title": row["title"],
+                    "description": row.get("description") or "",
+                    "status": status,
+                    "priority": row.get("priority") or 2,
+                    "due_date": row.get("due_date"),
+                    "tags": row.get("tags") or "",
+                    "created_at": row.get("created_at") or now,
+                    "updated_at": now,
+                    "recurrence_rule": row.get("recurrence_rule"),
+                    "recurrence_interval": row.get("recurrence_interval") or 1,
+                    "recurrence_end_date": row.get("recurrence_end_date"),
+                    "sort_order": sort_order,
+                    "series_id": row.get("series_id"),
+                    "series_start": row.get("series_start"),
+                }
+            )
+        write(session, values)
+        created += len(values)
+        if progress:
+            progress(created)
+    return created
+
+
 class TaskRepository:
+    @contextmanager
+    def unit_of_work(self) -> Iterator[None]:
+        """Run every repository call made inside the block on one session and commit once at the end.
+
+        Nested blocks join the outer one. Nothing is committed if the block raises.
+        """
+        if _active_session.get() is not None:
+            yield
+            return
+        with SessionLocal() as session:
+            token = _active_session.set(session)
+            try:
+                yield
+                session.commit()
+            finally:
+                _active_session.reset(token)
+
     def list_tasks(self, filters: TaskFilters) -> list[TaskEntity]:
+        with _session_scope() as session:
+            search = detect_search_capabilities(session)
+            stmt = _statements.get(
+                _page_key("all_tasks", filters, None, search),
+                lambda: _apply_filters(select(TaskModel), filters, search).order_by(*_LIST_ORDER),
+            )
+            return [_to_entity(task) for task in session.scalars(stmt, _filter_params(filters))]
+
+    def list_tasks_page(
+        self,
+        filters: TaskFilters,
+        after: TaskCursor | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        include_stats: bool = False,
+    ) -> TaskPage:
+        with _session_scope() as session:
+            rows = _read_page(session, "tasks", (TaskModel,), filters, after, limit)
+            tasks = [_to_entity(row.TaskModel) for row in rows[:limit]]
+            stats = self._read_stats(session) if include_stats else None
+
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = _cursor_for(tasks[-1], rows[limit - 1].search_rank)
+        return TaskPage(tasks=tasks, next_cursor=next_cursor, stats=stats)
+
+    def list_cards_page(
+        self,
+        filters: TaskFilters,
+        after: TaskCursor | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        include_stats: bool = False,
+    ) -> TaskCardPage:
+        """Like ``list_tasks_page`` but reads only the card columns into plain tuples."""
+        with _session_scope() as session:
+            rows = _read_page(session, "cards", _CARD_COLUMNS, filters, after, limit)
+            cards = [_to_card(row) for row in rows[:limit]]
+            stats = self._read_stats(session) if include_stats else None
+
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = _cursor_for(cards[-1], rows[limit - 1].search_rank)
+        return TaskCardPage(cards=cards, next_cursor=next_cursor, stats=stats)
+
+    def iter_task_pages(
+        self,
+        filters: TaskFilters,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[list[TaskEntity]]:
+        cursor: TaskCursor | None = None
+        while True:
+            page = self.list_tasks_page(filters, after=cursor, limit=page_size)
+            if page.tasks:
+                yield page.tasks
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+    def iter_task_values(
+        self,
+        columns: Sequence[str],
+        filters: TaskFilters,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[tuple]:
+        """Yield only ``columns`` of matching tasks in list order, through a server-side cursor."""
+        # Its own session: a cursor that is still streaming cannot share a connection.
         with SessionLocal() as session:
-            stmt = select(TaskModel)
-            stmt = _apply_filters(stmt, filters)
-            stmt = stmt.order_by(
-                TaskModel.sort_order.asc(),
-                TaskModel.due_date.is_(None),
-                TaskModel.due_date.asc(),
-                TaskModel.priority.desc(),
-                TaskModel.created_at.desc(),
+            stmt = select(*(getattr(TaskModel, column) for column in columns))
+            stmt = _apply_filters(stmt, filters, detect_search_capabilities(session))
+            stmt = stmt.order_by(*_LIST_ORDER).execution_options(
+                stream_results=True,
+                yield_per=batch_size,
             )
-            return [_to_entity(task) for task in session.scalars(stmt)]
+            for row in session.execute(stmt):
+                yield tuple(row)
 
     def get_task(self, task_id: int) -> Optional[TaskEntity]:
-        with SessionLocal() as session:
+        with _session_scope() as session:
             task = session.get(TaskModel, task_id)
             return _to_entity(task) if task else None
 
+    def get_tasks(self, task_ids: Sequence[int]) -> list[TaskEntity]:
+        tasks: list[TaskEntity] = []
+        with _session_scope() as session:
+            # Chunked so a large id list stays under driver parameter limits.
+            for start in range(0, len(task_ids), ID_CHUNK_SIZE):
+                chunk = list(task_ids[start:start + ID_CHUNK_SIZE])
+                # The expanding IN renders different SQL per chunk length; preparing each would churn psycopg's cache.
+                stmt = _statements.get(
+                    "tasks_by_id",
+                    lambda: select(TaskModel)
+                    .where(TaskModel.id.in_(bindparam("task_ids", expanding=True)))
+                    .order_by(TaskModel.id),
+                    prepare=False,
+                )
+                tasks.extend(_to_entity(task) for task in session.scalars(stmt, {"task_ids": chunk}))
+        return tasks
+
+    def list_due_stamps(self) -> dict[int, tuple[datetime, int | None]]:
+        """``updated_at`` and series key of every task with a due date, keyed by id in id order.
+
+        The series key is None for tasks that do not recur.
+        """
+        with _session_scope() as session:
+            stmt = _statements.get(
+                "due_stamps",
+                lambda: select(
+                    TaskModel.id,
+                    TaskModel.updated_at,
+                    case(
+                        (TaskModel.recurrence_rule.is_not(None), func.coalesce(TaskModel.series_id, TaskModel.id)),
+                    ).label("series"),
+                )
+                .where(TaskModel.due_date.is_not(None))
+                .order_by(TaskModel.id),
+            )
+            return {row.id: (row.updated_at, row.series) for row in session.execute(stmt)}
+
+    def list_series_heads(self, series_ids: Sequence[int] | None = None) -> list[TaskEntity]:
+        """The latest instance of every recurring series, or of the series in ``series_ids``, in id order.
+
+        A series is keyed by its first task's id. Its latest instance is
+        the one due last; it is returned only if it still recurs.
+        """
+        series_key = func.coalesce(TaskModel.series_id, TaskModel.id)
+        ranked = select(
+            TaskModel.id,
+            func.row_number()
+            .over(
+                partition_by=series_key,
+                order_by=(TaskModel.due_date.is_(None), TaskModel.due_date.desc(), TaskModel.id.desc()),
+            )
+            .label("position"),
+        ).where(or_(TaskModel.series_id.is_not(None), TaskModel.recurrence_rule.is_not(None)))
+        heads: list[TaskEntity] = []
+        with _session_scope() as session:
+            # Each id is bound twice, so chunks are half the usual size.
+            size = ID_CHUNK_SIZE // 2
+            chunks = (
+                [None]
+                if series_ids is None
+                else [list(series_ids[start:start + size]) for start in range(0, len(series_ids), size)]
+            )
+            for chunk in chunks:
+                latest = ranked
+                if chunk is not None:
+                    latest = ranked.where(or_(TaskModel.series_id.in_(chunk), TaskModel.id.in_(chunk)))
+                latest = latest.subquery()
+                stmt = (
+                    select(TaskModel)
+                    .join(latest, TaskModel.id == latest.c.id)
+                    .where(
+                        latest.c.position == 1,
+                        TaskModel.recurrence_rule.is_not(None),
+                        TaskModel.due_date.is_not(None),
+                    )
+                    .order_by(TaskModel.id)
+                )
+                heads.extend(_to_entity(task) for task in session.scalars(stmt))
+        return heads
+
+    def count_open_due(self, start: date, end: date) -> dict[date, int]:
+        """Open tasks due on each day from ``start`` to ``end`` inclusive; days without any are left out."""
+        with _session_scope() as session:
+            stmt = (
+                select(TaskModel.due_date, func.count())
+                .where(
+                    TaskModel.due_date.between(start, end),
+                    TaskModel.status.notin_([STATUS_DONE, STATUS_ARCHIVED]),
+                )
+                .group_by(TaskModel.due_date)
+            )
+            return dict(session.execute(stmt).all())
+
+    def list_open_recurring_dues(self) -> dict[tuple[str, str], date]:
+        """Latest due date of the open recurring tasks with each title and rule, linked to a series or not."""
+        with _session_scope() as session:
+            stmt = (
+                select(TaskModel.title, TaskModel.recurrence_rule, func.max(TaskModel.due_date))
+                .where(
+                    TaskModel.recurrence_rule.is_not(None),
+                    TaskModel.due_date.is_not(None),
+                    TaskModel.status.notin_([STATUS_DONE, STATUS_ARCHIVED]),
+                )
+                .group_by(TaskModel.title, TaskModel.recurrence_rule)
+            )
+            return {(title, rule): due for title, rule, due in session.execute(stmt)}
+
     def create_task(self, data: dict) -> TaskEntity:
-        with SessionLocal() as session:
+        with _session_scope() as session:
             if data.get("sort_order") is None:
-                status = data.get("status", TaskStatus.INBOX.value)
-                data["sort_order"] = self._next_sort_order(session, status)
-            task = TaskModel(**data)
-            session.add(task)
-            session.commit()
-            session.refresh(task)
-            return _to_entity(task)
+                data["sort_order"] = _append_rank(session, data.get("status", TaskStatus.INBOX.value))
+            stmt = insert(TaskModel).values(**data).returning(TaskModel)
+            return _to_entity(session.scalars(stmt).one())
+
+    def bulk_create(
+        self,
+        rows: Iterable[dict],
+        batch_size: int = BULK_BATCH_SIZE,
+        progress: Callable[[int], None] | None = None,
+    ) -> int:
+        """Insert ``rows`` in batches inside one transaction and return how many were stored."""
+        with _session_scope() as session:
+            return _bulk_insert(session, rows, batch_size, progress)
 
     def list_subtasks(self, task_id: int) -> list[SubtaskEntity]:
-        with SessionLocal() as session:
+        with _session_scope() as session:
             stmt = (
                 select(SubtaskModel)
                 .where(SubtaskModel.task_id == task_id)
@@ -131,139 +831,152 @@ class TaskRepository:
             )
             return [_to_subtask_entity(subtask) for subtask in session.scalars(stmt)]
 
-    def get_subtask_titles(self, task_ids: list[int]) -> dict[int, list[str]]:
-        if not task_ids:
-            return {}
-        with SessionLocal() as session:
-            stmt = (
-                select(SubtaskModel.task_id, SubtaskModel.title)
-                .where(SubtaskModel.task_id.in_(task_ids))
-                .order_by(
-                    SubtaskModel.task_id.asc(),
-                    SubtaskModel.sort_order.asc(),
-                    SubtaskModel.created_at.asc(),
+    def get_subtask_summaries(
+        self,
+        task_ids: Sequence[int],
+        preview: int = SUBTASK_PREVIEW_TITLES,
+    ) -> dict[int, SubtaskSummary]:
+        """Progress of each task that has subtasks; at most ``preview`` titles are read per task."""
+        summaries: dict[int, SubtaskSummary] = {}
+        with _session_scope() as session:
+            for start in range(0, len(task_ids), ID_CHUNK_SIZE):
+                chunk = list(task_ids[start:start + ID_CHUNK_SIZE])
+                stmt = _statements.get(
+                    "subtask_summaries",
+                    lambda: _subtask_summary_statement(
+                        SubtaskModel.task_id.in_(bindparam("task_ids", expanding=True)), preview
+                    ),
+                    # Prepared, Postgres switches to a generic plan several times slower.
+                    prepare=False,
                 )
+                rows = session.execute(stmt, {"task_ids": chunk, "preview_rows": max(preview, 1)})
+                summaries.update(_group_summaries(rows, preview))
+        return summaries
+
+    def get_board(self, statuses: Sequence[str], preview: int = SUBTASK_PREVIEW_TITLES) -> TaskBoard:
+        """Every task in ``statuses`` split into columns, with one query for the subtask summaries."""
+        params = {"statuses": list(statuses), "preview_rows": max(preview, 1)}
+        with _session_scope() as session:
+            stmt = _statements.get("board_cards", _board_cards_statement)
+            columns: dict[str, list[TaskCardRow]] = {status: [] for status in statuses}
+            for row in session.execute(stmt, params):
+                columns[row.status].append(_to_card(row))
+            subtasks_stmt = _statements.get(
+                "board_subtasks", lambda: _board_subtasks_statement(preview), prepare=False
             )
-            titles: dict[int, list[str]] = {}
-            for row in session.execute(stmt):
-                title = (row.title or "").strip()
-                if not title:
-                    continue
-                titles.setdefault(int(row.task_id), []).append(title)
-            return titles
+            subtasks = _group_summaries(session.execute(subtasks_stmt, params), preview)
+            return TaskBoard(columns=columns, subtasks=subtasks)
 
     def create_subtask(self, task_id: int, title: str) -> SubtaskEntity:
-        with SessionLocal() as session:
-            sort_order = self._next_subtask_sort_order(session, task_id)
-            subtask = SubtaskModel(
-                task_id=task_id,
-                title=title,
-                is_done=False,
-                sort_order=sort_order,
+        with _session_scope() as session:
+            stmt = (
+                insert(SubtaskModel)
+                .values(
+                    task_id=task_id,
+                    title=title,
+                    is_done=False,
+                    sort_order=_next_subtask_sort_order(task_id),
+                )
+                .returning(SubtaskModel)
             )
-            session.add(subtask)
-            session.commit()
-            session.refresh(subtask)
-            return _to_subtask_entity(subtask)
+            return _to_subtask_entity(session.scalars(stmt).one())
 
     def update_subtask(self, subtask_id: int, data: dict) -> Optional[SubtaskEntity]:
-        with SessionLocal() as session:
-            subtask = session.get(SubtaskModel, subtask_id)
-            if not subtask:
-                return None
-
-            for key, value in data.items():
-                setattr(subtask, key, value)
-            session.commit()
-            session.refresh(subtask)
-            return _to_subtask_entity(subtask)
+        with _session_scope() as session:
+            stmt = _returning_update(SubtaskModel, SubtaskModel.id == subtask_id, data)
+            subtask = session.scalars(stmt).one_or_none()
+            return _to_subtask_entity(subtask) if subtask else None
 
     def delete_subtask(self, subtask_id: int) -> None:
-        with SessionLocal() as session:
-            subtask = session.get(SubtaskModel, subtask_id)
-            if not subtask:
-                return
-            session.delete(subtask)
-            session.commit()
+        with _session_scope() as session:
+            session.execute(delete(SubtaskModel).where(SubtaskModel.id == subtask_id))
 
     def update_task(self, task_id: int, data: dict) -> Optional[TaskEntity]:
-        with SessionLocal() as session:
-            task = session.get(TaskModel, task_id)
-            if not task:
-                return None
-
+        data = _restart_series(data)
+        with _session_scope() as session:
             if "status" in data and data.get("sort_order") is None:
-                new_status = data["status"]
-                data["sort_order"] = self._next_sort_order(session, new_status)
+                data["sort_order"] = _append_rank(session, data["status"])
+            task = session.scalars(_returning_update(TaskModel, TaskModel.id == task_id, data)).one_or_none()
+            return _to_entity(task) if task else None
 
-            for key, value in data.items():
-                setattr(task, key, value)
-            session.commit()
-            session.refresh(task)
-            return _to_entity(task)
+    def update_many(
+        self, task_ids: Sequence[int], data: dict, new_tasks: Iterable[dict] = ()
+    ) -> list[TaskEntity]:
+        """Apply ``data`` to every task in ``task_ids`` and insert ``new_tasks`` in one transaction.
+
+        One ``UPDATE ... RETURNING`` per id chunk; tasks that changed status
+        are ranked after the target column in the order given. Returns the
+        updated tasks in ``task_ids`` order.
+        """
+        updated: dict[int, TaskEntity] = {}
+        data = _restart_series(data)
+        with _session_scope() as session:
+            use_sequence = _uses_rank_sequence(session)
+            for start in range(0, len(task_ids), ID_CHUNK_SIZE):
+                chunk = list(task_ids[start:start + ID_CHUNK_SIZE])
+                chunk_data = dict(data)
+                if "status" in data and data.get("sort_order") is None:
+                    if use_sequence:
+                        # nextval() in the UPDATE would follow the scan order, so draw the ranks first.
+                        ranks = _reserve_ranks(session, len(chunk))
+                        chunk_data["sort_order"] = case(dict(zip(chunk, ranks)), value=TaskModel.id)
+                    else:
+                        # One max() for the whole statement, so spread the rows out by position.
+                        offset = case(
+                            {task_id: index for index, task_id in enumerate(chunk)},
+                            value=TaskModel.id,
+                        )
+                        chunk_data["sort_order"] = _append_rank(session, data["status"]) + offset * RANK_GAP
+                stmt = _returning_update(TaskModel, TaskModel.id.in_(chunk), chunk_data)
+                updated.update((task.id, _to_entity(task)) for task in session.scalars(stmt))
+            _bulk_insert(session, new_tasks)
+        return [updated[task_id] for task_id in task_ids if task_id in updated]
 
     def reorder_tasks(self, task_ids: list[int]) -> None:
+        """Store the order of ``task_ids``, rewriting only the rows that moved."""
         if not task_ids:
             return
-        with SessionLocal() as session:
-            tasks = (
-                session.query(TaskModel)
-                .filter(TaskModel.id.in_(task_ids))
-                .all()
-            )
-            order_map = {task_id: index for index, task_id in enumerate(task_ids, start=1)}
-            for task in tasks:
-                task.sort_order = order_map.get(task.id, task.sort_order)
-            session.commit()
+        with _session_scope() as session:
+            rows = session.execute(
+                select(TaskModel.id, TaskModel.status, TaskModel.sort_order).where(TaskModel.id.in_(task_ids))
+            ).all()
+            ranks = {row.id: row.sort_order for row in rows}
+            statuses = {row.status for row in rows}
+            ordered = [task_id for task_id in task_ids if task_id in ranks]
+
+            def outer_rank(rank: int, above: bool) -> int | None:
+                column = select(
+                    func.min(TaskModel.sort_order) if above else func.max(TaskModel.sort_order)
+                ).where(TaskModel.status.in_(statuses))
+                beyond = TaskModel.sort_order > rank if above else TaskModel.sort_order < rank
+                return session.scalar(column.where(beyond))
+
+            tail_ranks = None
+            if _uses_rank_sequence(session):
+                # Appends take their ranks from the sequence; a card moved to the end must too.
+                tail_ranks = partial(_reserve_ranks, session)
+            changes = _rerank(ordered, ranks, outer_rank, tail_ranks)
+            if changes is None:
+                changes = self._respace(session, statuses, ordered)
+            _write_ranks(session, changes)
 
     def delete_task(self, task_id: int) -> None:
-        with SessionLocal() as session:
-            task = session.get(TaskModel, task_id)
-            if not task:
-                return
-            session.query(SubtaskModel).filter(SubtaskModel.task_id == task_id).delete(
-                synchronize_session=False
-            )
-            session.delete(task)
-            session.commit()
+        self.delete_many([task_id])
+
+    def delete_many(self, task_ids: Sequence[int]) -> None:
+        with _session_scope() as session:
+            for start in range(0, len(task_ids), ID_CHUNK_SIZE):
+                chunk = list(task_ids[start:start + ID_CHUNK_SIZE])
+                session.execute(delete(SubtaskModel).where(SubtaskModel.task_id.in_(chunk)))
+                session.execute(delete(TaskModel).where(TaskModel.id.in_(chunk)))
 
     def get_stats(self) -> dict[str, int]:
-        with SessionLocal() as session:
-            total = session.scalar(select(func.count()).select_from(TaskModel)) or 0
-            in_progress = session.scalar(
-                select(func.count())
-                .select_from(TaskModel)
-                .where(TaskModel.status == TaskStatus.IN_PROGRESS.value)
-            ) or 0
-            done = session.scalar(
-                select(func.count()).select_from(TaskModel).where(TaskModel.status == STATUS_DONE)
-            ) or 0
-            today = date.today()
-            overdue = session.scalar(
-                select(func.count())
-                .select_from(TaskModel)
-                .where(
-                    TaskModel.due_date.is_not(None),
-                    TaskModel.due_date < today,
-                    TaskModel.status.notin_([STATUS_DONE, STATUS_ARCHIVED]),
-                )
-            ) or 0
-            due_today = session.scalar(
-                select(func.count())
-                .select_from(TaskModel)
-                .where(TaskModel.due_date == today)
-            ) or 0
-            return {
-                "total": total,
-                "in_progress": in_progress,
-                "done": done,
-                "overdue": overdue,
-                "due_today": due_today,
-            }
+        with _session_scope() as session:
+            return self._read_stats(session)
 
     def list_due_reminders(self) -> list[TaskEntity]:
         today = date.today()
-        with SessionLocal() as session:
+        with _session_scope() as session:
             stmt = (
                 select(TaskModel)
                 .where(
@@ -281,7 +994,7 @@ class TaskRepository:
         start_week = current_week_start - timedelta(weeks=weeks - 1)
         start_dt = datetime.combine(start_week, datetime.min.time())
 
-        with SessionLocal() as session:
+        with _session_scope() as session:
             created_rows = session.execute(
                 select(
                     func.date_trunc("week", TaskModel.created_at).label("week"),
@@ -320,15 +1033,33 @@ class TaskRepository:
         return weekly
 
     @staticmethod
-    def _next_sort_order(session, status: str) -> int:
-        max_order = session.scalar(
-            select(func.max(TaskModel.sort_order)).where(TaskModel.status == status)
-        )
-        return (max_order or 0) + 1
+    def _read_stats(session) -> dict[str, int]:
+        # Slower prepared in benchmarks/statement_cache.py; Postgres plans it per call.
+        stmt = _statements.get("stats", _stats_statement, prepare=False)
+        row = session.execute(stmt, {"today": date.today()}).one()
+        return {
+            "total": row.total or 0,
+            "in_progress": row.in_progress or 0,
+            "done": row.done or 0,
+            "overdue": row.overdue or 0,
+            "due_today": row.due_today or 0,
+        }
 
     @staticmethod
-    def _next_subtask_sort_order(session, task_id: int) -> int:
-        max_order = session.scalar(
-            select(func.max(SubtaskModel.sort_order)).where(SubtaskModel.task_id == task_id)
+    def _respace(session, statuses: set[str], task_ids: list[int]) -> dict[int, int]:
+        """Renumber whole columns with fresh gaps; ``task_ids`` keep their slots but take the given order.
+
+        Returns only the ranks that differ from the stored ones.
+        """
+        current = dict(
+            session.execute(
+                select(TaskModel.id, TaskModel.sort_order)
+                .where(TaskModel.status.in_(statuses))
+                .order_by(*_LIST_ORDER)
+            ).all()
         )
-        return (max_order or 0) + 1
+        moved = set(task_ids)
+        requested = iter(task_ids)
+        order = [next(requested) if task_id in moved else task_id for task_id in current]
+        ranks = {task_id: RANK_GAP * (index + 1) for index, task_id in enumerate(order)}
+        return {task_id: rank for task_id, rank in ranks.items() if rank != current[task_id]}
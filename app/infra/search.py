@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from sqlalchemy import String, bindparam, func, literal_column, or_, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from .models import TaskModel
+
+TS_CONFIG = "simple"
+TRIGRAM_INDEXES = ("ix_tasks_title_trgm", "ix_tasks_description_trgm", "ix_tasks_tags_trgm")
+
+# Maintained by Postgres as a generated column (migration 0006); deliberately
+# not mapped on TaskModel so list queries never fetch it.
+search_vector = literal_column("tasks.search_vector", TSVECTOR)
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+_capabilities_cache: dict[str, "SearchCapabilities"] = {}
+
+
+@dataclass(frozen=True)
+class SearchCapabilities:
+    full_text: bool = False
+    trigram: bool = False
+
+
+def detect_search_capabilities(session) -> SearchCapabilities:
+    bind = session.get_bind()
+    key = bind.engine.url.render_as_string(hide_password=True)
+    cached = _capabilities_cache.get(key)
+    if cached is not None:
+        return cached
+
+    capabilities = SearchCapabilities()
+    if bind.dialect.name == "postgresql":
+        full_text = session.scalar(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM information_schema.columns "
+                "WHERE table_name = 'tasks' AND column_name = 'search_vector')"
+            )
+        )
+        trigram_indexes = session.scalar(
+            text("SELECT count(*) FROM pg_indexes WHERE tablename = 'tasks' AND indexname = ANY(:names)"),
+            {"names": list(TRIGRAM_INDEXES)},
+        )
+        capabilities = SearchCapabilities(
+            full_text=bool(full_text),
+            trigram=trigram_indexes == len(TRIGRAM_INDEXES),
+        )
+    _capabilities_cache[key] = capabilities
+    return capabilities
+
+
+def prefix_tsquery(term: str) -> str | None:
+    """``"buil rep"`` -> ``"buil:* & rep:*"`` so results follow the user while typing."""
+    words = _WORD_RE.findall(term.lower())
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
+
+
+def search_shape(term: str, capabilities: SearchCapabilities) -> tuple:
+    """Everything about a search that changes the SQL text; the term itself only changes parameters."""
+    return capabilities, prefix_tsquery(term) is not None
+
+
+def search_params(term: str) -> dict:
+    """Values for the bind parameters used by ``search_predicate`` and ``search_rank``."""
+    return {"search_pattern": f"%{term}%", "search_query": prefix_tsquery(term) or ""}
+
+
+def search_predicate(term: str, capabilities: SearchCapabilities):
+    params = search_params(term)
+    # Trigram GIN indexes serve ILIKE '%term%' directly, keeping substring semantics.
+    if capabilities.trigram or not capabilities.full_text or not params["search_query"]:
+        pattern = bindparam("search_pattern", params["search_pattern"], type_=String)
+        return or_(
+            TaskModel.title.ilike(pattern),
+            TaskModel.description.ilike(pattern),
+            TaskModel.tags.ilike(pattern),
+        )
+    return search_vector.op("@@")(_tsquery(params["search_query"]))
+
+
+def search_rank(term: str, capabilities: SearchCapabilities):
+    query = prefix_tsquery(term)
+    if not capabilities.full_text or query is None:
+        return None
+    return func.ts_rank_cd(search_vector, _tsquery(query))
+
+
+def _tsquery(query: str):
+    return func.to_tsquery(TS_CONFIG, bindparam("search_query", query, type_=String))
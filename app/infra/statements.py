@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import threading
+from typing import Callable, Hashable, TypeVar
+
+from sqlalchemy.sql import Executable
+
+StatementT = TypeVar("StatementT", bound=Executable)
+
+
+class StatementRegistry:
+    """Builds each hot query shape once and hands back the same construct afterwards.
+
+    Every per-call value in a registered statement is a named bind
+    parameter, so callers pass the values to ``execute`` and the statement
+    object, its memoized cache key and the SQL text stay the same from
+    call to call. Each statement also carries a ``prepare`` hint for
+    psycopg (see ``app.infra.db``): True plans it once per connection on
+    first use, False keeps it out of server-side preparation for queries
+    whose generic plan is worse than planning with the actual values.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._statements: dict[Hashable, Executable] = {}
+
+    def get(self, key: Hashable, build: Callable[[], StatementT], prepare: bool = True) -> StatementT:
+        statement = self._statements.get(key)
+        if statement is None:
+            with self._lock:
+                statement = self._statements.get(key)
+                if statement is None:
+                    statement = build().execution_options(prepare=prepare)
+                    self._statements[key] = statement
+        return statement  # type: ignore[return-value]
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._statements.clear()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import sys
 from pathlib import Path
 
@@ -8,10 +9,12 @@ from PySide6.QtGui import QColor, QFont, QIcon, QPalette
 from PySide6.QtWidgets import QApplication, QMessageBox, QStyleFactory
 
 from app.config import PROJECT_ROOT
-from app.infra.db import init_db
+from app.infra.db import init_db, pool_stats
 from app.infra.logging import setup_logging
 from app.ui.main_window import MainWindow
 
+logger = logging.getLogger(__name__)
+
 
 def _apply_dark_palette(app: QApplication) -> None:
     palette = QPalette()
@@ -88,7 +91,9 @@ def main() -> None:
     if app.windowIcon():
         window.setWindowIcon(app.windowIcon())
     window.show()
-    sys.exit(app.exec())
+    code = app.exec()
+    logger.info("Connection pool: %s", pool_stats())
+    sys.exit(code)
 
 
 if __name__ == "__main__":
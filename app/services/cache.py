@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Iterable
+
+from app.domain.entities import SubtaskEntity, SubtaskSummary, TaskEntity
+from app.domain.enums import TaskStatus
+from app.domain.filters import TaskFilters
+
+MAX_CACHED_LISTS = 32
+
+_CLOSED_STATUSES = (TaskStatus.DONE, TaskStatus.ARCHIVED)
+_STATUS_FILTERS = {status.value for status in TaskStatus}
+NO_SUBTASKS = SubtaskSummary(total=0, done=0)
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    tasks: int
+    lists: int
+    subtasks: int
+
+
+def may_contain(filters: TaskFilters, task: TaskEntity, today: date) -> bool:
+    """Whether ``task`` can appear in a listing for ``filters``.
+
+    Mirrors ``_apply_filters`` in the repository. Search is treated as
+    matching everything, because full-text matching only happens in the
+    database.
+    """
+    if filters.search:
+        return True
+    if filters.due_on and task.due_date != filters.due_on:
+        return False
+    key = filters.filter_key
+    if key in _STATUS_FILTERS:
+        return task.status.value == key
+    if key == "overdue":
+        return task.due_date is not None and task.due_date < today and task.status not in _CLOSED_STATUSES
+    if key == "upcoming":
+        return (
+            task.due_date is not None
+            and today <= task.due_date <= today + timedelta(days=7)
+            and task.status not in _CLOSED_STATUSES
+        )
+    return True
+
+
+class TaskCache:
+    """Write-through cache of task entities, filtered listings and subtasks.
+
+    Only ``TaskService`` writes to the database, so it keeps the cache
+    current itself. A changed task only drops the listings it belonged to
+    before or after the change. The worker thread and the GUI thread can
+    both reach the service, so every access holds a lock.
+    """
+
+    def __init__(self, max_lists: int = MAX_CACHED_LISTS) -> None:
+        self._lock = threading.RLock()
+        self._max_lists = max_lists
+        self._tasks: dict[int, TaskEntity] = {}
+        self._lists: OrderedDict[tuple[TaskFilters, date], list[TaskEntity]] = OrderedDict()
+        self._subtasks: dict[int, list[SubtaskEntity]] = {}
+        self._subtask_summaries: dict[int, SubtaskSummary] = {}
+        self._subtask_owner: dict[int, int] = {}
+        self._version = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def version(self) -> int:
+        """Bumped by every invalidation; fills carrying an older version are discarded."""
+        return self._version
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                tasks=len(self._tasks),
+                lists=len(self._lists),
+                subtasks=len(self._subtask_summaries),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._tasks.clear()
+            self._lists.clear()
+            self._subtasks.clear()
+            self._subtask_summaries.clear()
+            self._subtask_owner.clear()
+
+    # Reads -----------------------------------------------------------------
+
+    def get_task(self, task_id: int) -> TaskEntity | None:
+        with self._lock:
+            return self._count(self._tasks.get(task_id))
+
+    def get_tasks(self, task_ids: list[int]) -> tuple[list[TaskEntity], list[int]]:
+        """Cached entities among ``task_ids`` and the ids that still have to be loaded."""
+        found: list[TaskEntity] = []
+        missing: list[int] = []
+        with self._lock:
+            for task_id in task_ids:
+                task = self._tasks.get(task_id)
+                if task is None:
+                    missing.append(task_id)
+                else:
+                    found.append(task)
+            self.hits += len(found)
+            self.misses += len(missing)
+        return found, missing
+
+    def get_list(self, filters: TaskFilters) -> list[TaskEntity] | None:
+        key = (filters, date.today())
+        with self._lock:
+            tasks = self._count(self._lists.get(key))
+            if tasks is None:
+                return None
+            self._lists.move_to_end(key)
+            return list(tasks)
+
+    def get_subtasks(self, task_id: int) -> list[SubtaskEntity] | None:
+        with self._lock:
+            subtasks = self._count(self._subtasks.get(task_id))
+            return list(subtasks) if subtasks is not None else None
+
+    def get_subtask_summaries(self, task_ids: list[int]) -> tuple[dict[int, SubtaskSummary], list[int]]:
+        """Cached summaries of tasks with subtasks and the ids that still have to be loaded."""
+        summaries: dict[int, SubtaskSummary] = {}
+        missing: list[int] = []
+        with self._lock:
+            for task_id in task_ids:
+                cached = self._subtask_summaries.get(task_id)
+                if cached is None:
+                    missing.append(task_id)
+                elif cached.total:
+                    summaries[task_id] = cached
+            self.hits += len(task_ids) - len(missing)
+            self.misses += len(missing)
+        return summaries, missing
+
+    # Fills -----------------------------------------------------------------
+
+    def put_tasks(self, tasks: Iterable[TaskEntity], version: int) -> None:
+        with self._lock:
+            if version != self._version:
+                return
+            for task in tasks:
+                if task.id is not None:
+                    self._tasks[task.id] = task
+
+    def put_list(self, filters: TaskFilters, tasks: list[TaskEntity], version: int) -> None:
+        with self._lock:
+            if version != self._version:
+                return
+            self._lists[(filters, date.today())] = list(tasks)
+            while len(self._lists) > self._max_lists:
+                self._lists.popitem(last=False)
+            self.put_tasks(tasks, version)
+
+    def put_subtasks(self, task_id: int, subtasks: list[SubtaskEntity], version: int) -> None:
+        with self._lock:
+            if version != self._version:
+                return
+            self._subtasks[task_id] = list(subtasks)
+            for subtask in subtasks:
+                if subtask.id is not None:
+                    self._subtask_owner[subtask.id] = task_id
+
+    def put_subtask_summaries(
+        self,
+        task_ids: list[int],
+        summaries: dict[int, SubtaskSummary],
+        version: int,
+    ) -> None:
+        with self._lock:
+            if version != self._version:
+                return
+            for task_id in task_ids:
+                self._subtask_summaries[task_id] = summaries.get(task_id, NO_SUBTASKS)
+
+    # Invalidation ----------------------------------------------------------
+
+    def task_created(self, task: TaskEntity) -> None:
+        with self._lock:
+            self._version += 1
+            self._drop_lists_with(task, None, known=True)
+            self._tasks[task.id] = task
+            self._subtasks[task.id] = []
+            self._subtask_summaries[task.id] = NO_SUBTASKS
+
+    def tasks_added(self) -> None:
+        """Rows were inserted in bulk: any listing may have grown."""
+        with self._lock:
+            self._version += 1
+            self._lists.clear()
+
+    def task_updated(self, task_id: int, task: TaskEntity | None) -> None:
+        self.tasks_updated([task_id], [task] if task is not None else [])
+
+    def tasks_updated(self, task_ids: Iterable[int], tasks: Iterable[TaskEntity]) -> None:
+        """``tasks`` are the stored versions of ``task_ids``; ids without one no longer exist."""
+        with self._lock:
+            self._version += 1
+            after = {task.id: task for task in tasks}
+            for task_id in task_ids:
+                before = self._tasks.pop(task_id, None)
+                task = after.get(task_id)
+                self._drop_lists_with(task, before, known=before is not None)
+                if task is not None:
+                    self._tasks[task_id] = task
+
+    def task_deleted(self, task_id: int) -> None:
+        self.tasks_deleted([task_id])
+
+    def tasks_deleted(self, task_ids: Iterable[int]) -> None:
+        with self._lock:
+            self._version += 1
+            for task_id in task_ids:
+                before = self._tasks.pop(task_id, None)
+                self._drop_lists_with(None, before, known=before is not None)
+                self._forget_subtasks_of(task_id)
+
+    def tasks_reordered(self, task_ids: list[int]) -> None:
+        with self._lock:
+            self._version += 1
+            before = [self._tasks.pop(task_id, None) for task_id in task_ids]
+            if any(task is None for task in before):
+                self._lists.clear()
+                return
+            for task in before:
+                self._drop_lists_with(None, task, known=True)
+
+    def subtasks_changed(self, task_id: int | None = None, subtask_id: int | None = None) -> None:
+        with self._lock:
+            self._version += 1
+            if task_id is None and subtask_id is not None:
+                task_id = self._subtask_owner.get(subtask_id)
+            if task_id is None:
+                self._subtasks.clear()
+                self._subtask_summaries.clear()
+                self._subtask_owner.clear()
+                return
+            self._forget_subtasks_of(task_id)
+
+    def _forget_subtasks_of(self, task_id: int) -> None:
+        for subtask in self._subtasks.pop(task_id, None) or []:
+            self._subtask_owner.pop(subtask.id, None)
+        self._subtask_summaries.pop(task_id, None)
+
+    def _drop_lists_with(
+        self,
+        after: TaskEntity | None,
+        before: TaskEntity | None,
+        known: bool,
+    ) -> None:
+        if not known:
+            self._lists.clear()
+            return
+        for key in list(self._lists):
+            filters, today = key
+            if (after is not None and may_contain(filters, after, today)) or (
+                before is not None and may_contain(filters, before, today)
+            ):
+                del self._lists[key]
+
+    def _count(self, value):
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
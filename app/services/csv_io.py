@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import sys
+from datetime import date
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, TextIO
+
+from app.domain.enums import PriorityLevel, RecurrenceRule, TaskStatus
+from app.domain.filters import TaskFilters
+
+if TYPE_CHECKING:
+    from .task_service import TaskService
+
+CSV_HEADERS = [
+    "title",
+    "description",
+    "status",
+    "priority",
+    "due_date",
+    "tags",
+    "recurrence_rule",
+    "recurrence_interval",
+    "recurrence_end_date",
+]
+
+# Matches the String(...) lengths on TaskModel; one oversized value would
+# otherwise abort a whole bulk import transaction.
+TITLE_MAX_LENGTH = 200
+
+_STATUSES = {status.value for status in TaskStatus}
+_RECURRENCE_RULES = {rule.value for rule in RecurrenceRule}
+_PRIORITIES = {level.value for level in PriorityLevel}
+
+
+def parse_task_rows(rows: Iterable[dict[str, str | None]]) -> Iterator[dict]:
+    """Validate CSV rows one at a time; rows without a title are skipped."""
+    for row in rows:
+        title = (row.get("title") or "").strip()[:TITLE_MAX_LENGTH]
+        if not title:
+            continue
+        status = (row.get("status") or TaskStatus.INBOX.value).strip()
+        if status not in _STATUSES:
+            status = TaskStatus.INBOX.value
+        recurrence_rule = (row.get("recurrence_rule") or "").strip() or None
+        if recurrence_rule not in _RECURRENCE_RULES:
+            recurrence_rule = None
+        priority = _parse_int(row.get("priority"), PriorityLevel.MEDIUM.value)
+        if priority not in _PRIORITIES:
+            priority = PriorityLevel.MEDIUM.value
+        yield {
+            "title": title,
+            "description": (row.get("description") or "").strip(),
+            "status": status,
+            "priority": priority,
+            "due_date": parse_date(row.get("due_date")),
+            "tags": (row.get("tags") or "").strip(),
+            "recurrence_rule": recurrence_rule,
+            "recurrence_interval": max(_parse_int(row.get("recurrence_interval"), 1), 1),
+            "recurrence_end_date": parse_date(row.get("recurrence_end_date")),
+        }
+
+
+def read_task_rows(path: Path) -> Iterator[dict]:
+    """Stream validated task rows from a CSV file without loading it whole."""
+    with open(path, "r", newline="", encoding="utf-8") as handle:
+        yield from parse_task_rows(csv.DictReader(handle))
+
+
+def write_task_rows(
+    handle: TextIO,
+    rows: Iterable[tuple],
+    progress: Callable[[int], None] | None = None,
+    progress_every: int = 1000,
+) -> int:
+    """Write value tuples in ``CSV_HEADERS`` order as they arrive; returns the row count."""
+    writer = csv.writer(handle)
+    writer.writerow(CSV_HEADERS)
+    written = 0
+    for row in rows:
+        writer.writerow(["" if value is None else _format_value(value) for value in row])
+        written += 1
+        if progress and written % progress_every == 0:
+            progress(written)
+    if progress:
+        progress(written)
+    return written
+
+
+def export_tasks_csv(
+    service: TaskService,
+    path: Path,
+    filters: TaskFilters | None = None,
+    progress: Callable[[int], None] | None = None,
+) -> int:
+    """Stream tasks into ``path`` with flat memory use, whatever the row count."""
+    rows = service.iter_task_values(CSV_HEADERS, filters or TaskFilters(filter_key="all"))
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        return write_task_rows(handle, rows, progress)
+
+
+def parse_date(value: str | None) -> date | None:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value.strip())
+    except ValueError:
+        return None
+
+
+def _format_value(value: object) -> object:
+    return value.isoformat() if isinstance(value, date) else value
+
+
+def _parse_int(value: str | None, default: int) -> int:
+    try:
+        return int(value or default)
+    except ValueError:
+        return default
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Export or import tasks as CSV without the UI.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    export_parser = commands.add_parser("export", help="write tasks to a CSV file")
+    export_parser.add_argument("path", type=Path)
+    export_parser.add_argument("--filter", default="all", help="filter key, e.g. inbox or overdue")
+    import_parser = commands.add_parser("import", help="add tasks from a CSV file")
+    import_parser.add_argument("path", type=Path)
+    args = parser.parse_args(argv)
+
+    from app.infra.repository import TaskRepository
+
+    from .task_service import TaskService
+
+    service = TaskService(TaskRepository())
+
+    def report(count: int) -> None:
+        print(f"\r{count} tasks", end="", file=sys.stderr, flush=True)
+
+    if args.command == "export":
+        count = export_tasks_csv(service, args.path, TaskFilters(filter_key=args.filter), report)
+        print(f"\nExported {count} tasks to {args.path}", file=sys.stderr)
+    else:
+        count = service.bulk_import(read_task_rows(args.path), progress=report)
+        print(f"\nImported {count} tasks from {args.path}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import threading
+from dataclasses import dataclass, replace
+from datetime import date, datetime
+from pathlib import Path
+
+from app.domain.entities import TaskEntity
+from app.domain.enums import RecurrenceRule, TaskStatus
+from app.domain.recurrence import Recurrence, occurrences
+
+from .task_service import TaskService
+
+# RFC 5545: lines end in CRLF and are folded once they pass 75 octets.
+CRLF = "\r\n"
+FOLD_OCTETS = 75
+
+CALENDAR_HEADER = CRLF.join(
+    [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//Task Forge//UA",
+        "CALSCALE:GREGORIAN",
+    ]
+)
+CALENDAR_FOOTER = "END:VCALENDAR" + CRLF
+
+_FREQ = {
+    RecurrenceRule.DAILY.value: "DAILY",
+    RecurrenceRule.WEEKLY.value: "WEEKLY",
+    RecurrenceRule.MONTHLY.value: "MONTHLY",
+}
+_OPEN = (TaskStatus.INBOX, TaskStatus.IN_PROGRESS)
+
+
+@dataclass(frozen=True)
+class IcsExportResult:
+    events: int
+    rendered: int
+    written: bool
+
+
+@dataclass(frozen=True)
+class IcsDocument:
+    path: Path
+    content: str | None
+    digest: bytes
+    events: int
+    rendered: int
+
+
+def render_event(task: TaskEntity) -> str:
+    """One VEVENT; DTSTAMP is the task's own ``updated_at`` so the text is stable between exports."""
+    return _render(
+        [
+            "BEGIN:VEVENT",
+            f"UID:task-{task.id}@taskforge",
+            f"DTSTAMP:{_stamp(task.updated_at)}",
+            f"DTSTART;VALUE=DATE:{_day(task.due_date)}",
+            f"SUMMARY:{escape_text(task.title)}",
+            f"DESCRIPTION:{escape_text(task.description)}",
+            "END:VEVENT",
+        ]
+    )
+
+
+def render_series(tasks: list[TaskEntity]) -> list[str]:
+    """VEVENTs with an RRULE for all stored instances of a recurring series.
+
+    The instances are split into runs that sit on one rule: each run
+    starts where the rule, the interval or the date the series counts
+    from changed (or at an instance moved off its dates) and becomes one
+    event from that date. Rule dates up to a run's last instance that
+    have no open task (completed, archived or deleted instances) become
+    EXDATEs. Every run but the last ends at its last instance, and so
+    does the last one once that instance is closed. The first run keeps
+    the series' UID, so an edit does not replace the event in calendars.
+    """
+    events = []
+    runs = _runs(sorted(tasks, key=lambda task: (task.due_date, task.id)))
+    for index, (series, run) in enumerate(runs):
+        latest = run[-1]
+        if index < len(runs) - 1 or latest.status not in _OPEN:
+            series = replace(series, until=latest.due_date)
+        scheduled = {series.start, *occurrences(series, latest.due_date)}
+        open_days = {task.due_date for task in run if task.status in _OPEN}
+        uid = f"series-{run[0].series_key}" + (f"-{_day(series.start)}" if index else "")
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:{uid}@taskforge",
+            f"DTSTAMP:{_stamp(max(task.updated_at for task in run))}",
+            f"DTSTART;VALUE=DATE:{_day(series.start)}",
+            f"RRULE:{rrule(series)}",
+        ]
+        if excluded := sorted(scheduled - open_days):
+            lines.append("EXDATE;VALUE=DATE:" + ",".join(map(_day, excluded)))
+        lines += [
+            f"SUMMARY:{escape_text(latest.title)}",
+            f"DESCRIPTION:{escape_text(latest.description)}",
+            "END:VEVENT",
+        ]
+        events.append(_render(lines))
+    return events
+
+
+def rrule(series: Recurrence) -> str:
+    """RRULE value for the dates ``occurrences`` gives for ``series``, with ``series.start`` as DTSTART."""
+    parts = [f"FREQ={_FREQ.get(series.rule, 'DAILY')}", f"INTERVAL={series.interval}"]
+    day = series.start.day
+    if series.rule == RecurrenceRule.MONTHLY.value and day > 28:
+        # Months without the start day fall back to their last day, as in the app.
+        parts.append("BYMONTHDAY=" + ",".join(str(value) for value in range(28, day + 1)))
+        parts.append("BYSETPOS=-1")
+    if series.until:
+        parts.append(f"UNTIL={_day(series.until)}")
+    return ";".join(parts)
+
+
+def fold_line(line: str) -> str:
+    """Split ``line`` into chunks of at most 75 octets joined by CRLF and a space, never inside a character."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= FOLD_OCTETS:
+        return line
+    chunks = []
+    start, limit = 0, FOLD_OCTETS
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+            end -= 1
+        chunks.append(encoded[start:end].decode("utf-8"))
+        # Continuation lines start with the space, which counts towards their 75 octets.
+        start, limit = end, FOLD_OCTETS - 1
+    return (CRLF + " ").join(chunks)
+
+
+def _runs(tasks: list[TaskEntity]) -> list[tuple[Recurrence, list[TaskEntity]]]:
+    """Consecutive instances, in due date order, whose dates one rule generates, with that rule."""
+    last = tasks[-1].due_date
+    runs: list[tuple[Recurrence, list[TaskEntity]]] = []
+    grid: set[date] = set()
+    for task in tasks:
+        if runs:
+            series, run = runs[-1]
+            joined = Recurrence.of(task, series.start)
+            if (joined.rule, joined.interval) == (series.rule, series.interval) and task.due_date in grid:
+                run.append(task)
+                runs[-1] = (joined, run)
+                continue
+        series = Recurrence.of(task, task.recurrence_start)
+        grid = _grid(series, last)
+        if task.due_date not in grid:
+            series = Recurrence.of(task)
+            grid = _grid(series, last)
+        runs.append((series, [task]))
+    return runs
+
+
+def _grid(series: Recurrence, through: date) -> set[date]:
+    return {series.start, *occurrences(replace(series, until=None), through)}
+
+
+def _render(lines: list[str]) -> str:
+    return CRLF.join(fold_line(line) for line in lines)
+
+
+def _stamp(value: datetime) -> str:
+    return value.strftime("%Y%m%dT%H%M%SZ")
+
+
+def _day(value: date) -> str:
+    return value.strftime("%Y%m%d")
+
+
+def escape_text(value: str) -> str:
+    return value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def write_atomic(path: Path, content: str) -> None:
+    """Replace ``path`` in one step so calendar clients never read a half-written file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle = tempfile.NamedTemporaryFile(
+        "w",
+        encoding="utf-8",
+        newline="",
+        dir=path.parent,
+        prefix=f".{path.name}.",
+        suffix=".tmp",
+        delete=False,
+    )
+    try:
+        with handle:
+            handle.write(content)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(handle.name, path)
+    except BaseException:
+        Path(handle.name).unlink(missing_ok=True)
+        raise
+
+
+def write_document(document: IcsDocument) -> IcsDocument:
+    write_atomic(document.path, document.content or "")
+    return document
+
+
+class IcsExporter:
+    """Builds the calendar from cached VEVENT fragments.
+
+    A one-off task is one event; the instances of a recurring series
+    share one event with an RRULE for each rule they followed. Each
+    fragment is keyed by the ids and ``updated_at`` of the tasks in it.
+    An export asks the database only for the ids, stamps and series of
+    tasks with a due date, then loads and renders just the events whose
+    stamps changed. The file is rewritten only when its content differs
+    from what was last written to that path. ``build`` does the database
+    part and ``mark_written`` records a finished write, so the file I/O
+    can happen on another thread.
+    """
+
+    def __init__(self, service: TaskService) -> None:
+        self._service = service
+        self._lock = threading.Lock()
+        self._fragments: dict[str, tuple[tuple, tuple[str, ...]]] = {}
+        self._written: dict[Path, bytes] = {}
+
+    def export(self, path: Path, force: bool = False) -> IcsExportResult:
+        """Build and write in one go, for callers without a separate I/O thread."""
+        document = self.build(path, force)
+        if document.content is None:
+            return IcsExportResult(events=document.events, rendered=document.rendered, written=False)
+        self.mark_written(write_document(document))
+        return IcsExportResult(events=document.events, rendered=document.rendered, written=True)
+
+    def build(self, path: Path, force: bool = False) -> IcsDocument:
+        """Refresh stale fragments; ``content`` is None when ``path`` was last written with this calendar.
+
+        No file system access happens here, so it can run next to database work.
+        """
+        with self._lock:
+            members: dict[str, list[tuple[int, datetime]]] = {}
+            for task_id, (updated_at, series) in self._service.list_due_stamps().items():
+                key = f"task-{task_id}" if series is None else f"series-{series}"
+                members.setdefault(key, []).append((task_id, updated_at))
+
+            stale = [
+                key
+                for key, stamps in members.items()
+                if self._fragments.get(key, (None,))[0] != tuple(stamps)
+            ]
+            stale_ids = [task_id for key in stale for task_id, _ in members[key]]
+            loaded: dict[str, list[TaskEntity]] = {}
+            for task in self._service.get_tasks(sorted(stale_ids)):
+                if task.due_date is not None:
+                    key = f"series-{task.series_key}" if task.recurrence_rule else f"task-{task.id}"
+                    loaded.setdefault(key, []).append(task)
+            for key, tasks in loaded.items():
+                if key in members:
+                    fragment = render_series(tasks) if key.startswith("series-") else [render_event(tasks[0])]
+                    self._fragments[key] = (tuple(members[key]), tuple(fragment))
+            for key in self._fragments.keys() - members.keys():
+                del self._fragments[key]
+
+            events = [event for key in members if key in self._fragments for event in self._fragments[key][1]]
+            content = CRLF.join([CALENDAR_HEADER, *events, CALENDAR_FOOTER])
+            digest = hashlib.sha256(content.encode("utf-8")).digest()
+            unchanged = self._written.get(path) == digest
+            return IcsDocument(
+                path=path,
+                content=None if unchanged and not force else content,
+                digest=digest,
+                events=len(events),
+                rendered=len(stale),
+            )
+
+    def mark_written(self, document: IcsDocument) -> None:
+        with self._lock:
+            self._written[document.path] = document.digest
@@ -1,67 +1,283 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta
+from typing import Callable, Iterable, Iterator, Sequence
 
-from app.domain.entities import SubtaskEntity, TaskEntity
-from app.domain.enums import RecurrenceRule, TaskStatus
-from app.domain.filters import TaskFilters
-from app.infra.repository import TaskRepository
+from app.domain.entities import (
+    CalendarMarks,
+    SubtaskEntity,
+    SubtaskSummary,
+    TaskBoard,
+    TaskCardPage,
+    TaskEntity,
+    TaskPage,
+)
+from app.domain.enums import TaskStatus
+from app.domain.recurrence import Recurrence, expand, next_occurrence
+from app.domain.filters import TaskCursor, TaskFilters
+from app.infra.repository import BULK_BATCH_SIZE, DEFAULT_PAGE_SIZE, STREAM_BATCH_SIZE, TaskRepository
+
+from .cache import CacheStats, TaskCache
 
 
 class TaskService:
-    def __init__(self, repo: TaskRepository) -> None:
+    def __init__(self, repo: TaskRepository, cache: TaskCache | None = None) -> None:
         self._repo = repo
+        self._cache = cache or TaskCache()
+
+    def cache_stats(self) -> CacheStats:
+        return self._cache.stats()
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator[None]:
+        """Run the service calls inside the block in one transaction with a single commit.
+
+        The cache is updated as the calls go; if the block raises, the
+        transaction is rolled back and the cache is cleared with it.
+        """
+        try:
+            with self._repo.unit_of_work():
+                yield
+        except BaseException:
+            self._cache.clear()
+            raise
 
     def list_tasks(self, filters: TaskFilters) -> list[TaskEntity]:
-        return self._repo.list_tasks(filters)
+        cached = self._cache.get_list(filters)
+        if cached is not None:
+            return cached
+        version = self._cache.version
+        tasks = self._repo.list_tasks(filters)
+        self._cache.put_list(filters, tasks, version)
+        return tasks
+
+    def list_tasks_page(
+        self,
+        filters: TaskFilters,
+        after: TaskCursor | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        include_stats: bool = False,
+    ) -> TaskPage:
+        version = self._cache.version
+        page = self._repo.list_tasks_page(filters, after, limit, include_stats)
+        self._cache.put_tasks(page.tasks, version)
+        return page
+
+    def list_cards_page(
+        self,
+        filters: TaskFilters,
+        after: TaskCursor | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        include_stats: bool = False,
+    ) -> TaskCardPage:
+        """Card rows for list views; open a task with ``get_task`` to get every field."""
+        return self._repo.list_cards_page(filters, after, limit, include_stats)
+
+    def iter_task_pages(
+        self,
+        filters: TaskFilters,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[list[TaskEntity]]:
+        return self._repo.iter_task_pages(filters, page_size)
+
+    def iter_task_values(
+        self,
+        columns: Sequence[str],
+        filters: TaskFilters,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[tuple]:
+        """Streams straight from the database; large exports never go through the cache."""
+        return self._repo.iter_task_values(columns, filters, batch_size)
 
     def get_task(self, task_id: int) -> TaskEntity | None:
-        return self._repo.get_task(task_id)
+        cached = self._cache.get_task(task_id)
+        if cached is not None:
+            return cached
+        version = self._cache.version
+        task = self._repo.get_task(task_id)
+        if task is not None:
+            self._cache.put_tasks([task], version)
+        return task
+
+    def get_tasks(self, task_ids: list[int]) -> list[TaskEntity]:
+        """Tasks for ``task_ids`` in id order; only the ids missing from the cache are loaded."""
+        cached, missing = self._cache.get_tasks(task_ids)
+        if missing:
+            version = self._cache.version
+            loaded = self._repo.get_tasks(missing)
+            self._cache.put_tasks(loaded, version)
+            cached.extend(loaded)
+        return sorted(cached, key=lambda task: task.id)
+
+    def get_board(self, statuses: Sequence[str] | None = None) -> TaskBoard:
+        """All Kanban columns as card rows at once; the subtask summaries also warm the cache."""
+        statuses = list(statuses or [status.value for status in TaskStatus])
+        version = self._cache.version
+        board = self._repo.get_board(statuses)
+        task_ids = [card.id for cards in board.columns.values() for card in cards]
+        self._cache.put_subtask_summaries(task_ids, board.subtasks, version)
+        return board
+
+    def list_due_stamps(self) -> dict[int, tuple[datetime, int | None]]:
+        return self._repo.list_due_stamps()
 
     def create_task(self, data: dict) -> TaskEntity:
-        return self._repo.create_task(self._normalize_data(data))
+        task = self._repo.create_task(self._normalize_data(data))
+        self._cache.task_created(task)
+        return task
+
+    def bulk_import(
+        self,
+        rows: Iterable[dict],
+        batch_size: int = BULK_BATCH_SIZE,
+        progress: Callable[[int], None] | None = None,
+    ) -> int:
+        """Store already validated rows in one transaction; ``progress`` gets the running count."""
+        normalized = (self._normalize_data(row) for row in rows)
+        created = self._repo.bulk_create(normalized, batch_size, progress)
+        self._cache.tasks_added()
+        return created
 
     def update_task(self, task_id: int, data: dict) -> TaskEntity | None:
-        normalized = self._normalize_data(data)
-        status = normalized.get("status")
-        if status == TaskStatus.DONE.value and "completed_at" not in normalized:
-            normalized["completed_at"] = datetime.utcnow()
-        if status and status != TaskStatus.DONE.value:
-            normalized["completed_at"] = None
-        if status == TaskStatus.ARCHIVED.value and "archived_at" not in normalized:
-            normalized["archived_at"] = datetime.utcnow()
-        if status and status != TaskStatus.ARCHIVED.value:
-            normalized["archived_at"] = None
-        return self._repo.update_task(task_id, normalized)
+        task = self._repo.update_task(task_id, self._normalize_update(data))
+        self._cache.task_updated(task_id, task)
+        return task
+
+    def update_many(self, task_ids: list[int], data: dict) -> list[TaskEntity]:
+        """Apply the same change to every task in ``task_ids`` in one transaction."""
+        tasks = self._repo.update_many(task_ids, self._normalize_update(data))
+        self._cache.tasks_updated(task_ids, tasks)
+        return tasks
 
     def list_subtasks(self, task_id: int) -> list[SubtaskEntity]:
-        return self._repo.list_subtasks(task_id)
+        cached = self._cache.get_subtasks(task_id)
+        if cached is not None:
+            return cached
+        version = self._cache.version
+        subtasks = self._repo.list_subtasks(task_id)
+        self._cache.put_subtasks(task_id, subtasks, version)
+        return subtasks
 
-    def get_subtask_titles(self, task_ids: list[int]) -> dict[int, list[str]]:
-        return self._repo.get_subtask_titles(task_ids)
+    def get_subtask_summaries(self, task_ids: list[int]) -> dict[int, SubtaskSummary]:
+        """Subtask progress for the tasks among ``task_ids`` that have subtasks."""
+        summaries, missing = self._cache.get_subtask_summaries(task_ids)
+        if missing:
+            version = self._cache.version
+            loaded = self._repo.get_subtask_summaries(missing)
+            self._cache.put_subtask_summaries(missing, loaded, version)
+            summaries.update(loaded)
+        return summaries
 
     def create_subtask(self, task_id: int, title: str) -> SubtaskEntity:
-        return self._repo.create_subtask(task_id, title)
+        subtask = self._repo.create_subtask(task_id, title)
+        self._cache.subtasks_changed(task_id=task_id)
+        return subtask
 
     def update_subtask(self, subtask_id: int, data: dict) -> SubtaskEntity | None:
-        return self._repo.update_subtask(subtask_id, data)
+        subtask = self._repo.update_subtask(subtask_id, data)
+        self._cache.subtasks_changed(
+            task_id=subtask.task_id if subtask else None,
+            subtask_id=subtask_id,
+        )
+        return subtask
 
     def delete_subtask(self, subtask_id: int) -> None:
         self._repo.delete_subtask(subtask_id)
+        self._cache.subtasks_changed(subtask_id=subtask_id)
 
     def delete_task(self, task_id: int) -> None:
         self._repo.delete_task(task_id)
+        self._cache.task_deleted(task_id)
+
+    def delete_many(self, task_ids: list[int]) -> None:
+        self._repo.delete_many(task_ids)
+        self._cache.tasks_deleted(task_ids)
 
     def mark_done(self, task_id: int) -> TaskEntity | None:
-        task = self.update_task(task_id, {"status": TaskStatus.DONE.value})
-        if not task:
-            return None
-        self._handle_recurrence(task)
+        with self.unit_of_work():
+            task = self.update_task(task_id, {"status": TaskStatus.DONE.value})
+            if task:
+                self._handle_recurrence(task)
         return task
 
+    def mark_done_many(self, task_ids: list[int]) -> list[TaskEntity]:
+        """Complete every task in ``task_ids`` and create the next instances of recurring ones.
+
+        The status change and the new instances are written in one
+        transaction. Tasks that were already done do not recur again.
+        """
+        with self.unit_of_work():
+            open_tasks = [task for task in self.get_tasks(task_ids) if task.status != TaskStatus.DONE]
+            recurring = [task for task in open_tasks if task.recurrence_rule and task.due_date]
+            latest = self._latest_dues(recurring)
+            next_instances = []
+            for task in recurring:
+                data = self._next_instance(task, latest.get(task.series_key))
+                if data is not None:
+                    next_instances.append(data)
+                    latest[task.series_key] = data["due_date"]
+            tasks = self._repo.update_many(
+                task_ids,
+                self._normalize_update({"status": TaskStatus.DONE.value}),
+                new_tasks=next_instances,
+            )
+            self._cache.tasks_updated(task_ids, tasks)
+            if next_instances:
+                self._cache.tasks_added()
+        return tasks
+
+    def materialize_recurrences(self) -> int:
+        """Create the next instance of every recurring series completed without one.
+
+        That happens when a recurring task was set to done by dragging it,
+        dropping it on the board or editing it, and for legacy instances
+        migration 0008 could not link. Each such series gets only the date
+        after its latest instance, as ``mark_done`` would have created,
+        never every date missed since. A series is skipped while an open
+        task with the same title and rule is due later, which is usually
+        its successor left unlinked. Returns how many tasks were created.
+        """
+        with self.unit_of_work():
+            heads = [head for head in self._repo.list_series_heads() if head.status == TaskStatus.DONE]
+            if not heads:
+                return 0
+            open_dues = self._repo.list_open_recurring_dues()
+            rows = []
+            for head in heads:
+                later = open_dues.get((head.title, head.recurrence_rule))
+                if later is not None and later > head.due_date:
+                    continue
+                data = self._next_instance(head)
+                if data is not None:
+                    rows.append(data)
+            if not rows:
+                return 0
+            created = self._repo.bulk_create(rows)
+            self._cache.tasks_added()
+        return created
+
+    def calendar_marks(self, start: date, end: date) -> CalendarMarks:
+        """Open tasks per day from ``start`` to ``end`` plus the recurring ones not created yet."""
+        heads = {
+            head.series_key: head
+            for head in self._repo.list_series_heads()
+            if head.status != TaskStatus.ARCHIVED and head.due_date < end
+        }
+        series = {key: Recurrence.of(head, head.recurrence_start) for key, head in heads.items()}
+        after = {key: max(head.due_date, start - timedelta(days=1)) for key, head in heads.items()}
+        projected: dict[date, int] = {}
+        for days in expand(series, end, after).values():
+            for day in days:
+                projected[day] = projected.get(day, 0) + 1
+        return CalendarMarks(due=self._repo.count_open_due(start, end), projected=projected)
+
     def archive_task(self, task_id: int) -> TaskEntity | None:
         return self.update_task(task_id, {"status": TaskStatus.ARCHIVED.value})
 
+    def archive_many(self, task_ids: list[int]) -> list[TaskEntity]:
+        return self.update_many(task_ids, {"status": TaskStatus.ARCHIVED.value})
+
     def get_stats(self) -> dict[str, int]:
         return self._repo.get_stats()
 
@@ -73,6 +289,7 @@ class TaskService:
 
     def reorder_tasks(self, task_ids: list[int]) -> None:
         self._repo.reorder_tasks(task_ids)
+        self._cache.tasks_reordered(task_ids)
 
     def _normalize_data(self, data: dict) -> dict:
         normalized = dict(data)
@@ -80,50 +297,56 @@ class TaskService:
             normalized["status"] = normalized["status"].value
         return normalized
 
+    def _normalize_update(self, data: dict) -> dict:
+        """Keep ``completed_at`` and ``archived_at`` in step with a status change."""
+        normalized = self._normalize_data(data)
+        status = normalized.get("status")
+        if status == TaskStatus.DONE.value and "completed_at" not in normalized:
+            normalized["completed_at"] = datetime.utcnow()
+        if status and status != TaskStatus.DONE.value:
+            normalized["completed_at"] = None
+        if status == TaskStatus.ARCHIVED.value and "archived_at" not in normalized:
+            normalized["archived_at"] = datetime.utcnow()
+        if status and status != TaskStatus.ARCHIVED.value:
+            normalized["archived_at"] = None
+        return normalized
+
     def _handle_recurrence(self, task: TaskEntity) -> None:
         if not task.recurrence_rule or not task.due_date:
             return
+        data = self._next_instance(task, self._latest_dues([task]).get(task.series_key))
+        if data is not None:
+            self.create_task(data)
 
-        rule = task.recurrence_rule
-        interval = max(int(task.recurrence_interval or 1), 1)
-        next_due = self._next_due_date(task.due_date, rule, interval)
+    def _latest_dues(self, tasks: list[TaskEntity]) -> dict[int, date]:
+        """Due date of the latest instance of each series the recurring ``tasks`` belong to."""
+        if not tasks:
+            return {}
+        heads = self._repo.list_series_heads(sorted({task.series_key for task in tasks}))
+        return {head.series_key: head.due_date for head in heads}
 
-        if task.recurrence_end_date and next_due > task.recurrence_end_date:
-            return
+    def _next_instance(self, task: TaskEntity, latest_due: date | None = None) -> dict | None:
+        """The instance after ``task`` on its series' dates; None once the series ended or already has it."""
+        series = Recurrence.of(task, task.recurrence_start)
+        if series is None:
+            return None
+        next_due = next_occurrence(series, task.due_date)
+        if next_due is None or (latest_due is not None and latest_due >= next_due):
+            return None
+        return self._instance_data(task, next_due)
 
-        self._repo.create_task({
+    @staticmethod
+    def _instance_data(task: TaskEntity, due: date) -> dict:
+        return {
             "title": task.title,
             "description": task.description,
             "status": TaskStatus.INBOX.value,
             "priority": task.priority,
-            "due_date": next_due,
+            "due_date": due,
             "tags": task.tags,
-            "recurrence_rule": rule,
-            "recurrence_interval": interval,
+            "recurrence_rule": task.recurrence_rule,
+            "recurrence_interval": max(int(task.recurrence_interval or 1), 1),
             "recurrence_end_date": task.recurrence_end_date,
-        })
-
-    @staticmethod
-    def _next_due_date(current: date, rule: str, interval: int) -> date:
-        if rule == RecurrenceRule.DAILY.value:
-            return current + timedelta(days=interval)
-        if rule == RecurrenceRule.WEEKLY.value:
-            return current + timedelta(weeks=interval)
-        if rule == RecurrenceRule.MONTHLY.value:
-            return _add_months(current, interval)
-        return current + timedelta(days=interval)
-
-
-def _add_months(base: date, months: int) -> date:
-    year = base.year + (base.month - 1 + months) // 12
-    month = (base.month - 1 + months) % 12 + 1
-    day = min(base.day, _days_in_month(year, month))
-    return date(year, month, day)
-
-
-def _days_in_month(year: int, month: int) -> int:
-    if month == 12:
-        next_month = date(year + 1, 1, 1)
-    else:
-        next_month = date(year, month + 1, 1)
-    return (next_month - timedelta(days=1)).day
+            "series_id": task.series_key,
+            "series_start": task.recurrence_start,
+        }
@@ -18,6 +18,8 @@ from PySide6.QtWidgets import (
 
 from app.config import SETTINGS
 
+from .worker import AsyncTaskService
+
 
 class PomodoroDialog(QDialog):
     def __init__(self, parent=None):
@@ -137,7 +139,7 @@ class PomodoroDialog(QDialog):
 
 
 class StatsDialog(QDialog):
-    def __init__(self, weekly_stats: list[dict], parent=None):
+    def __init__(self, service: AsyncTaskService, parent=None, weeks: int = 8):
         super().__init__(parent)
         self.setWindowTitle("Звіти")
         self.resize(420, 320)
@@ -145,7 +147,10 @@ class StatsDialog(QDialog):
         title = QLabel("Динаміка за тижнями")
         title.setStyleSheet("font-size: 14px; font-weight: 600;")
 
-        table = QTableWidget(len(weekly_stats), 3)
+        self.loading_label = QLabel("Завантаження…")
+        self.loading_label.setProperty("class", "stats")
+
+        table = QTableWidget(0, 3)
         table.setObjectName("StatsTable")
         header_labels = ["Тиждень", "Створено", "Виконано"]
         for col, label in enumerate(header_labels):
@@ -165,6 +170,27 @@ class StatsDialog(QDialog):
         header.setMinimumSectionSize(90)
         table.verticalHeader().setDefaultSectionSize(36)
 
+        self.table = table
+
+        close_button = QPushButton("Закрити")
+        close_button.clicked.connect(self.accept)
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.loading_label)
+        buttons.addStretch()
+        buttons.addWidget(close_button)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(title)
+        layout.addWidget(table)
+        layout.addLayout(buttons)
+
+        service.get_weekly_stats(weeks=weeks, on_done=self._fill)
+
+    def _fill(self, weekly_stats: list[dict]) -> None:
+        self.loading_label.hide()
+        table = self.table
+        table.setRowCount(len(weekly_stats))
         for row, item in enumerate(weekly_stats):
             week_start = item.get("week_start")
             created = item.get("created", 0)
@@ -181,15 +207,3 @@ class StatsDialog(QDialog):
             table.setItem(row, 0, date_item)
             table.setItem(row, 1, created_item)
             table.setItem(row, 2, completed_item)
-
-        close_button = QPushButton("Закрити")
-        close_button.clicked.connect(self.accept)
-
-        buttons = QHBoxLayout()
-        buttons.addStretch()
-        buttons.addWidget(close_button)
-
-        layout = QVBoxLayout(self)
-        layout.addWidget(title)
-        layout.addWidget(table)
-        layout.addLayout(buttons)
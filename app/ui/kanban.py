@@ -1,17 +1,18 @@
 from __future__ import annotations
 
-from PySide6.QtCore import QSize, Qt
-from PySide6.QtWidgets import QDialog, QHBoxLayout, QLabel, QListWidgetItem, QVBoxLayout
+from functools import partial
+
+from PySide6.QtWidgets import QDialog, QHBoxLayout, QLabel, QVBoxLayout
 
 from app.domain.enums import TaskStatus
-from app.domain.filters import TaskFilters
-from app.services.task_service import TaskService
 
-from .widgets import KanbanListWidget, TaskItemContainer, TaskItemWidget
+from .task_model import TaskBoardModel
+from .widgets import KanbanListWidget
+from .worker import AsyncTaskService, DebouncedQuery
 
 
 class KanbanDialog(QDialog):
-    def __init__(self, service: TaskService, parent=None):
+    def __init__(self, service: AsyncTaskService, parent=None):
         super().__init__(parent)
         self.service = service
         self.setWindowTitle("Kanban")
@@ -38,28 +39,36 @@ class KanbanDialog(QDialog):
             layout.addLayout(column, 1)
             self.columns[status_key] = list_widget
 
+        self.board = TaskBoardModel(
+            {status_key: list_widget.task_model() for status_key, list_widget in self.columns.items()}
+        )
+        self._board_query = DebouncedQuery(
+            service.worker,
+            partial(service.service.get_board, list(self.columns)),
+            self.board.load,
+            delay_ms=0,
+            parent=self,
+        )
         self.refresh()
 
     def refresh(self) -> None:
-        for status_key, list_widget in self.columns.items():
-            list_widget.clear()
-            tasks = self.service.list_tasks(TaskFilters(filter_key=status_key))
-            task_ids = [task.id for task in tasks if task.id is not None]
-            subtask_titles = self.service.get_subtask_titles(task_ids)
-            for task in tasks:
-                item = QListWidgetItem()
-                list_widget.addItem(item)
-                item.setData(Qt.UserRole, task.id)
-                task_widget = TaskItemWidget(task, subtask_titles.get(task.id))
-                widget = TaskItemContainer(task_widget)
-                item.setSizeHint(widget.sizeHint())
-                list_widget.setItemWidget(item, widget)
-            list_widget.sync_item_sizes()
+        self._board_query.run_now()
 
     def on_drop_status(self, task_id: int, status_key: str) -> None:
-        self.service.update_task(task_id, {"status": status_key})
-        self.refresh()
+        if not self.board.move_card(task_id, status_key):
+            return
+        self.service.update_task(
+            task_id,
+            {"status": status_key},
+            on_done=partial(self.board.card_saved, task_id),
+            on_error=self._on_move_failed,
+        )
 
     def on_reorder(self, task_ids: list[int]) -> None:
+        # The column already shows the new order; only the database is behind.
         self.service.reorder_tasks(task_ids)
+
+    def _on_move_failed(self, exc: Exception) -> None:
         self.refresh()
+        self.service.worker.failed.emit(exc)
+
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import csv
-from datetime import date, datetime
+from datetime import date
 from pathlib import Path
+from typing import Callable
 
-from PySide6.QtCore import QDate, QSize, Qt
-from PySide6.QtGui import QKeySequence, QShortcut
+from PySide6.QtCore import QDate, QModelIndex, Qt, QTimer
+from PySide6.QtGui import QFont, QKeySequence, QShortcut, QTextCharFormat
 from PySide6.QtWidgets import (
     QCalendarWidget,
     QCheckBox,
@@ -19,6 +19,7 @@ from PySide6.QtWidgets import (
     QListWidgetItem,
     QMessageBox,
     QAbstractSpinBox,
+    QProgressDialog,
     QPushButton,
     QScrollArea,
     QSizePolicy,
@@ -30,21 +31,23 @@ from PySide6.QtWidgets import (
 )
 
 from app.config import SETTINGS
-from app.domain.entities import SubtaskEntity, TaskEntity
+from app.domain.entities import CalendarMarks, SubtaskEntity, SubtaskSummary, TaskCardPage, TaskCardRow, TaskEntity
 from app.domain.enums import RecurrenceRule, TaskStatus
-from app.domain.filters import TaskFilters
+from app.domain.filters import TaskCursor, TaskFilters
 from app.infra.repository import TaskRepository
+from app.services.csv_io import export_tasks_csv, read_task_rows
+from app.services.ics import IcsDocument, IcsExporter, write_document
 from app.services.task_service import TaskService
 
 from .dialogs import PomodoroDialog, StatsDialog
 from .kanban import KanbanDialog
+from .task_model import TASK_ROLE, PageCallback
+from .worker import AsyncTaskService, DbWorker, DebouncedQuery, ExportQueue, ProgressRelay
 from .widgets import (
     FilterListWidget,
     PRIORITY_OPTIONS,
     STATUS_LABELS,
     SubtaskItemWidget,
-    TaskItemContainer,
-    TaskItemWidget,
     TaskListWidget,
 )
 
@@ -72,20 +75,12 @@ RECURRENCE_OPTIONS = [
     ("Щомісяця", RecurrenceRule.MONTHLY.value),
 ]
 
-CSV_HEADERS = [
-    "title",
-    "description",
-    "status",
-    "priority",
-    "due_date",
-    "tags",
-    "recurrence_rule",
-    "recurrence_interval",
-    "recurrence_end_date",
-]
-
 REORDER_FILTERS = {"inbox", "in_progress", "done", "archived"}
 
+TASK_PAGE_SIZE = 200
+SEARCH_DEBOUNCE_MS = 250
+ICS_EXPORT_DEBOUNCE_MS = 1500
+
 
 class MainWindow(QWidget):
     def __init__(self):
@@ -94,6 +89,25 @@ class MainWindow(QWidget):
         self.resize(1280, 760)
 
         self.service = TaskService(TaskRepository())
+        self.worker = DbWorker(self)
+        self.worker.failed.connect(self._show_worker_error)
+        self.async_service = AsyncTaskService(self.service, self.worker)
+        self.export_queue = ExportQueue(self)
+        self.export_queue.finished.connect(self._on_export_finished)
+        self.export_queue.failed.connect(self._on_export_failed)
+        self._ics_export_failing = False
+        self.ics_exporter = IcsExporter(self.service)
+        self._ics_timer = QTimer(self)
+        self._ics_timer.setSingleShot(True)
+        self._ics_timer.setInterval(ICS_EXPORT_DEBOUNCE_MS)
+        self._ics_timer.timeout.connect(self._flush_ics_export)
+        self._task_query = DebouncedQuery(
+            self.worker,
+            self._query_tasks,
+            self._apply_tasks,
+            delay_ms=SEARCH_DEBOUNCE_MS,
+            parent=self,
+        )
 
         main_layout = QHBoxLayout(self)
         main_layout.setContentsMargins(12, 12, 12, 12)
@@ -116,13 +130,30 @@ class MainWindow(QWidget):
         self.current_task_id: int | None = None
         self.current_filter = "all"
         self.due_on: date | None = None
+        self._filters = TaskFilters(filter_key=self.current_filter)
+        self.task_list.task_model().set_page_loader(self._load_task_page)
+        self._task_query.busy_changed.connect(self._on_query_busy)
+        self._saving = False
 
         self.refresh_tasks()
+        if SETTINGS.recurrence_catch_up:
+            self.async_service.materialize_recurrences(on_done=self._on_recurrences_materialized)
+        else:
+            self._refresh_calendar_marks()
         self._show_reminders()
 
         QShortcut(QKeySequence("Ctrl+N"), self, self.new_task)
         QShortcut(QKeySequence("Ctrl+S"), self, self.save_task)
 
+    def closeEvent(self, event) -> None:  # type: ignore[override]
+        self._task_query.invalidate()
+        if self._ics_timer.isActive():
+            self._flush_ics_export()
+        # Pending writes first, then the exports they trigger.
+        self.worker.drain()
+        self.export_queue.flush()
+        super().closeEvent(event)
+
     def _build_sidebar(self) -> QWidget:
         frame = QFrame()
         frame.setObjectName("Sidebar")
@@ -160,6 +191,7 @@ class MainWindow(QWidget):
         self.calendar.setMinimumHeight(240)
         self.calendar.setMaximumHeight(280)
         self.calendar.selectionChanged.connect(self.on_calendar_selected)
+        self.calendar.currentPageChanged.connect(self._refresh_calendar_marks)
         layout.addWidget(self.calendar)
 
         clear_date = QPushButton("Скинути дату")
@@ -207,7 +239,11 @@ class MainWindow(QWidget):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Пошук за назвою, тегами або описом")
         self.search_input.setMinimumWidth(220)
-        self.search_input.textChanged.connect(self.refresh_tasks)
+        self.search_input.textChanged.connect(self.on_search_changed)
+
+        self.search_status = QLabel("Пошук…")
+        self.search_status.setProperty("class", "stats")
+        self.search_status.setVisible(False)
 
         add_button = QPushButton("Нова задача")
         add_button.clicked.connect(self.new_task)
@@ -217,6 +253,7 @@ class MainWindow(QWidget):
         kanban_button.clicked.connect(self.open_kanban)
 
         primary_row.addWidget(self.search_input, 1)
+        primary_row.addWidget(self.search_status)
         primary_row.addWidget(add_button)
         primary_row.addWidget(kanban_button)
 
@@ -254,7 +291,7 @@ class MainWindow(QWidget):
         self.task_list = TaskListWidget(on_reorder=self.on_reorder_tasks)
         self.task_list.setObjectName("TaskList")
         self.task_list.setSpacing(10)
-        self.task_list.currentItemChanged.connect(self.on_task_selected)
+        self.task_list.selectionModel().currentChanged.connect(self.on_task_selected)
 
         layout.addLayout(header)
         layout.addWidget(action_bar)
@@ -434,42 +471,109 @@ class MainWindow(QWidget):
 
         return frame
 
-    def refresh_tasks(self) -> None:
+    def _current_filters(self) -> TaskFilters:
         search = self.search_input.text().strip() if self.search_input else ""
-        filters = TaskFilters(
+        return TaskFilters(
             filter_key=self.current_filter,
             search=search or None,
             due_on=self.due_on,
         )
-        tasks = self.service.list_tasks(filters)
-        task_ids = [task.id for task in tasks if task.id is not None]
-        subtask_titles = self.service.get_subtask_titles(task_ids)
-        self.task_list.clear()
 
-        for task in tasks:
-            item = QListWidgetItem()
-            item.setData(Qt.UserRole, task.id)
-            task_widget = TaskItemWidget(task, subtask_titles.get(task.id))
-            widget = TaskItemContainer(task_widget)
-            self.task_list.addItem(item)
-            self.task_list.setItemWidget(item, widget)
-            item.setSizeHint(widget.sizeHint())
+    def _list_limit(self) -> int:
+        # Re-read as many rows as are already loaded so the diff compares like with like.
+        return max(TASK_PAGE_SIZE, self.task_list.task_model().rowCount())
+
+    def _on_recurrences_materialized(self, created: int) -> None:
+        if created:
+            self._after_task_change()
+        else:
+            self._refresh_calendar_marks()
+
+    def _refresh_calendar_marks(self, *_page) -> None:
+        first = QDate(self.calendar.yearShown(), self.calendar.monthShown(), 1)
+        # The grid also shows the end of the previous month and the start of the next.
+        start = first.addDays(-7).toPython()
+        end = first.addMonths(1).addDays(13).toPython()
+        self.async_service.calendar_marks(start, end, on_done=self._apply_calendar_marks)
+
+    def _apply_calendar_marks(self, marks: CalendarMarks) -> None:
+        self.calendar.setDateTextFormat(QDate(), QTextCharFormat())
+        projected = QTextCharFormat()
+        projected.setFontItalic(True)
+        due = QTextCharFormat()
+        due.setFontWeight(QFont.Bold)
+        for day in marks.projected:
+            self.calendar.setDateTextFormat(QDate(day), projected)
+        for day in marks.due:
+            self.calendar.setDateTextFormat(QDate(day), due)
+
+    def refresh_tasks(self) -> None:
+        # Queued behind any write submitted before it, so the list reflects that write.
+        self._task_query.run_now(self._current_filters(), self._list_limit())
+
+    def on_search_changed(self) -> None:
+        self._task_query.schedule(self._current_filters(), self._list_limit())
+
+    def _on_query_busy(self, busy: bool) -> None:
+        self.search_status.setVisible(busy and bool(self.search_input.text().strip()))
+
+    def _after_task_change(self) -> None:
+        self.refresh_tasks()
+        self._refresh_calendar_marks()
+        self._auto_export_ics()
+
+    def _query_tasks(self, filters: TaskFilters, limit: int) -> tuple[TaskCardPage, dict[int, SubtaskSummary]]:
+        """Runs on the worker thread: service calls only, no widgets."""
+        with self.service.unit_of_work():
+            page = self.service.list_cards_page(filters, limit=limit, include_stats=True)
+            task_ids = [card.id for card in page.cards]
+            return page, self.service.get_subtask_summaries(task_ids)
+
+    def _apply_tasks(
+        self,
+        filters: TaskFilters,
+        limit: int,
+        result: tuple[TaskCardPage, dict[int, SubtaskSummary]],
+    ) -> None:
+        page, subtasks = result
+        self._filters = filters
+        model = self.task_list.task_model()
+        tasks = page.cards
+        stats = page.stats
+        task_ids = [task.id for task in tasks if task.id is not None]
+        if self.task_list.current_task_id() not in task_ids:
+            self.task_list.selectionModel().clearCurrentIndex()
+        changed = model.sync_tasks(tasks, subtasks)
+        model.set_next_cursor(page.next_cursor)
 
-        self.task_list.set_reorder_enabled(self.current_filter in REORDER_FILTERS)
+        # Search results are ranked by relevance, so manual order is not shown there.
+        self.task_list.set_reorder_enabled(filters.filter_key in REORDER_FILTERS and not filters.search)
 
-        stats = self.service.get_stats()
         self.stats_label.setText(
             f"Всього: {stats['total']} • У роботі: {stats['in_progress']} • "
             f"Виконано: {stats['done']} • Прострочено: {stats['overdue']} • "
             f"Сьогодні: {stats['due_today']}"
         )
 
-        if tasks:
-            self.task_list.setCurrentRow(0)
+        current_id = self.task_list.current_task_id()
+        if current_id != self.current_task_id and self.task_list.set_current_task(self.current_task_id):
+            return
+        if current_id is not None:
+            if current_id == self.current_task_id and current_id in changed:
+                self._open_task(current_id)
+        elif tasks:
+            self.task_list.setCurrentIndex(model.index(0))
         else:
             self.current_task_id = None
             self.clear_form()
-        self.task_list.sync_item_sizes()
+
+    def _load_task_page(self, cursor: TaskCursor, callback: PageCallback) -> None:
+        self.async_service.run(
+            _read_task_page,
+            self._filters,
+            cursor,
+            on_done=lambda result: callback(cursor, *result),
+        )
 
     def on_filter_change(self, current: QListWidgetItem) -> None:
         if not current:
@@ -478,15 +582,14 @@ class MainWindow(QWidget):
         self.refresh_tasks()
 
     def on_status_drop(self, task_id: int, status_key: str) -> None:
-        self.service.update_task(task_id, {"status": status_key})
-        self.refresh_tasks()
-        self._auto_export_ics()
+        self.async_service.update_task(task_id, {"status": status_key})
+        self._after_task_change()
 
     def on_reorder_tasks(self, task_ids: list[int]) -> None:
         if self.current_filter not in REORDER_FILTERS:
             return
-        self.service.reorder_tasks(task_ids)
-        self.refresh_tasks()
+        # The view already shows the dropped order; only persist it.
+        self.async_service.reorder_tasks(task_ids)
 
     def on_calendar_selected(self) -> None:
         selected = self.calendar.selectedDate().toPython()
@@ -497,39 +600,24 @@ class MainWindow(QWidget):
         self.due_on = None
         self.refresh_tasks()
 
-    def on_task_selected(
-        self,
-        current: QListWidgetItem,
-        previous: QListWidgetItem | None = None,
-    ) -> None:
-        if previous:
-            self._set_task_item_selected(previous, False)
-        if not current:
+    def on_task_selected(self, current: QModelIndex, previous: QModelIndex | None = None) -> None:
+        if not current.isValid():
             return
-        self._set_task_item_selected(current, True)
-        task_id = current.data(Qt.UserRole)
-        task = self._get_task_from_list(task_id)
-        if task:
-            self.current_task_id = task.id
+        card = current.data(TASK_ROLE)
+        if card:
+            self.current_task_id = card.id
+            self._open_task(card.id)
+
+    def _open_task(self, task_id: int) -> None:
+        # Cards carry only what the list paints; the form needs every field.
+        self.async_service.get_task(task_id, on_done=lambda task: self._on_task_loaded(task_id, task))
+
+    def _on_task_loaded(self, task_id: int, task: TaskEntity | None) -> None:
+        if task is not None and task_id == self.current_task_id:
             self.populate_form(task)
 
-    def _set_task_item_selected(self, item: QListWidgetItem, selected: bool) -> None:
-        widget = self.task_list.itemWidget(item)
-        if isinstance(widget, TaskItemWidget):
-            widget.set_selected(selected)
-        elif hasattr(widget, "set_selected"):
-            widget.set_selected(selected)
-
-    def _get_task_from_list(self, task_id: int) -> TaskEntity | None:
-        for index in range(self.task_list.count()):
-            item = self.task_list.item(index)
-            if item.data(Qt.UserRole) == task_id:
-                widget = self.task_list.itemWidget(item)
-                if isinstance(widget, TaskItemWidget):
-                    return widget.task
-                if hasattr(widget, "task"):
-                    return widget.task
-        return None
+    def _get_task_from_list(self, task_id: int) -> TaskCardRow | None:
+        return self.task_list.task_model().task_by_id(task_id)
 
     def populate_form(self, task: TaskEntity) -> None:
         self.title_input.setText(task.title)
@@ -575,40 +663,56 @@ class MainWindow(QWidget):
             self.refresh_subtasks(task.id)
 
     def refresh_subtasks(self, task_id: int) -> None:
-        subtasks = self.service.list_subtasks(task_id)
-        self._render_subtasks(subtasks)
+        self.async_service.list_subtasks(
+            task_id,
+            on_done=lambda subtasks: self._on_subtasks_loaded(task_id, subtasks),
+        )
+
+    def _on_subtasks_loaded(self, task_id: int, subtasks: list[SubtaskEntity]) -> None:
+        # The selection may have moved on while the subtasks were loading.
+        if task_id == self.current_task_id:
+            self._render_subtasks(subtasks)
 
     def add_subtask(self) -> None:
         title = self.subtask_input.text().strip()
         if not title:
             return
         if self.current_task_id is None:
-            self.save_task()
-        if self.current_task_id is None:
-            QMessageBox.warning(self, "Потрібна задача", "Спочатку збережи задачу.")
+            if not self._save_form(on_saved=lambda task_id: self._create_subtask(task_id, title)):
+                QMessageBox.warning(self, "Потрібна задача", "Спочатку збережи задачу.")
             return
-        try:
-            self.service.create_subtask(self.current_task_id, title)
-        except Exception as exc:  # noqa: BLE001
+        self._create_subtask(self.current_task_id, title)
+
+    def _create_subtask(self, task_id: int, title: str) -> None:
+        def on_done(_subtask: SubtaskEntity) -> None:
+            if self.subtask_input.text().strip() == title:
+                self.subtask_input.clear()
+            self._after_subtask_change(task_id)
+
+        def on_error(exc: Exception) -> None:
             QMessageBox.warning(self, "Помилка", f"Не вдалося додати підзадачу.\n{exc}")
-            return
-        self.subtask_input.clear()
-        self.refresh_subtasks(self.current_task_id)
+
+        self.async_service.create_subtask(task_id, title, on_done=on_done, on_error=on_error)
 
     def on_subtask_toggle(self, subtask_id: int, is_done: bool) -> None:
-        self.service.update_subtask(subtask_id, {"is_done": is_done})
+        self.async_service.update_subtask(subtask_id, {"is_done": is_done})
         if self.current_task_id is not None:
-            self.refresh_subtasks(self.current_task_id)
+            self._after_subtask_change(self.current_task_id)
 
     def on_subtask_title_update(self, subtask_id: int, title: str) -> None:
-        self.service.update_subtask(subtask_id, {"title": title})
+        self.async_service.update_subtask(subtask_id, {"title": title})
         if self.current_task_id is not None:
-            self.refresh_subtasks(self.current_task_id)
+            self._after_subtask_change(self.current_task_id)
 
     def on_subtask_delete(self, subtask_id: int) -> None:
-        self.service.delete_subtask(subtask_id)
+        self.async_service.delete_subtask(subtask_id)
         if self.current_task_id is not None:
-            self.refresh_subtasks(self.current_task_id)
+            self._after_subtask_change(self.current_task_id)
+
+    def _after_subtask_change(self, task_id: int) -> None:
+        # The card shows subtask progress, so the list has to catch up too.
+        self.refresh_subtasks(task_id)
+        self.refresh_tasks()
 
     def _render_subtasks(self, subtasks: list[SubtaskEntity]) -> None:
         self._clear_subtasks()
@@ -691,10 +795,16 @@ class MainWindow(QWidget):
         self.recurrence_end_date.setEnabled(checked)
 
     def save_task(self) -> None:
+        self._save_form()
+
+    def _save_form(self, on_saved: Callable[[int], None] | None = None) -> bool:
+        """Queue the form for saving; ``on_saved`` gets the task id once it is stored."""
+        if self._saving:
+            return False
         title = self.title_input.text().strip()
         if not title:
             QMessageBox.warning(self, "Потрібна назва", "Вкажи назву задачі.")
-            return
+            return False
 
         data = {
             "title": title,
@@ -710,61 +820,96 @@ class MainWindow(QWidget):
             else None,
         }
 
-        if self.current_task_id is None:
-            task = self.service.create_task(data)
-            self.current_task_id = task.id
-        else:
-            self.service.update_task(self.current_task_id, data)
-
-        self.refresh_tasks()
-        self._auto_export_ics()
+        if self.current_task_id is not None:
+            task_id = self.current_task_id
+            self.async_service.update_task(task_id, data)
+            self._after_task_change()
+            if on_saved:
+                on_saved(task_id)
+            return True
+
+        # Until the insert returns there is no id, so a second save must not create a duplicate.
+        self._saving = True
+
+        def on_created(task: TaskEntity) -> None:
+            self._saving = False
+            if self.current_task_id is None:
+                self.current_task_id = task.id
+            self._after_task_change()
+            if on_saved and task.id is not None:
+                on_saved(task.id)
+
+        def on_error(exc: Exception) -> None:
+            self._saving = False
+            self._show_worker_error(exc)
+
+        self.async_service.create_task(data, on_done=on_created, on_error=on_error)
+        return True
 
     def mark_done(self) -> None:
+        task_ids = self.task_list.selected_task_ids()
+        if len(task_ids) > 1:
+            cards = [self._get_task_from_list(task_id) for task_id in task_ids]
+            if all(card and card.status == TaskStatus.DONE for card in cards):
+                self.async_service.update_many(task_ids, {"status": TaskStatus.IN_PROGRESS.value})
+            else:
+                self.async_service.mark_done_many(task_ids)
+            self._after_task_change()
+            return
         if self.current_task_id is None:
             return
-        task = self._get_task_from_list(self.current_task_id)
+        task_id = self.current_task_id
+        task = self._get_task_from_list(task_id)
         if task is None:
-            task = self.service.get_task(self.current_task_id)
+            self.async_service.get_task(task_id, on_done=lambda found: self._toggle_done(task_id, found))
+            return
+        self._toggle_done(task_id, task)
+
+    def _toggle_done(self, task_id: int, task: TaskEntity | TaskCardRow | None) -> None:
         if task and task.status == TaskStatus.DONE:
-            self.service.update_task(self.current_task_id, {"status": TaskStatus.IN_PROGRESS.value})
+            self.async_service.update_task(task_id, {"status": TaskStatus.IN_PROGRESS.value})
         else:
-            self.service.mark_done(self.current_task_id)
-        self.refresh_tasks()
-        self._auto_export_ics()
+            self.async_service.mark_done(task_id)
+        self._after_task_change()
 
     def archive_task(self) -> None:
-        if self.current_task_id is None:
+        task_ids = self.task_list.selected_task_ids()
+        if len(task_ids) > 1:
+            self.async_service.archive_many(task_ids)
+        elif self.current_task_id is not None:
+            self.async_service.archive_task(self.current_task_id)
+        else:
             return
-        self.service.archive_task(self.current_task_id)
-        self.refresh_tasks()
-        self._auto_export_ics()
+        self._after_task_change()
 
     def delete_task(self) -> None:
-        if self.current_task_id is None:
+        task_ids = self.task_list.selected_task_ids()
+        if len(task_ids) <= 1 and self.current_task_id is None:
             return
         confirm = QMessageBox.question(
             self,
             "Підтвердження",
-            "Точно видалити задачу?",
+            f"Точно видалити задачі ({len(task_ids)})?" if len(task_ids) > 1 else "Точно видалити задачу?",
         )
         if confirm != QMessageBox.Yes:
             return
-        self.service.delete_task(self.current_task_id)
-        self.refresh_tasks()
-        self._auto_export_ics()
+        if len(task_ids) > 1:
+            self.async_service.delete_many(task_ids)
+        else:
+            self.async_service.delete_task(self.current_task_id)
+        self._after_task_change()
 
     def open_pomodoro(self) -> None:
         dialog = PomodoroDialog(self)
         dialog.exec()
 
     def open_kanban(self) -> None:
-        dialog = KanbanDialog(self.service, self)
+        dialog = KanbanDialog(self.async_service, self)
         dialog.exec()
         self.refresh_tasks()
 
     def open_reports(self) -> None:
-        data = self.service.get_weekly_stats(weeks=8)
-        dialog = StatsDialog(data, self)
+        dialog = StatsDialog(self.async_service, self)
         dialog.exec()
 
     def export_csv(self) -> None:
@@ -776,27 +921,29 @@ class MainWindow(QWidget):
         )
         if not path:
             return
-        tasks = self.service.list_tasks(TaskFilters(filter_key="all"))
-        with open(path, "w", newline="", encoding="utf-8") as handle:
-            writer = csv.DictWriter(handle, fieldnames=CSV_HEADERS)
-            writer.writeheader()
-            for task in tasks:
-                writer.writerow(
-                    {
-                        "title": task.title,
-                        "description": task.description,
-                        "status": task.status.value,
-                        "priority": task.priority,
-                        "due_date": task.due_date.isoformat() if task.due_date else "",
-                        "tags": task.tags,
-                        "recurrence_rule": task.recurrence_rule or "",
-                        "recurrence_interval": task.recurrence_interval,
-                        "recurrence_end_date": task.recurrence_end_date.isoformat()
-                        if task.recurrence_end_date
-                        else "",
-                    }
-                )
-        QMessageBox.information(self, "Готово", "CSV файл збережено.")
+        progress, relay = self._progress_dialog("Експорт CSV", "Експорт задач…")
+        relay.progressed.connect(lambda count: progress.setLabelText(f"Експортовано задач: {count}…"))
+
+        def on_done(count: int) -> None:
+            _close_progress(progress)
+            QMessageBox.information(self, "Готово", f"CSV файл збережено. Задач: {count}.")
+
+        def on_error(exc: Exception) -> None:
+            _close_progress(progress)
+            QMessageBox.warning(self, "Помилка", f"Не вдалося зберегти CSV файл.\n{exc}")
+
+        # Queued behind pending writes so the file includes them.
+        self.worker.after_pending(
+            lambda: self.export_queue.enqueue(
+                ("csv", path),
+                export_tasks_csv,
+                self.service,
+                Path(path),
+                progress=relay.progressed.emit,
+                on_done=on_done,
+                on_error=on_error,
+            )
+        )
 
     def import_csv(self) -> None:
         path, _ = QFileDialog.getOpenFileName(
@@ -807,44 +954,31 @@ class MainWindow(QWidget):
         )
         if not path:
             return
-        created = 0
-        with open(path, "r", newline="", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
-            for row in reader:
-                title = (row.get("title") or "").strip()
-                if not title:
-                    continue
-                status = (row.get("status") or TaskStatus.INBOX.value).strip()
-                if status not in STATUS_LABELS:
-                    status = TaskStatus.INBOX.value
-                due_date = _parse_date(row.get("due_date"))
-                end_date = _parse_date(row.get("recurrence_end_date"))
-                try:
-                    priority = int(row.get("priority") or 2)
-                except ValueError:
-                    priority = 2
-                try:
-                    interval = int(row.get("recurrence_interval") or 1)
-                except ValueError:
-                    interval = 1
-
-                self.service.create_task(
-                    {
-                        "title": title,
-                        "description": (row.get("description") or "").strip(),
-                        "status": status,
-                        "priority": priority,
-                        "due_date": due_date,
-                        "tags": (row.get("tags") or "").strip(),
-                        "recurrence_rule": (row.get("recurrence_rule") or None),
-                        "recurrence_interval": interval,
-                        "recurrence_end_date": end_date,
-                    }
-                )
-                created += 1
-        self.refresh_tasks()
-        self._auto_export_ics()
-        QMessageBox.information(self, "Готово", f"Імпортовано задач: {created}.")
+        progress, relay = self._progress_dialog("Імпорт CSV", "Імпорт задач…")
+        relay.progressed.connect(lambda count: progress.setLabelText(f"Імпортовано задач: {count}…"))
+
+        def on_done(created: int) -> None:
+            _close_progress(progress)
+            self._after_task_change()
+            QMessageBox.information(self, "Готово", f"Імпортовано задач: {created}.")
+
+        def on_error(exc: Exception) -> None:
+            _close_progress(progress)
+            QMessageBox.warning(self, "Помилка", f"Імпорт скасовано, жодну задачу не додано.\n{exc}")
+
+        self.async_service.bulk_import(
+            read_task_rows(Path(path)),
+            progress=relay.progressed.emit,
+            on_done=on_done,
+            on_error=on_error,
+        )
+
+    def _progress_dialog(self, title: str, label: str) -> tuple[QProgressDialog, ProgressRelay]:
+        progress = QProgressDialog(label, None, 0, 0, self)
+        progress.setWindowTitle(title)
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(300)
+        return progress, ProgressRelay(progress)
 
     def export_ics(self) -> None:
         path, _ = QFileDialog.getSaveFileName(
@@ -855,43 +989,74 @@ class MainWindow(QWidget):
         )
         if not path:
             return
-        self._write_ics(Path(path))
-        QMessageBox.information(self, "Готово", "ICS файл збережено.")
+        self.worker.submit(
+            self.ics_exporter.build,
+            Path(path),
+            force=True,
+            on_done=lambda document: self._write_ics(
+                document,
+                on_done=lambda _: QMessageBox.information(self, "Готово", "ICS файл збережено."),
+                on_error=lambda exc: QMessageBox.warning(
+                    self, "Помилка", f"Не вдалося зберегти ICS файл.\n{exc}"
+                ),
+            ),
+        )
 
     def _auto_export_ics(self) -> None:
-        if not SETTINGS.ics_export_path:
-            return
-        self._write_ics(Path(SETTINGS.ics_export_path))
-
-    def _write_ics(self, path: Path) -> None:
-        tasks = self.service.list_tasks(TaskFilters(filter_key="all"))
-        now = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
-
-        lines = [
-            "BEGIN:VCALENDAR",
-            "VERSION:2.0",
-            "PRODID:-//Task Forge//UA",
-            "CALSCALE:GREGORIAN",
-        ]
-        for task in tasks:
-            if not task.due_date:
-                continue
-            lines.extend(
-                [
-                    "BEGIN:VEVENT",
-                    f"UID:task-{task.id}@taskforge",
-                    f"DTSTAMP:{now}",
-                    f"DTSTART;VALUE=DATE:{task.due_date.strftime('%Y%m%d')}",
-                    f"SUMMARY:{_escape_ics(task.title)}",
-                    f"DESCRIPTION:{_escape_ics(task.description)}",
-                    "END:VEVENT",
-                ]
+        # A burst of edits (drag, done, archive...) ends up as one write.
+        if SETTINGS.ics_export_path:
+            self._ics_timer.start()
+
+    def _flush_ics_export(self) -> None:
+        self._ics_timer.stop()
+        if SETTINGS.ics_export_path:
+            self.worker.submit(
+                self.ics_exporter.build,
+                Path(SETTINGS.ics_export_path),
+                on_done=self._write_ics,
             )
-        lines.append("END:VCALENDAR")
-        path.write_text("\n".join(lines), encoding="utf-8")
+
+    def _write_ics(
+        self,
+        document: IcsDocument,
+        on_done: Callable[[IcsDocument], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> None:
+        if document.content is None:
+            return
+
+        def written(result: IcsDocument) -> None:
+            # Merged jobs report the newest document, which is the one on disk.
+            self.ics_exporter.mark_written(result)
+            if on_done:
+                on_done(result)
+
+        self.export_queue.enqueue(
+            ("ics", document.path),
+            write_document,
+            document,
+            on_done=written,
+            on_error=on_error,
+        )
+
+    def _on_export_finished(self, key: tuple, _result: object) -> None:
+        if key[0] == "ics":
+            self._ics_export_failing = False
+
+    def _on_export_failed(self, key: tuple, exc: Exception) -> None:
+        auto_path = Path(SETTINGS.ics_export_path) if SETTINGS.ics_export_path else None
+        # Auto-export runs after every edit; warn once per outage, not on each attempt.
+        if key == ("ics", auto_path) and not self._ics_export_failing:
+            self._ics_export_failing = True
+            QMessageBox.warning(self, "Помилка", f"Не вдалося оновити ICS файл.\n{exc}")
+
+    def _show_worker_error(self, exc: Exception) -> None:
+        QMessageBox.warning(self, "Помилка", f"Не вдалося виконати запит до бази.\n{exc}")
 
     def _show_reminders(self) -> None:
-        reminders = self.service.list_reminders()
+        self.async_service.list_reminders(on_done=self._on_reminders_loaded)
+
+    def _on_reminders_loaded(self, reminders: list[TaskEntity]) -> None:
         if not reminders:
             return
         lines = []
@@ -903,14 +1068,17 @@ class MainWindow(QWidget):
         QMessageBox.information(self, "Нагадування", message)
 
 
-def _parse_date(value: str | None) -> date | None:
-    if not value:
-        return None
-    try:
-        return date.fromisoformat(value)
-    except ValueError:
-        return None
+def _read_task_page(
+    service: TaskService,
+    filters: TaskFilters,
+    cursor: TaskCursor,
+) -> tuple[list[TaskCardRow], dict[int, SubtaskSummary], TaskCursor | None]:
+    with service.unit_of_work():
+        page = service.list_cards_page(filters, after=cursor, limit=TASK_PAGE_SIZE)
+        task_ids = [card.id for card in page.cards]
+        return page.cards, service.get_subtask_summaries(task_ids), page.next_cursor
 
 
-def _escape_ics(value: str) -> str:
-    return value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+def _close_progress(progress: QProgressDialog) -> None:
+    progress.close()
+    progress.deleteLater()
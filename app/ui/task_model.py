@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Callable
+
+from PySide6.QtCore import QAbstractListModel, QMimeData, QModelIndex, Qt
+
+from app.domain.entities import SubtaskSummary, TaskBoard, TaskCardRow, TaskEntity
+from app.domain.enums import TaskStatus
+from app.domain.filters import TaskCursor
+from app.domain.ordering import increasing_run
+
+TASK_ID_ROLE = Qt.UserRole
+TASK_ROLE = Qt.UserRole + 1
+SUBTASKS_ROLE = Qt.UserRole + 2
+
+TASK_MIME_TYPE = "text/plain"
+
+# Past this many inserts/moves/removals a plain model reset is cheaper than
+# replaying the diff row by row.
+MAX_INCREMENTAL_CHANGES = 256
+
+PageCallback = Callable[[TaskCursor, list[TaskCardRow], dict[int, SubtaskSummary], TaskCursor | None], None]
+# Called with the cursor to continue from; answers later through the callback.
+PageLoader = Callable[[TaskCursor, PageCallback], None]
+
+
+def task_id_from_text(text: str) -> int | None:
+    if not text.startswith("task:"):
+        return None
+    try:
+        return int(text.split(":", 1)[1])
+    except ValueError:
+        return None
+
+
+class TaskListModel(QAbstractListModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tasks: list[TaskCardRow] = []
+        self._subtasks: dict[int, SubtaskSummary] = {}
+        self._rows: dict[int, int] = {}
+        self._page_loader: PageLoader | None = None
+        self._next_cursor: TaskCursor | None = None
+        self._pending_cursor: TaskCursor | None = None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._tasks)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._tasks):
+            return None
+        task = self._tasks[index.row()]
+        if role == TASK_ID_ROLE:
+            return task.id
+        if role == TASK_ROLE:
+            return task
+        if role == SUBTASKS_ROLE:
+            return self._subtasks.get(task.id)
+        if role == Qt.DisplayRole:
+            return task.title
+        return None
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid():
+            return False
+        return self._page_loader is not None and self._next_cursor is not None
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if not self.canFetchMore(parent):
+            return
+        cursor, self._next_cursor = self._next_cursor, None
+        self._pending_cursor = cursor
+        self._page_loader(cursor, self.append_page)
+
+    def append_page(
+        self,
+        cursor: TaskCursor,
+        tasks: list[TaskCardRow],
+        subtasks: dict[int, SubtaskSummary],
+        next_cursor: TaskCursor | None,
+    ) -> None:
+        """Append a page requested by ``fetchMore``; pages outdated by a sync are dropped."""
+        if cursor is not self._pending_cursor:
+            return
+        self._pending_cursor = None
+        self._next_cursor = next_cursor
+        tasks = [task for task in tasks if task.id not in self._rows]
+        if not tasks:
+            return
+        first = len(self._tasks)
+        self.beginInsertRows(QModelIndex(), first, first + len(tasks) - 1)
+        self._tasks.extend(tasks)
+        self._subtasks.update(subtasks)
+        for row, task in enumerate(tasks, start=first):
+            self._rows[task.id] = row
+        self.endInsertRows()
+
+    def set_page_loader(self, loader: PageLoader | None) -> None:
+        self._page_loader = loader
+
+    def set_next_cursor(self, cursor: TaskCursor | None) -> None:
+        """Where ``fetchMore`` continues once the rows shown so far run out."""
+        self._next_cursor = cursor
+        self._pending_cursor = None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.ItemIsDropEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled | Qt.ItemNeverHasChildren
+
+    def supportedDropActions(self) -> Qt.DropActions:
+        return Qt.MoveAction
+
+    def mimeTypes(self) -> list[str]:
+        return [TASK_MIME_TYPE]
+
+    def mimeData(self, indexes: list[QModelIndex]) -> QMimeData:
+        mime = QMimeData()
+        for index in indexes:
+            task_id = self.data(index, TASK_ID_ROLE)
+            if task_id:
+                mime.setText(f"task:{task_id}")
+                break
+        return mime
+
+    def dropMimeData(
+        self,
+        data: QMimeData,
+        action: Qt.DropAction,
+        row: int,
+        column: int,
+        parent: QModelIndex,
+    ) -> bool:
+        if action != Qt.MoveAction or not data.hasText():
+            return False
+        task_id = task_id_from_text(data.text())
+        source = self._rows.get(task_id) if task_id is not None else None
+        if source is None:
+            return False
+        if row < 0:
+            row = parent.row() if parent.isValid() else len(self._tasks)
+        return self.move_row(source, row)
+
+    def set_tasks(
+        self,
+        tasks: list[TaskCardRow],
+        subtasks: dict[int, SubtaskSummary] | None = None,
+    ) -> None:
+        self.beginResetModel()
+        self._tasks = list(tasks)
+        self._subtasks = dict(subtasks or {})
+        self._reindex()
+        self.endResetModel()
+
+    def sync_tasks(
+        self,
+        tasks: list[TaskCardRow],
+        subtasks: dict[int, SubtaskSummary] | None = None,
+    ) -> set[int]:
+        """Reconcile the displayed rows with ``tasks`` keyed by task id.
+
+        Only rows that disappeared, appeared, changed position or changed
+        content (``updated_at`` or subtask progress) are touched; large diffs fall
+        back to a reset. Returns the ids of rows that were repainted.
+        """
+        subtasks = dict(subtasks or {})
+        target_ids = [task.id for task in tasks]
+        target_set = set(target_ids)
+        if None in target_set or len(target_set) != len(target_ids):
+            self.set_tasks(tasks, subtasks)
+            return set(target_set)
+
+        old_rows = dict(self._rows)
+        kept = [task_id for task_id in target_ids if task_id in old_rows]
+        stable = {kept[position] for position in increasing_run([old_rows[task_id] for task_id in kept])}
+        removed = sum(1 for task in self._tasks if task.id not in target_set)
+        if removed + len(tasks) - len(stable) > MAX_INCREMENTAL_CHANGES:
+            self.set_tasks(tasks, subtasks)
+            return set(target_set)
+
+        self._remove_missing(target_set)
+        for position, task in enumerate(tasks):
+            if task.id in stable:
+                continue
+            destination = self._rows[target_ids[position - 1]] + 1 if position else 0
+            source = self._rows.get(task.id)
+            if source is not None:
+                self.move_row(source, destination)
+                continue
+            self.beginInsertRows(QModelIndex(), destination, destination)
+            self._tasks.insert(destination, task)
+            self._reindex()
+            self.endInsertRows()
+
+        changed: set[int] = set()
+        previous_subtasks = self._subtasks
+        self._subtasks = subtasks
+        for row, task in enumerate(tasks):
+            current = self._tasks[row]
+            self._tasks[row] = task
+            if task.id not in old_rows:
+                continue
+            if (
+                current.updated_at != task.updated_at
+                or previous_subtasks.get(task.id) != subtasks.get(task.id)
+            ):
+                changed.add(task.id)
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+        return changed
+
+    def _remove_missing(self, keep: set[int]) -> None:
+        row = len(self._tasks) - 1
+        while row >= 0:
+            if self._tasks[row].id in keep:
+                row -= 1
+                continue
+            last = row
+            while row > 0 and self._tasks[row - 1].id not in keep:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row, last)
+            del self._tasks[row:last + 1]
+            self._reindex()
+            self.endRemoveRows()
+            row -= 1
+
+    def move_row(self, source: int, destination: int) -> bool:
+        """Move a row so it ends up in front of ``destination`` (pre-move numbering)."""
+        if not 0 <= source < len(self._tasks):
+            return False
+        destination = max(0, min(destination, len(self._tasks)))
+        if destination in (source, source + 1):
+            return False
+        if not self.beginMoveRows(QModelIndex(), source, source, QModelIndex(), destination):
+            return False
+        task = self._tasks.pop(source)
+        self._tasks.insert(destination - 1 if destination > source else destination, task)
+        self._reindex()
+        self.endMoveRows()
+        return True
+
+    def take_task(self, task_id: int) -> tuple[TaskCardRow, SubtaskSummary | None] | None:
+        """Remove one row and hand back its task and subtask summary."""
+        row = self._rows.get(task_id)
+        if row is None:
+            return None
+        self.beginRemoveRows(QModelIndex(), row, row)
+        task = self._tasks.pop(row)
+        subtasks = self._subtasks.pop(task_id, None)
+        self._reindex()
+        self.endRemoveRows()
+        return task, subtasks
+
+    def insert_task(self, row: int, task: TaskCardRow, subtasks: SubtaskSummary | None = None) -> None:
+        row = max(0, min(row, len(self._tasks)))
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._tasks.insert(row, task)
+        if subtasks is not None:
+            self._subtasks[task.id] = subtasks
+        self._reindex()
+        self.endInsertRows()
+
+    def replace_task(self, task: TaskCardRow) -> bool:
+        """Swap in a newer copy of a displayed task and repaint its row."""
+        row = self._rows.get(task.id)
+        if row is None:
+            return False
+        self._tasks[row] = task
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+        return True
+
+    def task_at(self, row: int) -> TaskCardRow | None:
+        if 0 <= row < len(self._tasks):
+            return self._tasks[row]
+        return None
+
+    def task_by_id(self, task_id: int | None) -> TaskCardRow | None:
+        row = self._rows.get(task_id) if task_id is not None else None
+        return self._tasks[row] if row is not None else None
+
+    def row_of(self, task_id: int | None) -> int:
+        if task_id is None:
+            return -1
+        return self._rows.get(task_id, -1)
+
+    def task_ids(self) -> list[int]:
+        return [task.id for task in self._tasks if task.id]
+
+    def _reindex(self) -> None:
+        self._rows = {task.id: row for row, task in enumerate(self._tasks) if task.id is not None}
+
+
+class TaskBoardModel:
+    """Kanban columns keyed by status, one ``TaskListModel`` each.
+
+    A card dropped on another column moves there at once; the saved task
+    replaces the moved copy when the update comes back, so the board is
+    not reloaded after every drop.
+    """
+
+    def __init__(self, columns: dict[str, TaskListModel]):
+        self.columns = columns
+
+    def load(self, board: TaskBoard) -> None:
+        for status, model in self.columns.items():
+            tasks = board.columns.get(status, [])
+            subtasks = {task.id: board.subtasks[task.id] for task in tasks if task.id in board.subtasks}
+            model.sync_tasks(tasks, subtasks)
+
+    def column_of(self, task_id: int) -> str | None:
+        return next((status for status, model in self.columns.items() if model.row_of(task_id) >= 0), None)
+
+    def move_card(self, task_id: int, status: str) -> bool:
+        """Move a card to the end of ``status``, where the repository puts a task whose status changed."""
+        source = self.column_of(task_id)
+        target = self.columns.get(status)
+        if source is None or source == status or target is None:
+            return False
+        task, subtasks = self.columns[source].take_task(task_id)
+        target.insert_task(target.rowCount(), replace(task, status=TaskStatus(status)), subtasks)
+        return True
+
+    def card_saved(self, task_id: int, task: TaskEntity | None) -> None:
+        """Apply the stored version of a moved card; a task that vanished leaves the board."""
+        source = self.column_of(task_id)
+        if source is None:
+            return
+        if task is None or task.status.value not in self.columns:
+            self.columns[source].take_task(task_id)
+            return
+        if task.status.value != source:
+            self.move_card(task_id, task.status.value)
+        self.columns[task.status.value].replace_task(TaskCardRow.from_entity(task))
@@ -1,21 +1,23 @@
 from __future__ import annotations
 
-from PySide6.QtCore import QMimeData, QSize, Qt
-from PySide6.QtGui import QDrag
+from PySide6.QtCore import QMimeData, QRect, QRectF, QSize, Qt
+from PySide6.QtGui import QColor, QDrag, QFont, QFontMetrics, QPainter, QPen
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QCheckBox,
     QHBoxLayout,
-    QLabel,
     QLineEdit,
+    QListView,
     QListWidget,
     QPushButton,
-    QSizePolicy,
-    QVBoxLayout,
+    QStyle,
+    QStyledItemDelegate,
     QWidget,
 )
 
-from app.domain.entities import SubtaskEntity, TaskEntity
+from app.domain.entities import SubtaskEntity, SubtaskSummary, TaskCardRow, TaskEntity
+
+from .task_model import SUBTASKS_ROLE, TASK_ROLE, TaskListModel, task_id_from_text
 
 STATUS_LABELS = {
     "inbox": "Вхідні",
@@ -40,102 +42,179 @@ PRIORITY_COLORS = {
 
 DROP_STATUSES = {"inbox", "in_progress", "done", "archived"}
 
+CARD_BACKGROUND = "#1B2230"
+CARD_BORDER = "#2B3647"
+CARD_SELECTED_BACKGROUND = "#233149"
+CARD_SELECTED_BORDER = "#3B82F6"
+CARD_TITLE_COLOR = "#E6EDF3"
+CARD_META_COLOR = "#94A3B8"
+CARD_PRIORITY_TEXT = "#0B1220"
+
 
 def _task_id_from_mime(mime: QMimeData) -> int | None:
     if not mime.hasText():
         return None
-    text = mime.text()
-    if not text.startswith("task:"):
-        return None
-    try:
-        return int(text.split(":", 1)[1])
-    except ValueError:
-        return None
+    return task_id_from_text(mime.text())
 
 
-class TaskItemWidget(QWidget):
-    def __init__(self, task: TaskEntity, subtask_titles: list[str] | None = None):
-        super().__init__()
-        self.task = task
-
-        self.setObjectName("TaskCard")
-        self.setAttribute(Qt.WA_StyledBackground, True)
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self.setMinimumHeight(64)
-
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(12, 8, 12, 8)
-        layout.setSpacing(4)
-
-        title_text = task.title.strip() if task.title else "Без назви"
-        title = QLabel(title_text)
-        title.setProperty("class", "task-title")
-        title.setWordWrap(True)
-        title.setMinimumWidth(0)
-        title.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-
-        meta_parts = []
-        if task.due_date:
-            meta_parts.append(f"Дедлайн: {task.due_date.strftime('%d.%m.%Y')}")
-        if task.tags:
-            meta_parts.append(f"Теги: {task.tags}")
-        if subtask_titles:
-            numbered = [
-                f"{index}) {title}" for index, title in enumerate(subtask_titles, start=1)
-            ]
-            meta_parts.append(f"Підзадачі: {'; '.join(numbered)}")
-
-        status_value = task.status.value if hasattr(task.status, "value") else str(task.status or "")
-        status_label = STATUS_LABELS.get(status_value, status_value)
-        if status_label:
-            meta_parts.append(f"Статус: {status_label}")
-
-        meta = QLabel(" | ".join(meta_parts) if meta_parts else "Без деталей")
-        meta.setProperty("class", "task-meta")
-        meta.setWordWrap(True)
-        meta.setMinimumWidth(0)
-        meta.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-
-        priority_label = next(
-            (label for label, value in PRIORITY_OPTIONS if value == task.priority),
-            "Невідомо",
-        )
-        priority = QLabel(priority_label)
-        priority.setProperty("class", "task-priority")
-        priority.setStyleSheet(
-            f"background-color: {PRIORITY_COLORS.get(task.priority, '#9CA3AF')};"
-        )
-        priority.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+def priority_label(priority: int) -> str:
+    return next(
+        (label for label, value in PRIORITY_OPTIONS if value == priority),
+        "Невідомо",
+    )
 
-        header = QHBoxLayout()
-        header.setSpacing(8)
-        header.addWidget(title, 1)
-        header.addWidget(priority, 0, Qt.AlignTop)
 
-        layout.addLayout(header)
-        layout.addWidget(meta)
+def task_meta_text(task: TaskEntity | TaskCardRow, subtasks: SubtaskSummary | None = None) -> str:
+    meta_parts = []
+    if task.due_date:
+        meta_parts.append(f"Дедлайн: {task.due_date.strftime('%d.%m.%Y')}")
+    if task.tags:
+        meta_parts.append(f"Теги: {task.tags}")
+    if subtasks and subtasks.total:
+        numbered = [f"{index}) {title}" for index, title in enumerate(subtasks.titles, start=1)]
+        if subtasks.total > len(subtasks.titles):
+            numbered.append("…")
+        meta_parts.append(f"Підзадачі {subtasks.done}/{subtasks.total}: {'; '.join(numbered)}")
 
-    def set_selected(self, selected: bool) -> None:
-        self.setProperty("selected", selected)
-        self.style().unpolish(self)
-        self.style().polish(self)
+    status_value = task.status.value if hasattr(task.status, "value") else str(task.status or "")
+    status_label = STATUS_LABELS.get(status_value, status_value)
+    if status_label:
+        meta_parts.append(f"Статус: {status_label}")
 
+    return " | ".join(meta_parts) if meta_parts else "Без деталей"
 
-class TaskItemContainer(QWidget):
-    def __init__(self, task_widget: TaskItemWidget, h_margin: int = 12, parent=None):
-        super().__init__(parent)
-        self.task_widget = task_widget
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(h_margin, 0, h_margin, 0)
-        layout.setSpacing(0)
-        layout.addWidget(task_widget)
 
-    @property
-    def task(self) -> TaskEntity:
-        return self.task_widget.task
+class TaskCardDelegate(QStyledItemDelegate):
+    """Paints task cards straight from the model, so rows cost nothing until shown."""
 
-    def set_selected(self, selected: bool) -> None:
-        self.task_widget.set_selected(selected)
+    h_margin = 12
+    padding_x = 12
+    padding_y = 8
+    spacing = 4
+    header_spacing = 8
+    pill_padding_x = 8
+    pill_padding_y = 2
+    min_height = 64
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._height_cache: dict[tuple[str, str, int], int] = {}
+        self._cache_width = -1
+
+    def sizeHint(self, option, index) -> QSize:  # type: ignore[override]
+        task = index.data(TASK_ROLE)
+        width = self._available_width(option)
+        if task is None:
+            return QSize(width, self.min_height)
+        if width != self._cache_width:
+            self._height_cache.clear()
+            self._cache_width = width
+
+        title = self._title_text(task)
+        meta = task_meta_text(task, index.data(SUBTASKS_ROLE))
+        key = (title, meta, task.priority)
+        height = self._height_cache.get(key)
+        if height is None:
+            height = self._layout(QRect(0, 0, width, 0), option.font, task, title, meta)["height"]
+            self._height_cache[key] = height
+        return QSize(width, height)
+
+    def paint(self, painter: QPainter, option, index) -> None:  # type: ignore[override]
+        task = index.data(TASK_ROLE)
+        if task is None:
+            super().paint(painter, option, index)
+            return
+
+        title = self._title_text(task)
+        meta = task_meta_text(task, index.data(SUBTASKS_ROLE))
+        layout = self._layout(option.rect, option.font, task, title, meta)
+        selected = bool(option.state & QStyle.State_Selected)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, True)
+
+        card = QRectF(layout["card"]).adjusted(0.5, 0.5, -0.5, -0.5)
+        painter.setPen(QPen(QColor(CARD_SELECTED_BORDER if selected else CARD_BORDER), 1))
+        painter.setBrush(QColor(CARD_SELECTED_BACKGROUND if selected else CARD_BACKGROUND))
+        painter.drawRoundedRect(card, 14, 14)
+
+        painter.setFont(layout["title_font"])
+        painter.setPen(QColor(CARD_TITLE_COLOR))
+        painter.drawText(layout["title"], Qt.TextWordWrap | Qt.AlignLeft | Qt.AlignTop, title)
+
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(PRIORITY_COLORS.get(task.priority, "#9CA3AF")))
+        painter.drawRoundedRect(QRectF(layout["pill"]), 10, 10)
+        painter.setFont(layout["meta_font"])
+        painter.setPen(QColor(CARD_PRIORITY_TEXT))
+        painter.drawText(layout["pill"], Qt.AlignCenter, priority_label(task.priority))
+
+        painter.setPen(QColor(CARD_META_COLOR))
+        painter.drawText(layout["meta"], Qt.TextWordWrap | Qt.AlignLeft | Qt.AlignTop, meta)
+
+        painter.restore()
+
+    def _available_width(self, option) -> int:
+        view = self.parent()
+        if isinstance(view, QAbstractItemView):
+            return max(view.viewport().width(), 0)
+        return max(option.rect.width(), 0)
+
+    @staticmethod
+    def _title_text(task: TaskCardRow) -> str:
+        return task.title.strip() if task.title else "Без назви"
+
+    def _layout(self, rect: QRect, base_font: QFont, task: TaskCardRow, title: str, meta: str) -> dict:
+        title_font = QFont(base_font)
+        title_font.setPixelSize(14)
+        title_font.setBold(True)
+        meta_font = QFont(base_font)
+        meta_font.setPixelSize(11)
+        title_metrics = QFontMetrics(title_font)
+        meta_metrics = QFontMetrics(meta_font)
+
+        card_left = rect.left() + self.h_margin
+        card_width = max(rect.width() - 2 * self.h_margin, 0)
+        content_left = card_left + self.padding_x
+        content_top = rect.top() + self.padding_y
+        content_width = max(card_width - 2 * self.padding_x, 1)
+
+        pill_text = priority_label(task.priority)
+        pill_width = meta_metrics.horizontalAdvance(pill_text) + 2 * self.pill_padding_x
+        pill_height = meta_metrics.height() + 2 * self.pill_padding_y
+        title_width = max(content_width - pill_width - self.header_spacing, 1)
+
+        title_height = title_metrics.boundingRect(
+            QRect(0, 0, title_width, 0xFFFF), Qt.TextWordWrap, title
+        ).height()
+        meta_height = meta_metrics.boundingRect(
+            QRect(0, 0, content_width, 0xFFFF), Qt.TextWordWrap, meta
+        ).height()
+        header_height = max(title_height, pill_height)
+
+        height = max(
+            self.padding_y * 2 + header_height + self.spacing + meta_height,
+            self.min_height,
+        )
+        return {
+            "height": height,
+            "card": QRect(card_left, rect.top(), card_width, height),
+            "title": QRect(content_left, content_top, title_width, title_height),
+            "pill": QRect(
+                content_left + content_width - pill_width,
+                content_top,
+                pill_width,
+                pill_height,
+            ),
+            "meta": QRect(
+                content_left,
+                content_top + header_height + self.spacing,
+                content_width,
+                meta_height,
+            ),
+            "title_font": title_font,
+            "meta_font": meta_font,
+        }
 
 
 class SubtaskItemWidget(QWidget):
@@ -189,12 +268,20 @@ class SubtaskItemWidget(QWidget):
         self._on_delete(self.subtask_id)
 
 
-class TaskListWidget(QListWidget):
+class TaskListWidget(QListView):
     def __init__(self, on_reorder=None, parent=None):
         super().__init__(parent)
         self._on_reorder = on_reorder
         self._h_margin = 12
         self._v_margin = 8
+        self.setModel(TaskListModel(self))
+        self.setItemDelegate(TaskCardDelegate(self))
+        # Shift/Ctrl-click picks several tasks for the batch actions.
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setResizeMode(QListView.Adjust)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(200)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
         self.setDragEnabled(True)
         self.setAcceptDrops(True)
         self.setDropIndicatorShown(True)
@@ -203,34 +290,36 @@ class TaskListWidget(QListWidget):
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self._update_viewport_margins()
 
+    def task_model(self) -> TaskListModel:
+        return self.model()
+
     def resizeEvent(self, event) -> None:  # type: ignore[override]
         super().resizeEvent(event)
-        self.sync_item_sizes()
+        self._update_viewport_margins()
 
     def _update_viewport_margins(self) -> None:
         scrollbar_width = self.verticalScrollBar().width() or self.verticalScrollBar().sizeHint().width()
         right_margin = self._h_margin + (scrollbar_width if self.verticalScrollBar().isVisible() else 0)
         self.setViewportMargins(self._h_margin, self._v_margin, right_margin, self._v_margin)
 
-    def sync_item_sizes(self) -> None:
-        self._update_viewport_margins()
-        viewport_width = self.viewport().width()
-        for index in range(self.count()):
-            item = self.item(index)
-            widget = self.itemWidget(item)
-            if widget:
-                widget.setMinimumWidth(viewport_width)
-                widget.setMaximumWidth(viewport_width)
-                widget.adjustSize()
-                hint = widget.sizeHint()
-                item.setSizeHint(QSize(viewport_width, hint.height()))
-                widget.resize(viewport_width, hint.height())
+    def current_task_id(self) -> int | None:
+        index = self.currentIndex()
+        return index.data(Qt.UserRole) if index.isValid() else None
+
+    def selected_task_ids(self) -> list[int]:
+        """Selected task ids in list order."""
+        rows = sorted(index.row() for index in self.selectionModel().selectedIndexes())
+        return [self.task_model().index(row).data(Qt.UserRole) for row in rows]
+
+    def set_current_task(self, task_id: int | None) -> bool:
+        row = self.task_model().row_of(task_id)
+        if row < 0:
+            return False
+        self.setCurrentIndex(self.task_model().index(row))
+        return True
 
     def startDrag(self, supportedActions: Qt.DropActions) -> None:  # type: ignore[name-defined]
-        item = self.currentItem()
-        if not item:
-            return
-        task_id = item.data(Qt.UserRole)
+        task_id = self.current_task_id()
         if not task_id:
             return
         mime = QMimeData()
@@ -240,10 +329,12 @@ class TaskListWidget(QListWidget):
         drag.exec(Qt.MoveAction)
 
     def dropEvent(self, event) -> None:  # type: ignore[override]
-        super().dropEvent(event)
-        if self._on_reorder:
-            ids = [self.item(i).data(Qt.UserRole) for i in range(self.count())]
-            ids = [task_id for task_id in ids if task_id]
+        # Skip QListView's selection-based internal move: the model relocates
+        # the dragged row itself in dropMimeData.
+        before = self.task_model().task_ids()
+        QAbstractItemView.dropEvent(self, event)
+        ids = self.task_model().task_ids()
+        if ids != before and self._on_reorder:
             self._on_reorder(ids)
 
     def set_reorder_enabled(self, enabled: bool) -> None:
@@ -282,64 +373,27 @@ class FilterListWidget(QListWidget):
             event.acceptProposedAction()
 
 
-class KanbanListWidget(QListWidget):
+class KanbanListWidget(TaskListWidget):
+    """Board column; reorders its own cards and hands cards from other columns to ``on_drop_status``."""
+
     def __init__(self, status_key: str, on_drop_status, on_reorder, parent=None):
-        super().__init__(parent)
+        super().__init__(on_reorder, parent)
         self.status_key = status_key
         self._on_drop_status = on_drop_status
-        self._on_reorder = on_reorder
-        self._h_margin = 12
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
         self._v_margin = 10
-        self.setAcceptDrops(True)
-        self.setDragEnabled(True)
-        self.setDropIndicatorShown(True)
-        self.setDragDropMode(QAbstractItemView.InternalMove)
-        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self._update_viewport_margins()
-
-    def resizeEvent(self, event) -> None:  # type: ignore[override]
-        super().resizeEvent(event)
-        self.sync_item_sizes()
-
-    def _update_viewport_margins(self) -> None:
-        scrollbar_width = self.verticalScrollBar().width() or self.verticalScrollBar().sizeHint().width()
-        right_margin = self._h_margin + (scrollbar_width if self.verticalScrollBar().isVisible() else 0)
-        self.setViewportMargins(self._h_margin, self._v_margin, right_margin, self._v_margin)
-
-    def sync_item_sizes(self) -> None:
         self._update_viewport_margins()
-        viewport_width = self.viewport().width()
-        for index in range(self.count()):
-            item = self.item(index)
-            widget = self.itemWidget(item)
-            if widget:
-                widget.setMinimumWidth(viewport_width)
-                widget.setMaximumWidth(viewport_width)
-                widget.adjustSize()
-                hint = widget.sizeHint()
-                item.setSizeHint(QSize(viewport_width, hint.height()))
-                widget.resize(viewport_width, hint.height())
-
-    def startDrag(self, supportedActions: Qt.DropActions) -> None:  # type: ignore[name-defined]
-        item = self.currentItem()
-        if not item:
-            return
-        task_id = item.data(Qt.UserRole)
-        if not task_id:
-            return
-        mime = QMimeData()
-        mime.setText(f"task:{task_id}")
-        drag = QDrag(self)
-        drag.setMimeData(mime)
-        drag.exec(Qt.MoveAction)
 
     def dragEnterEvent(self, event) -> None:  # type: ignore[override]
-        if _task_id_from_mime(event.mimeData()) is not None:
+        if event.source() is self:
+            super().dragEnterEvent(event)
+        elif _task_id_from_mime(event.mimeData()) is not None:
             event.acceptProposedAction()
 
     def dragMoveEvent(self, event) -> None:  # type: ignore[override]
-        if _task_id_from_mime(event.mimeData()) is not None:
+        if event.source() is self:
+            super().dragMoveEvent(event)
+        elif _task_id_from_mime(event.mimeData()) is not None:
             event.acceptProposedAction()
 
     def dropEvent(self, event) -> None:  # type: ignore[override]
@@ -348,10 +402,4 @@ class KanbanListWidget(QListWidget):
             self._on_drop_status(task_id, self.status_key)
             event.acceptProposedAction()
             return
-
         super().dropEvent(event)
-        self._on_reorder(self._current_ids())
-
-    def _current_ids(self) -> list[int]:
-        ids = [self.item(i).data(Qt.UserRole) for i in range(self.count())]
-        return [task_id for task_id in ids if task_id]
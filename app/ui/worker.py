@@ -0,0 +1,349 @@
+from __future__ import annotations
+
+import itertools
+import logging
+import threading
+from typing import Any, Callable, Hashable
+
+from PySide6.QtCore import QCoreApplication, QEvent, QObject, QRunnable, QThreadPool, QTimer, Signal
+
+logger = logging.getLogger(__name__)
+
+
+class _JobSignals(QObject):
+    finished = Signal(int, object)
+    failed = Signal(int, object)
+
+
+class _Job(QRunnable):
+    def __init__(self, job_id: int, fn: Callable, args: tuple, kwargs: dict):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.job_id = job_id
+        self.signals = _JobSignals()
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+
+    def run(self) -> None:
+        try:
+            result = self._fn(*self._args, **self._kwargs)
+        except Exception as exc:  # noqa: BLE001
+            self.signals.failed.emit(self.job_id, exc)
+        else:
+            self.signals.finished.emit(self.job_id, result)
+
+
+class ProgressRelay(QObject):
+    """Carries progress counts from a worker-thread callback to GUI-thread slots."""
+
+    progressed = Signal(int)
+
+
+class DbWorker(QObject):
+    """Runs blocking service calls off the GUI thread, one at a time and in order.
+
+    A single thread keeps writes and the reads that follow them ordered.
+    Callbacks run back on the GUI thread.
+    """
+
+    busy_changed = Signal(bool)
+    failed = Signal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._ids = itertools.count(1)
+        self._jobs: dict[int, tuple[_Job, Callable | None, Callable | None]] = {}
+        self._cancelled: dict[int, _Job] = {}
+
+    def submit(
+        self,
+        fn: Callable,
+        *args: Any,
+        on_done: Callable[[Any], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+        **kwargs: Any,
+    ) -> int:
+        job = _Job(next(self._ids), fn, args, kwargs)
+        job.signals.finished.connect(self._on_finished)
+        job.signals.failed.connect(self._on_failed)
+        was_idle = not self._jobs
+        self._jobs[job.job_id] = (job, on_done, on_error)
+        self._pool.start(job)
+        if was_idle:
+            self.busy_changed.emit(True)
+        return job.job_id
+
+    def cancel(self, job_id: int) -> bool:
+        """Drop a job that has not started yet; running jobs finish but report nothing."""
+        entry = self._jobs.pop(job_id, None)
+        if entry is None:
+            return False
+        removed = self._pool.tryTake(entry[0])
+        if not removed:
+            # Still running: keep the runnable alive until it reports back.
+            self._cancelled[job_id] = entry[0]
+        self._emit_idle()
+        return removed
+
+    def is_busy(self) -> bool:
+        return bool(self._jobs)
+
+    def wait(self, msecs: int = -1) -> bool:
+        return self._pool.waitForDone(msecs)
+
+    def drain(self) -> None:
+        """Finish every queued job and run its callbacks, including jobs those callbacks queue."""
+        while self._jobs or self._cancelled:
+            self._pool.waitForDone()
+            QCoreApplication.sendPostedEvents(self, QEvent.MetaCall)
+
+    def after_pending(self, callback: Callable[[], None]) -> int:
+        """Call ``callback`` on the GUI thread once every job queued so far has finished."""
+        return self.submit(_noop, on_done=lambda _: callback(), on_error=lambda _: callback())
+
+    def _on_finished(self, job_id: int, result: object) -> None:
+        self._cancelled.pop(job_id, None)
+        entry = self._jobs.pop(job_id, None)
+        self._emit_idle()
+        if entry and entry[1]:
+            entry[1](result)
+
+    def _on_failed(self, job_id: int, exc: object) -> None:
+        self._cancelled.pop(job_id, None)
+        entry = self._jobs.pop(job_id, None)
+        self._emit_idle()
+        if entry is None:
+            return
+        if entry[2]:
+            entry[2](exc)
+            return
+        logger.error("Background job failed", exc_info=exc)
+        self.failed.emit(exc)
+
+    def _emit_idle(self) -> None:
+        if not self._jobs:
+            self.busy_changed.emit(False)
+
+
+def _noop() -> None:
+    return None
+
+
+class _ExportJob(QRunnable):
+    def __init__(self, queue: "ExportQueue", job_id: int, key: Hashable):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.job_id = job_id
+        self.key = key
+        self.signals = _JobSignals()
+        self._queue = queue
+
+    def run(self) -> None:
+        fn, args, kwargs = self._queue._start(self.key)
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as exc:  # noqa: BLE001
+            self.signals.failed.emit(self.job_id, (self.key, exc))
+        else:
+            self.signals.finished.emit(self.job_id, (self.key, result))
+
+
+class ExportQueue(QObject):
+    """Single background thread for file exports, separate from database work.
+
+    Jobs are keyed (for example by target path). Enqueuing a key that is
+    still waiting replaces its arguments instead of adding a second write,
+    so a slow export target only ever sees the latest content.
+    """
+
+    busy_changed = Signal(bool)
+    finished = Signal(object, object)
+    failed = Signal(object, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._lock = threading.Lock()
+        self._pending: dict[Hashable, tuple[Callable, tuple, dict]] = {}
+        self._callbacks: dict[Hashable, list[tuple[Callable | None, Callable | None]]] = {}
+        self._ids = itertools.count(1)
+        self._jobs: dict[int, _ExportJob] = {}
+
+    def enqueue(
+        self,
+        key: Hashable,
+        fn: Callable,
+        *args: Any,
+        on_done: Callable[[Any], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+        **kwargs: Any,
+    ) -> bool:
+        """Queue ``fn`` under ``key``; returns False when it was merged into a waiting job."""
+        with self._lock:
+            coalesced = key in self._pending
+            self._pending[key] = (fn, args, kwargs)
+        if on_done or on_error:
+            self._callbacks.setdefault(key, []).append((on_done, on_error))
+        if coalesced:
+            return False
+        job = _ExportJob(self, next(self._ids), key)
+        job.signals.finished.connect(self._on_finished)
+        job.signals.failed.connect(self._on_failed)
+        was_idle = not self._jobs
+        self._jobs[job.job_id] = job
+        self._pool.start(job)
+        if was_idle:
+            self.busy_changed.emit(True)
+        return True
+
+    def is_busy(self) -> bool:
+        return bool(self._jobs)
+
+    def flush(self, msecs: int = -1) -> bool:
+        """Block until queued exports are written and their results delivered."""
+        done = self._pool.waitForDone(msecs)
+        QCoreApplication.sendPostedEvents(self, QEvent.MetaCall)
+        return done
+
+    def _start(self, key: Hashable) -> tuple[Callable, tuple, dict]:
+        with self._lock:
+            return self._pending.pop(key)
+
+    def _on_finished(self, job_id: int, payload: tuple) -> None:
+        key, result = payload
+        for on_done, _on_error in self._finish(job_id, key):
+            if on_done:
+                on_done(result)
+        self.finished.emit(key, result)
+
+    def _on_failed(self, job_id: int, payload: tuple) -> None:
+        key, exc = payload
+        logger.error("Export %r failed", key, exc_info=exc)
+        for _on_done, on_error in self._finish(job_id, key):
+            if on_error:
+                on_error(exc)
+        self.failed.emit(key, exc)
+
+    def _finish(self, job_id: int, key: Hashable) -> list[tuple[Callable | None, Callable | None]]:
+        self._jobs.pop(job_id, None)
+        if not self._jobs:
+            self.busy_changed.emit(False)
+        with self._lock:
+            if key in self._pending:
+                # A newer request for this key is queued; its callers hear from that run.
+                return []
+        return self._callbacks.pop(key, [])
+
+
+class DebouncedQuery(QObject):
+    """Coalesces bursts of requests and applies only the newest generation's result."""
+
+    busy_changed = Signal(bool)
+
+    def __init__(
+        self,
+        worker: DbWorker,
+        query: Callable[..., Any],
+        on_result: Callable[..., None],
+        delay_ms: int = 250,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._worker = worker
+        self._query = query
+        self._on_result = on_result
+        self._generation = 0
+        self._pending_job: int | None = None
+        self._args: tuple = ()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self._fire)
+
+    def schedule(self, *args: Any) -> None:
+        self._args = args
+        self._timer.start()
+
+    def run_now(self, *args: Any) -> None:
+        self._args = args
+        self._timer.stop()
+        self._fire()
+
+    def invalidate(self) -> None:
+        """Forget queued and in-flight queries; their results will be ignored."""
+        self._timer.stop()
+        self._generation += 1
+        if self._pending_job is not None:
+            self._worker.cancel(self._pending_job)
+            self._pending_job = None
+            self.busy_changed.emit(False)
+
+    def _fire(self) -> None:
+        self.invalidate()
+        generation = self._generation
+        args = self._args
+        self._pending_job = self._worker.submit(
+            self._query,
+            *args,
+            on_done=lambda result: self._deliver(generation, args, result),
+            on_error=lambda exc: self._fail(generation, exc),
+        )
+        self.busy_changed.emit(True)
+
+    def _deliver(self, generation: int, args: tuple, result: Any) -> None:
+        if generation != self._generation:
+            return
+        self._pending_job = None
+        self.busy_changed.emit(False)
+        self._on_result(*args, result)
+
+    def _fail(self, generation: int, exc: Exception) -> None:
+        if generation != self._generation:
+            return
+        self._pending_job = None
+        self.busy_changed.emit(False)
+        logger.error("Background query failed", exc_info=exc)
+        self._worker.failed.emit(exc)
+
+
+class AsyncTaskService:
+    """``TaskService`` facade whose calls run on a ``DbWorker``.
+
+    ``async_service.update_task(task_id, data, on_done=...)`` queues
+    ``service.update_task`` and returns the job id straight away; ``run``
+    queues a function that needs several service calls as a single job.
+    """
+
+    def __init__(self, service: Any, worker: DbWorker):
+        self.service = service
+        self.worker = worker
+
+    def __getattr__(self, name: str) -> Callable[..., int]:
+        method = getattr(self.service, name)
+        if not callable(method):
+            raise AttributeError(name)
+
+        def submit(
+            *args: Any,
+            on_done: Callable[[Any], None] | None = None,
+            on_error: Callable[[Exception], None] | None = None,
+            **kwargs: Any,
+        ) -> int:
+            return self.worker.submit(method, *args, on_done=on_done, on_error=on_error, **kwargs)
+
+        return submit
+
+    def run(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        on_done: Callable[[Any], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+        **kwargs: Any,
+    ) -> int:
+        """Queue ``fn(service, *args, **kwargs)``."""
+        return self.worker.submit(fn, self.service, *args, on_done=on_done, on_error=on_error, **kwargs)
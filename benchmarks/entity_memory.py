@@ -0,0 +1,110 @@
+"""Measure bytes per task entity held by the list, board and caches.
+
+Builds synthetic entities the way the repository does (a fresh string for
+every column value) and compares a dict-backed dataclass with the slotted
+entities and the card projection, with and without interned tags:
+
+    python benchmarks/entity_memory.py --count 50000
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import random
+import sys
+import tracemalloc
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.domain.entities import TaskCardRow, TaskEntity  # noqa: E402
+from app.domain.enums import TaskStatus  # noqa: E402
+
+TAGS = ["", "work", "home", "work, urgent", "errands", "health, weekly", "finance"]
+STATUSES = list(TaskStatus)
+
+# Same fields as TaskEntity, but with a per-instance __dict__ like before.
+DictTaskEntity = dataclasses.make_dataclass(
+    "DictTaskEntity",
+    [(field.name, field.type) for field in dataclasses.fields(TaskEntity)],
+    frozen=True,
+)
+
+
+def _fresh(value: str) -> str:
+    # A database driver hands back a new str object per row.
+    return "".join(list(value))
+
+
+def _rows(count: int) -> list[dict]:
+    rng = random.Random(7)
+    now = datetime(2026, 1, 1, 9, 0)
+    return [
+        {
+            "id": index,
+            "title": f"Task {index}",
+            "description": "",
+            "status": rng.choice(STATUSES),
+            "priority": rng.randint(1, 4),
+            "due_date": None if index % 3 == 0 else date(2026, 1, 1) + timedelta(days=index % 90),
+            "tags": rng.choice(TAGS),
+            "created_at": now,
+            "updated_at": now,
+            "completed_at": None,
+            "recurrence_rule": None,
+            "recurrence_interval": 1,
+            "recurrence_end_date": None,
+            "archived_at": None,
+            "sort_order": index,
+            "series_id": None,
+            "series_start": None,
+        }
+        for index in range(count)
+    ]
+
+
+def _measure(rows: list[dict], build: Callable[[dict], object]) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [build(row) for row in rows]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del entities
+    return (after - before) / len(rows)
+
+
+def _copy(row: dict, intern: bool = False) -> dict:
+    tags = _fresh(row["tags"])
+    return {**row, "title": _fresh(row["title"]), "tags": sys.intern(tags) if intern else tags}
+
+
+def _card(row: dict) -> TaskCardRow:
+    return TaskCardRow(**{field.name: row[field.name] for field in dataclasses.fields(TaskCardRow)})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=50_000, help="entities to build per variant")
+    args = parser.parse_args()
+
+    rows = _rows(args.count)
+    variants: dict[str, Callable[[dict], object]] = {
+        "dict dataclass": lambda row: DictTaskEntity(**_copy(row)),
+        "slotted TaskEntity": lambda row: TaskEntity(**_copy(row)),
+        "slotted + interned tags": lambda row: TaskEntity(**_copy(row, intern=True)),
+        "TaskCardRow + interned tags": lambda row: _card(_copy(row, intern=True)),
+    }
+
+    print(f"{args.count} entities\n")
+    baseline = None
+    for name, build in variants.items():
+        per_entity = _measure(rows, build)
+        baseline = baseline or per_entity
+        print(f"{name:30} {per_entity:8.1f} bytes/entity  {per_entity / baseline:6.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Compare query plans for the hot task queries with and without the 0005 indexes.
+
+Synthetic rows are inserted inside a transaction that is always rolled back,
+so the script is safe to point at a development database migrated to head:
+
+    python benchmarks/explain_indexes.py --rows 50000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from sqlalchemy import insert, select  # noqa: E402
+
+from app.domain.filters import TaskFilters  # noqa: E402
+from app.infra.db import engine  # noqa: E402
+from app.infra.models import TaskModel  # noqa: E402
+from app.infra.repository import (  # noqa: E402
+    STATUS_ARCHIVED,
+    STATUS_DONE,
+    _max_sort_order_statement,
+    _page_statement,
+)
+
+NEW_INDEXES = [
+    "ix_tasks_status_sort_order",
+    "ix_tasks_due_date",
+    "ix_tasks_open_due_date",
+    "ix_tasks_list_order",
+]
+STATUSES = ["inbox", "in_progress", "done", "archived"]
+
+
+def _queries() -> dict[str, object]:
+    today = date.today()
+    return {
+        "list all (first page)": _page_statement(TaskFilters("all"), None, 201),
+        "list inbox (first page)": _page_statement(TaskFilters("inbox"), None, 201),
+        "list overdue": _page_statement(TaskFilters("overdue"), None, 201),
+        "list upcoming": _page_statement(TaskFilters("upcoming"), None, 201),
+        "list due on date": _page_statement(TaskFilters("all", due_on=today), None, 201),
+        "next sort order": _max_sort_order_statement("inbox"),
+        "due reminders": select(TaskModel)
+        .where(
+            TaskModel.due_date.is_not(None),
+            TaskModel.due_date <= today,
+            TaskModel.status.notin_([STATUS_DONE, STATUS_ARCHIVED]),
+        )
+        .order_by(TaskModel.due_date.asc()),
+    }
+
+
+def _seed(connection, rows: int) -> None:
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    today = date.today()
+    batch = []
+    for index in range(rows):
+        status = rng.choices(STATUSES, weights=[3, 1, 5, 3])[0]
+        batch.append(
+            {
+                "title": f"Benchmark task {index}",
+                "description": "",
+                "status": status,
+                "priority": rng.randint(1, 4),
+                "due_date": None if rng.random() < 0.4 else today + timedelta(days=rng.randint(-120, 120)),
+                "tags": "",
+                "created_at": now - timedelta(minutes=index),
+                "updated_at": now,
+                "recurrence_interval": 1,
+                "sort_order": index,
+            }
+        )
+        if len(batch) == 5000:
+            connection.execute(insert(TaskModel), batch)
+            batch = []
+    if batch:
+        connection.execute(insert(TaskModel), batch)
+    connection.exec_driver_sql("ANALYZE tasks")
+
+
+def _plan_nodes(plan: dict) -> list[str]:
+    node = plan["Node Type"]
+    if plan.get("Index Name"):
+        node = f"{node} ({plan['Index Name']})"
+    nodes = [node]
+    for child in plan.get("Plans", []):
+        nodes.extend(_plan_nodes(child))
+    return nodes
+
+
+def _explain(connection, stmt) -> tuple[list[str], float]:
+    compiled = stmt.compile(dialect=connection.dialect, compile_kwargs={"render_postcompile": True})
+    result = connection.exec_driver_sql(
+        f"EXPLAIN (ANALYZE, FORMAT JSON) {compiled}",
+        compiled.params,
+    ).scalar_one()
+    report = result[0]
+    return _plan_nodes(report["Plan"]), float(report["Execution Time"])
+
+
+def _explain_all(connection) -> dict[str, tuple[list[str], float]]:
+    return {name: _explain(connection, stmt) for name, stmt in _queries().items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000, help="synthetic tasks to insert")
+    args = parser.parse_args()
+
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            existing = set(
+                connection.exec_driver_sql(
+                    "SELECT indexname FROM pg_indexes WHERE tablename = 'tasks'"
+                ).scalars()
+            )
+            missing = [name for name in NEW_INDEXES if name not in existing]
+            if missing:
+                raise SystemExit(f"Run `alembic upgrade head` first, missing: {', '.join(missing)}")
+
+            _seed(connection, args.rows)
+            indexed = _explain_all(connection)
+
+            for name in NEW_INDEXES:
+                connection.exec_driver_sql(f"DROP INDEX {name}")
+            connection.exec_driver_sql("CREATE INDEX ix_tasks_status ON tasks (status)")
+            connection.exec_driver_sql("ANALYZE tasks")
+            baseline = _explain_all(connection)
+        finally:
+            transaction.rollback()
+
+    print(f"{args.rows} synthetic tasks\n")
+    for name in indexed:
+        before_nodes, before_ms = baseline[name]
+        after_nodes, after_ms = indexed[name]
+        print(name)
+        print(f"  before: {before_ms:8.2f} ms  {' > '.join(before_nodes)}")
+        print(f"  after:  {after_ms:8.2f} ms  {' > '.join(after_nodes)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""ICS file size and export time with one event per task versus one RRULE event per recurring series.
+
+Builds synthetic tasks in memory: recurring series with a year of
+instances behind them (all completed but the latest) next to one-off
+tasks. Each variant renders the calendar and writes it to a temporary
+directory; the series variant also times a re-export after one task
+changed, which re-renders only that task's event:
+
+    python benchmarks/ics_recurrence.py --series 300 --days 365 --plain 2000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.domain.entities import TaskEntity  # noqa: E402
+from app.domain.enums import RecurrenceRule, TaskStatus  # noqa: E402
+from app.domain.recurrence import Recurrence, occurrences  # noqa: E402
+from app.services.ics import (  # noqa: E402
+    CALENDAR_FOOTER,
+    CALENDAR_HEADER,
+    CRLF,
+    IcsExporter,
+    render_event,
+    write_atomic,
+    write_document,
+)
+
+RULES = list(RecurrenceRule)
+NOW = datetime(2026, 1, 1, 9, 0)
+
+
+def _tasks(series: int, days: int, plain: int) -> list[TaskEntity]:
+    rng = random.Random(3)
+    today = date(2026, 1, 1)
+    tasks: list[TaskEntity] = []
+
+    def add(**fields) -> TaskEntity:
+        task = TaskEntity(
+            id=len(tasks) + 1,
+            description="Синтетична задача для вимірювання експорту календаря",
+            priority=rng.randint(1, 4),
+            tags="",
+            created_at=NOW,
+            updated_at=NOW,
+            completed_at=None,
+            archived_at=None,
+            sort_order=len(tasks) + 1,
+            **fields,
+        )
+        tasks.append(task)
+        return task
+
+    for index in range(series):
+        rule = rng.choice(RULES).value
+        interval = rng.randint(1, 2)
+        start = today - timedelta(days=days)
+        dues = [start, *occurrences(Recurrence(start, rule, interval), today)]
+        first = None
+        for position, due in enumerate(dues):
+            task = add(
+                title=f"Повторювана задача {index}",
+                status=TaskStatus.INBOX if position == len(dues) - 1 else TaskStatus.DONE,
+                due_date=due,
+                recurrence_rule=rule,
+                recurrence_interval=interval,
+                recurrence_end_date=None,
+                series_id=first.id if first else None,
+            )
+            first = first or task
+    for index in range(plain):
+        add(
+            title=f"Задача {index}",
+            status=TaskStatus.INBOX,
+            due_date=today + timedelta(days=rng.randint(-30, 90)),
+            recurrence_rule=None,
+            recurrence_interval=1,
+            recurrence_end_date=None,
+        )
+    return tasks
+
+
+class _Service:
+    """Answers the two calls the exporter makes, from a list in memory."""
+
+    def __init__(self, tasks: list[TaskEntity]) -> None:
+        self.tasks = {task.id: task for task in tasks}
+
+    def list_due_stamps(self) -> dict[int, tuple[datetime, int | None]]:
+        return {
+            task.id: (task.updated_at, task.series_key if task.recurrence_rule else None)
+            for task in self.tasks.values()
+            if task.due_date
+        }
+
+    def get_tasks(self, task_ids: list[int]) -> list[TaskEntity]:
+        return [self.tasks[task_id] for task_id in task_ids]
+
+
+def _timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - started) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--series", type=int, default=300, help="recurring series")
+    parser.add_argument("--days", type=int, default=365, help="days of instance history per series")
+    parser.add_argument("--plain", type=int, default=2000, help="one-off tasks")
+    args = parser.parse_args()
+
+    tasks = _tasks(args.series, args.days, args.plain)
+    service = _Service(tasks)
+    print(f"{len(tasks)} tasks: {args.series} series over {args.days} days, {args.plain} one-off\n")
+    print(f"{'':22} {'events':>8} {'size':>10} {'render':>10} {'write':>10}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "per_task.ics"
+        content, render_ms = _timed(
+            lambda: CRLF.join([CALENDAR_HEADER, *(render_event(task) for task in tasks), CALENDAR_FOOTER])
+        )
+        _, write_ms = _timed(lambda: write_atomic(path, content))
+        print(
+            f"{'one event per task':22} {len(tasks):8} {path.stat().st_size / 1024:8.0f} KB"
+            f" {render_ms:7.1f} ms {write_ms:7.1f} ms"
+        )
+
+        path = Path(directory) / "series.ics"
+        exporter = IcsExporter(service)
+        for label in ("RRULE per series", "  after one change"):
+            document, render_ms = _timed(lambda: exporter.build(path))
+            _, write_ms = _timed(lambda: exporter.mark_written(write_document(document)))
+            print(
+                f"{label:22} {document.events:8} {path.stat().st_size / 1024:8.0f} KB"
+                f" {render_ms:7.1f} ms {write_ms:7.1f} ms"
+            )
+            latest = max(task.id for task in tasks if task.series_id == 1)
+            service.tasks[latest] = replace(service.tasks[latest], updated_at=NOW + timedelta(minutes=1))
+
+
+if __name__ == "__main__":
+    main()
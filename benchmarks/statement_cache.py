@@ -0,0 +1,180 @@
+"""Per-call cost of the hot repository queries, rebuilt every call versus taken from the statement registry.
+
+Synthetic rows are inserted inside a transaction that is always rolled back.
+The first line is Python only: building the statement and its cache key,
+which SQLAlchemy does before every execution. The table then times the
+repository methods end to end, rebuilding every statement, through the
+registry, and on psycopg with server-side preparation as the app runs it
+(the registry's prepare hints plus psycopg's own threshold):
+
+    python benchmarks/statement_cache.py --rows 5000 --calls 500
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from sqlalchemy import insert, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.domain.filters import TaskFilters  # noqa: E402
+from app.infra import repository  # noqa: E402
+from app.infra.db import engine  # noqa: E402
+from app.infra.models import SubtaskModel, TaskModel  # noqa: E402
+from app.infra.repository import (  # noqa: E402
+    _CARD_COLUMNS,
+    TaskRepository,
+    _filter_params,
+    _page_key,
+    _page_statement,
+)
+from app.infra.search import SearchCapabilities  # noqa: E402
+
+STATUSES = ["inbox", "in_progress", "done", "archived"]
+PAGE = 200
+
+
+def _seed(session: Session, rows: int) -> None:
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    today = date.today()
+    session.execute(
+        insert(TaskModel),
+        [
+            {
+                "title": f"Benchmark task {index}",
+                "description": "",
+                "status": rng.choice(STATUSES),
+                "priority": rng.randint(1, 4),
+                "due_date": None if rng.random() < 0.4 else today + timedelta(days=rng.randint(-60, 60)),
+                "tags": "",
+                "created_at": now - timedelta(minutes=index),
+                "updated_at": now,
+                "recurrence_interval": 1,
+                "sort_order": (index + 1) * 1024,
+            }
+            for index in range(rows)
+        ],
+    )
+    task_ids = list(session.scalars(select(TaskModel.id)))
+    session.execute(
+        insert(SubtaskModel),
+        [
+            {"task_id": task_id, "title": f"Step {step}", "is_done": step == 0, "sort_order": step + 1}
+            for task_id in task_ids[::3]
+            for step in range(4)
+        ],
+    )
+
+
+def _per_call(fn: Callable[[], object], calls: int, rounds: int = 5) -> float:
+    """Microseconds per call in the fastest of ``rounds`` runs, which filters out scheduler noise."""
+    for _ in range(min(calls, 20)):
+        fn()
+    per_round = max(calls // rounds, 1)
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(per_round):
+            fn()
+        best = min(best, (time.perf_counter() - started) / per_round)
+    return best * 1_000_000
+
+
+class _Rebuild:
+    """Stands in for the registry: builds the statement on every call, like the code before it."""
+
+    def get(self, key, build, prepare=True):
+        return build()
+
+
+def _queries(repo: TaskRepository, ids: list[int]) -> dict[str, Callable[[], object]]:
+    inbox = TaskFilters("inbox")
+    return {
+        "cards page": lambda: repo.list_cards_page(inbox, limit=PAGE),
+        "stats": repo.get_stats,
+        "subtask summaries": lambda: repo.get_subtask_summaries(ids),
+        "tasks by id": lambda: repo.get_tasks(ids),
+    }
+
+
+def _python_overhead(calls: int) -> None:
+    """Statement construction plus cache key, without touching the database."""
+    inbox = TaskFilters("inbox")
+    search = SearchCapabilities()
+    key = _page_key("cards", inbox, None, search)
+
+    def rebuilt() -> None:
+        _page_statement(inbox, None, PAGE + 1, search, _CARD_COLUMNS)._generate_cache_key()
+
+    def registered() -> None:
+        stmt = repository._statements.get(
+            key, lambda: _page_statement(inbox, None, PAGE + 1, search, _CARD_COLUMNS)
+        )
+        stmt._generate_cache_key()
+        _filter_params(inbox)
+
+    before, after = _per_call(rebuilt, calls), _per_call(registered, calls)
+    print("Python only, cards page statement + cache key")
+    print(f"  rebuilt {before:9.1f} us  registry {after:9.1f} us  ({after / before:6.1%})\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000, help="synthetic tasks to insert")
+    parser.add_argument("--calls", type=int, default=500, help="timed calls per query")
+    args = parser.parse_args()
+
+    _python_overhead(args.calls * 4)
+
+    repo = TaskRepository()
+    registry = repository._statements
+    psycopg = engine.dialect.driver == "psycopg"
+    results: dict[str, list[float]] = {}
+    with engine.connect() as connection:
+        driver = connection.connection.driver_connection
+        threshold = driver.prepare_threshold if psycopg else None
+        transaction = connection.begin()
+        session = Session(bind=connection)
+        # Repository calls join this session, so they see the rolled-back rows.
+        token = repository._active_session.set(session)
+        try:
+            _seed(session, args.rows)
+            ids = list(session.scalars(select(TaskModel.id).order_by(TaskModel.id).limit(PAGE)))
+            queries = _queries(repo, ids)
+            for label in ("rebuilt", "registry", "prepared"):
+                if label == "prepared" and not psycopg:
+                    break
+                repository._statements = _Rebuild() if label == "rebuilt" else registry
+                if psycopg:
+                    prepared = 5 if threshold is None else threshold
+                    driver.prepare_threshold = prepared if label == "prepared" else None
+                for name, fn in queries.items():
+                    results.setdefault(name, []).append(_per_call(fn, args.calls))
+        finally:
+            repository._statements = registry
+            if psycopg:
+                driver.prepare_threshold = threshold
+            repository._active_session.reset(token)
+            session.close()
+            transaction.rollback()
+
+    print(f"{args.rows} synthetic tasks, {args.calls} calls per query, {engine.dialect.name}\n")
+    if psycopg:
+        print(f"{'':20} {'rebuilt':>12} {'registry':>12} {'+ prepared':>12}")
+    else:
+        print(f"{'':20} {'rebuilt':>12} {'registry':>12}")
+    for name, timings in results.items():
+        print(f"{name:20} " + " ".join(f"{timing:9.1f} us" for timing in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,19 @@ config.set_main_option("sqlalchemy.url", DATABASE_URL)
 
 target_metadata = Base.metadata
 
+# Database-maintained search objects (0006) are intentionally not mapped.
+UNMAPPED_OBJECTS = {
+    "search_vector",
+    "ix_tasks_search_vector",
+    "ix_tasks_title_trgm",
+    "ix_tasks_description_trgm",
+    "ix_tasks_tags_trgm",
+}
+
+
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    return not (reflected and compare_to is None and name in UNMAPPED_OBJECTS)
+
 
 def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
@@ -27,6 +40,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         compare_type=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -45,6 +59,7 @@ def run_migrations_online() -> None:
             connection=connection,
             target_metadata=target_metadata,
             compare_type=True,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
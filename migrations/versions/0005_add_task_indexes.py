@@ -0,0 +1,45 @@
+"""add task filter and ordering indexes"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005_add_task_indexes"
+down_revision = "0004_add_subtasks"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_tasks_status_sort_order", "tasks", ["status", "sort_order"], unique=False)
+    op.create_index("ix_tasks_due_date", "tasks", ["due_date"], unique=False)
+    op.create_index(
+        "ix_tasks_open_due_date",
+        "tasks",
+        ["due_date"],
+        unique=False,
+        postgresql_where=sa.text("due_date IS NOT NULL AND status NOT IN ('done', 'archived')"),
+    )
+    op.create_index(
+        "ix_tasks_list_order",
+        "tasks",
+        [
+            "sort_order",
+            sa.text("(due_date IS NULL)"),
+            "due_date",
+            sa.text("priority DESC"),
+            sa.text("created_at DESC"),
+            "id",
+        ],
+        unique=False,
+    )
+    # (status, sort_order) serves every lookup the single-column index did.
+    op.drop_index("ix_tasks_status", table_name="tasks")
+
+
+def downgrade() -> None:
+    op.create_index("ix_tasks_status", "tasks", ["status"], unique=False)
+    op.drop_index("ix_tasks_list_order", table_name="tasks")
+    op.drop_index("ix_tasks_open_due_date", table_name="tasks")
+    op.drop_index("ix_tasks_due_date", table_name="tasks")
+    op.drop_index("ix_tasks_status_sort_order", table_name="tasks")
@@ -0,0 +1,65 @@
+"""add full-text and trigram search indexes"""
+from __future__ import annotations
+
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = "0006_add_task_search"
+down_revision = "0005_add_task_indexes"
+branch_labels = None
+depends_on = None
+
+TRIGRAM_COLUMNS = ("title", "description", "tags")
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE tasks ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(title, '')), 'A')
+            || setweight(to_tsvector('simple', coalesce(tags, '')), 'B')
+            || setweight(to_tsvector('simple', coalesce(description, '')), 'C')
+        ) STORED
+        """
+    )
+    op.create_index(
+        "ix_tasks_search_vector",
+        "tasks",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+    # pg_trgm is optional: without it the app ranks with the tsvector alone.
+    if not context.is_offline_mode():
+        bind = op.get_bind()
+        available = bind.scalar(
+            sa.text("SELECT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm')")
+        )
+        if not available:
+            return
+        try:
+            with bind.begin_nested():
+                bind.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        except sa.exc.DBAPIError:
+            return
+    else:
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for column in TRIGRAM_COLUMNS:
+        op.create_index(
+            f"ix_tasks_{column}_trgm",
+            "tasks",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    for column in TRIGRAM_COLUMNS:
+        op.execute(f"DROP INDEX IF EXISTS ix_tasks_{column}_trgm")
+    op.drop_index("ix_tasks_search_vector", table_name="tasks")
+    op.drop_column("tasks", "search_vector")
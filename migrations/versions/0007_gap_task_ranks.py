@@ -0,0 +1,58 @@
+"""space task sort orders with gaps and rank appends from a sequence"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007_gap_task_ranks"
+down_revision = "0006_add_task_search"
+branch_labels = None
+depends_on = None
+
+RANK_GAP = 1024
+
+
+def upgrade() -> None:
+    op.alter_column("tasks", "sort_order", type_=sa.BigInteger(), existing_nullable=False)
+    # Same order the app lists tasks in, renumbered per status with room between rows.
+    op.execute(
+        f"""
+        UPDATE tasks SET sort_order = ranked.rank
+        FROM (
+            SELECT id, ROW_NUMBER() OVER (
+                PARTITION BY status
+                ORDER BY sort_order, due_date IS NULL, due_date, priority DESC, created_at DESC, id
+            ) * {RANK_GAP} AS rank
+            FROM tasks
+        ) AS ranked
+        WHERE tasks.id = ranked.id
+        """
+    )
+    op.execute(f"CREATE SEQUENCE tasks_sort_order_seq START WITH {RANK_GAP} INCREMENT BY {RANK_GAP}")
+    op.execute(
+        f"""
+        SELECT setval(
+            'tasks_sort_order_seq',
+            COALESCE((SELECT MAX(sort_order) FROM tasks), 0) + {RANK_GAP},
+            false
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP SEQUENCE IF EXISTS tasks_sort_order_seq")
+    op.execute(
+        """
+        UPDATE tasks SET sort_order = ranked.rank
+        FROM (
+            SELECT id, ROW_NUMBER() OVER (
+                PARTITION BY status
+                ORDER BY sort_order, due_date IS NULL, due_date, priority DESC, created_at DESC, id
+            ) AS rank
+            FROM tasks
+        ) AS ranked
+        WHERE tasks.id = ranked.id
+        """
+    )
+    op.alter_column("tasks", "sort_order", type_=sa.Integer(), existing_nullable=False)
@@ -0,0 +1,71 @@
+"""link the instances of a recurring task to the first one of their series"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008_add_task_series"
+down_revision = "0007_gap_task_ranks"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("tasks", sa.Column("series_id", sa.Integer(), nullable=True))
+    op.add_column("tasks", sa.Column("series_start", sa.Date(), nullable=True))
+    op.create_index("ix_tasks_series_id", "tasks", ["series_id"], unique=False)
+    # Completing an instance used to insert a copy due one step later, right after setting
+    # completed_at. Those links (same rule, one step apart, created within a minute of the
+    # completion) are followed back to the first task; titles only break ties, since either
+    # copy may have been renamed. Rows with no unambiguous link stay their own series.
+    # series_start stays NULL, so old instances keep counting from their own due dates.
+    op.execute(
+        """
+        WITH RECURSIVE candidates AS (
+            SELECT child.id, parent.id AS parent, child.title = parent.title AS same_title
+            FROM tasks AS parent
+            JOIN tasks AS child
+              ON child.recurrence_rule = parent.recurrence_rule
+             AND child.recurrence_interval = parent.recurrence_interval
+             AND child.recurrence_end_date IS NOT DISTINCT FROM parent.recurrence_end_date
+             AND child.created_at BETWEEN parent.completed_at AND parent.completed_at + INTERVAL '1 minute'
+             AND child.due_date = CASE parent.recurrence_rule
+                 WHEN 'weekly' THEN parent.due_date + 7 * parent.recurrence_interval
+                 WHEN 'monthly' THEN (parent.due_date + make_interval(months => parent.recurrence_interval))::date
+                 ELSE parent.due_date + parent.recurrence_interval
+             END
+            WHERE parent.recurrence_rule IS NOT NULL AND parent.completed_at IS NOT NULL
+        ),
+        preferred AS (
+            SELECT id, parent,
+                   RANK() OVER (PARTITION BY id ORDER BY same_title DESC) AS preference,
+                   COUNT(*) OVER (PARTITION BY id, same_title) AS ties
+            FROM candidates
+        ),
+        links AS (
+            SELECT id, parent FROM (
+                SELECT id, parent, COUNT(*) OVER (PARTITION BY parent) AS children
+                FROM preferred
+                WHERE preference = 1 AND ties = 1
+            ) AS unique_children
+            WHERE children = 1
+        ),
+        chains AS (
+            SELECT id, id AS root
+            FROM tasks
+            WHERE recurrence_rule IS NOT NULL AND id NOT IN (SELECT id FROM links)
+            UNION ALL
+            SELECT links.id, chains.root
+            FROM links JOIN chains ON links.parent = chains.id
+        )
+        UPDATE tasks SET series_id = chains.root
+        FROM chains
+        WHERE tasks.id = chains.id AND chains.root <> tasks.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_series_id", table_name="tasks")
+    op.drop_column("tasks", "series_start")
+    op.drop_column("tasks", "series_id")
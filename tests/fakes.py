@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from contextlib import nullcontext
+from dataclasses import replace
+from datetime import date, datetime
+
+from app.domain.entities import SubtaskEntity, SubtaskSummary, TaskEntity
+from app.domain.enums import TaskStatus
+from app.domain.filters import TaskFilters
+
+
+class FakeRepo:
+    def __init__(self) -> None:
+        self.tasks: list[TaskEntity] = []
+        self.subtasks: list[SubtaskEntity] = []
+        self._id = 1
+        self.calls: dict[str, int] = {}
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def unit_of_work(self):
+        self._count("unit_of_work")
+        return nullcontext()
+
+    def list_tasks(self, filters: TaskFilters) -> list[TaskEntity]:
+        self._count("list_tasks")
+        return [t for t in self.tasks if filters.filter_key in ("all", t.status.value)]
+
+    def get_task(self, task_id: int) -> TaskEntity | None:
+        return next((t for t in self.tasks if t.id == task_id), None)
+
+    def create_task(self, data: dict) -> TaskEntity:
+        task = TaskEntity(
+            id=self._id,
+            title=data.get("title", ""),
+            description=data.get("description", ""),
+            status=TaskStatus(data.get("status", "inbox")),
+            priority=data.get("priority", 2),
+            due_date=data.get("due_date"),
+            tags=data.get("tags", ""),
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+            completed_at=None,
+            recurrence_rule=data.get("recurrence_rule"),
+            recurrence_interval=data.get("recurrence_interval", 1),
+            recurrence_end_date=data.get("recurrence_end_date"),
+            archived_at=None,
+            sort_order=1,
+            series_id=data.get("series_id"),
+            series_start=data.get("series_start"),
+        )
+        self.tasks.append(task)
+        self._id += 1
+        return task
+
+    def update_task(self, task_id: int, data: dict) -> TaskEntity | None:
+        task = self.get_task(task_id)
+        if not task:
+            return None
+        updated = replace(
+            task,
+            status=TaskStatus(data.get("status", task.status.value)),
+            completed_at=data.get("completed_at", task.completed_at),
+            archived_at=data.get("archived_at", task.archived_at),
+        )
+        self.tasks = [updated if t.id == task_id else t for t in self.tasks]
+        return updated
+
+    def list_open_recurring_dues(self) -> dict[tuple[str, str], date]:
+        dues: dict[tuple[str, str], date] = {}
+        for t in self.tasks:
+            if t.recurrence_rule and t.due_date and t.status not in (TaskStatus.DONE, TaskStatus.ARCHIVED):
+                key = (t.title, t.recurrence_rule)
+                dues[key] = max(dues.get(key, t.due_date), t.due_date)
+        return dues
+
+    def list_due_stamps(self) -> dict[int, tuple[datetime, int | None]]:
+        return {
+            t.id: (t.updated_at, t.series_key if t.recurrence_rule else None)
+            for t in sorted(self.tasks, key=lambda t: t.id)
+            if t.due_date
+        }
+
+    def get_tasks(self, task_ids: list[int]) -> list[TaskEntity]:
+        return [t for t in self.tasks if t.id in task_ids]
+
+    def update_many(self, task_ids: list[int], data: dict, new_tasks=()) -> list[TaskEntity]:
+        self._count("update_many")
+        updated = [self.update_task(task_id, data) for task_id in task_ids]
+        for row in new_tasks:
+            self.create_task(row)
+        return [task for task in updated if task is not None]
+
+    def bulk_create(self, rows, batch_size=None, progress=None) -> int:
+        self._count("bulk_create")
+        rows = list(rows)
+        for row in rows:
+            self.create_task(row)
+        return len(rows)
+
+    def list_series_heads(self, series_ids=None) -> list[TaskEntity]:
+        heads: dict[int, TaskEntity] = {}
+        for task in self.tasks:
+            if series_ids is not None and task.series_key not in series_ids:
+                continue
+            head = heads.get(task.series_key)
+            if task.due_date and (head is None or task.due_date > head.due_date):
+                heads[task.series_key] = task
+        return [head for head in heads.values() if head.recurrence_rule]
+
+    def count_open_due(self, start: date, end: date) -> dict[date, int]:
+        counts: dict[date, int] = {}
+        for task in self.tasks:
+            if task.due_date and start <= task.due_date <= end and task.status == TaskStatus.INBOX:
+                counts[task.due_date] = counts.get(task.due_date, 0) + 1
+        return counts
+
+    def delete_task(self, task_id: int) -> None:
+        self.tasks = [t for t in self.tasks if t.id != task_id]
+
+    def get_subtask_summaries(self, task_ids: list[int]) -> dict[int, SubtaskSummary]:
+        self._count("get_subtask_summaries")
+        summaries: dict[int, SubtaskSummary] = {}
+        for subtask in self.subtasks:
+            if subtask.task_id in task_ids:
+                current = summaries.get(subtask.task_id, SubtaskSummary(0, 0))
+                summaries[subtask.task_id] = SubtaskSummary(
+                    total=current.total + 1,
+                    done=current.done + subtask.is_done,
+                    titles=current.titles + (subtask.title,),
+                )
+        return summaries
+
+    def create_subtask(self, task_id: int, title: str) -> SubtaskEntity:
+        subtask = SubtaskEntity(
+            id=len(self.subtasks) + 1,
+            task_id=task_id,
+            title=title,
+            is_done=False,
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+            sort_order=len(self.subtasks) + 1,
+        )
+        self.subtasks.append(subtask)
+        return subtask
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "total": len(self.tasks),
+            "in_progress": 0,
+            "done": 0,
+            "overdue": 0,
+            "due_today": 0,
+        }
+
+    def list_due_reminders(self) -> list[TaskEntity]:
+        return []
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import csv
+import io
+from datetime import date
+
+from app.services.csv_io import CSV_HEADERS, TITLE_MAX_LENGTH, parse_task_rows, write_task_rows
+
+
+def test_parse_task_rows_validates_and_skips_untitled_rows() -> None:
+    rows = [
+        {"title": "  Report ", "status": "done", "priority": "4", "due_date": "2026-03-01"},
+        {"title": "", "status": "inbox"},
+        {
+            "title": "x" * 300,
+            "status": "later",
+            "priority": "9",
+            "due_date": "soon",
+            "recurrence_rule": "yearly",
+            "recurrence_interval": "0",
+        },
+    ]
+
+    parsed = list(parse_task_rows(rows))
+
+    assert len(parsed) == 2
+    assert parsed[0]["title"] == "Report"
+    assert parsed[0]["status"] == "done"
+    assert parsed[0]["priority"] == 4
+    assert parsed[0]["due_date"] == date(2026, 3, 1)
+    assert len(parsed[1]["title"]) == TITLE_MAX_LENGTH
+    assert parsed[1]["status"] == "inbox"
+    assert parsed[1]["priority"] == 2
+    assert parsed[1]["due_date"] is None
+    assert parsed[1]["recurrence_rule"] is None
+    assert parsed[1]["recurrence_interval"] == 1
+
+
+def test_write_task_rows_round_trips_through_parser() -> None:
+    rows = [
+        ("Report", "", "done", 4, date(2026, 3, 1), "work", None, 1, None),
+        ("Gym", "legs", "inbox", 2, None, "", "weekly", 2, date(2026, 6, 1)),
+    ]
+    handle = io.StringIO()
+    counts: list[int] = []
+
+    written = write_task_rows(handle, iter(rows), progress=counts.append, progress_every=1)
+
+    assert written == 2
+    assert counts == [1, 2, 2]
+    handle.seek(0)
+    reader = csv.DictReader(handle)
+    assert reader.fieldnames == CSV_HEADERS
+    parsed = list(parse_task_rows(reader))
+    assert parsed[0]["due_date"] == date(2026, 3, 1)
+    assert parsed[1]["recurrence_rule"] == "weekly"
+    assert parsed[1]["recurrence_end_date"] == date(2026, 6, 1)
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from app.domain.entities import TaskEntity
+from app.domain.enums import RecurrenceRule, TaskStatus
+from app.domain.recurrence import Recurrence, occurrences
+from app.services.ics import IcsExporter, fold_line, rrule
+from app.services.task_service import TaskService
+from fakes import FakeRepo
+
+NOW = datetime(2026, 1, 1, 12, 0)
+
+
+def _task(task_id: int, title: str, due_date: date | None = date(2026, 2, 1)) -> TaskEntity:
+    return TaskEntity(
+        id=task_id,
+        title=title,
+        description="",
+        status=TaskStatus.INBOX,
+        priority=2,
+        due_date=due_date,
+        tags="",
+        created_at=NOW,
+        updated_at=NOW,
+        completed_at=None,
+        recurrence_rule=None,
+        recurrence_interval=1,
+        recurrence_end_date=None,
+        archived_at=None,
+        sort_order=task_id,
+    )
+
+
+class FakeService:
+    def __init__(self, tasks: list[TaskEntity]) -> None:
+        self.tasks = {task.id: task for task in tasks}
+        self.loaded: list[list[int]] = []
+
+    def list_due_stamps(self) -> dict[int, tuple[datetime, int | None]]:
+        return {
+            task.id: (task.updated_at, task.series_key if task.recurrence_rule else None)
+            for task in sorted(self.tasks.values(), key=lambda task: task.id)
+            if task.due_date
+        }
+
+    def get_tasks(self, task_ids: list[int]) -> list[TaskEntity]:
+        self.loaded.append(list(task_ids))
+        return [self.tasks[task_id] for task_id in task_ids]
+
+
+def _daily(task_id: int, due_date: date, status: TaskStatus = TaskStatus.DONE) -> TaskEntity:
+    return replace(
+        _task(task_id, "Полити квіти", due_date),
+        status=status,
+        recurrence_rule=RecurrenceRule.DAILY.value,
+        recurrence_interval=2,
+        recurrence_end_date=date(2026, 3, 1),
+        series_id=None if task_id == 10 else 10,
+    )
+
+
+def test_export_renders_only_changed_events(tmp_path: Path) -> None:
+    service = FakeService([_task(1, "Pay rent"), _task(2, "Dentist"), _task(3, "Someday", None)])
+    exporter = IcsExporter(service)
+    path = tmp_path / "tasks.ics"
+
+    first = exporter.export(path)
+    assert (first.events, first.rendered, first.written) == (2, 2, True)
+    assert path.read_text(encoding="utf-8").count("BEGIN:VEVENT") == 2
+
+    unchanged = exporter.export(path)
+    assert (unchanged.rendered, unchanged.written) == (0, False)
+
+    service.tasks[2] = replace(service.tasks[2], title="Dentist, 9:00", updated_at=NOW + timedelta(minutes=1))
+    del service.tasks[1]
+    changed = exporter.export(path)
+
+    assert (changed.events, changed.rendered, changed.written) == (1, 1, True)
+    assert service.loaded[-1] == [2]
+    content = path.read_text(encoding="utf-8")
+    assert "SUMMARY:Dentist\\, 9:00" in content
+    assert "Pay rent" not in content
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_recurring_series_is_one_event_with_rrule_and_exdates(tmp_path: Path) -> None:
+    # Every other day from Feb 1: Feb 3 was done, Feb 5 has no task, Feb 7 is open.
+    series = [
+        _daily(10, date(2026, 2, 1)),
+        _daily(11, date(2026, 2, 3)),
+        _daily(12, date(2026, 2, 7), TaskStatus.INBOX),
+    ]
+    service = FakeService([*series, _task(1, "Dentist")])
+    exporter = IcsExporter(service)
+    path = tmp_path / "tasks.ics"
+
+    result = exporter.export(path)
+
+    content = path.read_bytes().decode("utf-8")
+    assert result.events == 2
+    assert content.count("BEGIN:VEVENT") == 2
+    assert "UID:series-10@taskforge\r\nDTSTAMP:20260101T120000Z\r\nDTSTART;VALUE=DATE:20260201\r\n" in content
+    assert "RRULE:FREQ=DAILY;INTERVAL=2;UNTIL=20260301\r\n" in content
+    assert "EXDATE;VALUE=DATE:20260201,20260203,20260205\r\n" in content
+    assert "RDATE" not in content
+    assert content.endswith("END:VCALENDAR\r\n")
+
+    # Completing the open instance re-renders only the series.
+    service.tasks[12] = replace(series[2], status=TaskStatus.DONE, updated_at=NOW + timedelta(minutes=1))
+    changed = exporter.export(path)
+    assert (changed.rendered, service.loaded[-1]) == (1, [10, 11, 12])
+    assert "UNTIL=20260207" in path.read_text(encoding="utf-8")
+
+
+def test_month_end_series_completed_in_the_app_exports_as_its_own_rule(tmp_path: Path) -> None:
+    repo = FakeRepo()
+    service = TaskService(repo)
+    task = repo.create_task({
+        "title": "Rent",
+        "due_date": date(2026, 1, 31),
+        "recurrence_rule": RecurrenceRule.MONTHLY.value,
+    })
+    for _ in range(5):
+        service.mark_done(task.id)
+        task = repo.tasks[-1]
+    path = tmp_path / "tasks.ics"
+
+    IcsExporter(service).export(path)
+
+    content = path.read_bytes().decode("utf-8")
+    done = [t.due_date for t in repo.tasks if t.status == TaskStatus.DONE]
+    assert content.count("BEGIN:VEVENT") == 1
+    assert "DTSTART;VALUE=DATE:20260131\r\n" in content
+    assert "RRULE:FREQ=MONTHLY;INTERVAL=1;BYMONTHDAY=28,29,30,31;BYSETPOS=-1\r\n" in content
+    assert "EXDATE;VALUE=DATE:" + ",".join(day.strftime("%Y%m%d") for day in done) + "\r\n" in content
+    assert "RDATE" not in content
+    rule = Recurrence(date(2026, 1, 31), RecurrenceRule.MONTHLY.value)
+    assert [t.due_date for t in repo.tasks[1:]] == occurrences(rule, date(2026, 6, 30))
+
+
+def test_series_splits_into_one_event_per_rule_it_followed(tmp_path: Path) -> None:
+    # Every other day from Feb 1, then weekly from Feb 10 after the rule was changed there.
+    weekly = {
+        "recurrence_rule": RecurrenceRule.WEEKLY.value,
+        "recurrence_interval": 1,
+        "series_start": date(2026, 2, 10),
+    }
+    series = [
+        _daily(10, date(2026, 2, 1)),
+        _daily(11, date(2026, 2, 3)),
+        replace(_daily(12, date(2026, 2, 10)), **weekly),
+        replace(_daily(13, date(2026, 2, 17), TaskStatus.INBOX), **weekly),
+    ]
+    path = tmp_path / "tasks.ics"
+
+    result = IcsExporter(FakeService(series)).export(path)
+
+    content = path.read_bytes().decode("utf-8")
+    assert result.events == 2
+    assert "UID:series-10@taskforge" in content and "UID:series-10-20260210@taskforge" in content
+    assert "RRULE:FREQ=DAILY;INTERVAL=2;UNTIL=20260203\r\nEXDATE;VALUE=DATE:20260201,20260203\r\n" in content
+    assert "RRULE:FREQ=WEEKLY;INTERVAL=1;UNTIL=20260301\r\nEXDATE;VALUE=DATE:20260210\r\n" in content
+    assert "RDATE" not in content
+
+
+def test_moved_open_instance_starts_a_new_run_at_its_date(tmp_path: Path) -> None:
+    # Every other day from Feb 1; the open Feb 5 instance was moved to Feb 6, which restarts the series there.
+    series = [
+        _daily(10, date(2026, 2, 1)),
+        _daily(11, date(2026, 2, 3)),
+        replace(_daily(12, date(2026, 2, 6), TaskStatus.INBOX), series_start=date(2026, 2, 6)),
+    ]
+    path = tmp_path / "tasks.ics"
+
+    IcsExporter(FakeService(series)).export(path)
+
+    content = path.read_bytes().decode("utf-8")
+    assert "UID:series-10@taskforge" in content
+    assert "RRULE:FREQ=DAILY;INTERVAL=2;UNTIL=20260203\r\nEXDATE;VALUE=DATE:20260201,20260203\r\n" in content
+    assert "UID:series-10-20260206@taskforge" in content
+    assert "DTSTART;VALUE=DATE:20260206\r\nRRULE:FREQ=DAILY;INTERVAL=2;UNTIL=20260301\r\nSUMMARY:" in content
+
+
+def test_monthly_rule_clamps_like_the_app() -> None:
+    assert rrule(Recurrence(date(2026, 1, 30), RecurrenceRule.MONTHLY.value, 1)) == (
+        "FREQ=MONTHLY;INTERVAL=1;BYMONTHDAY=28,29,30;BYSETPOS=-1"
+    )
+    assert rrule(Recurrence(date(2026, 1, 5), RecurrenceRule.WEEKLY.value, 3, date(2026, 6, 1))) == (
+        "FREQ=WEEKLY;INTERVAL=3;UNTIL=20260601"
+    )
+
+
+def test_long_lines_fold_at_75_octets_without_splitting_characters() -> None:
+    line = "SUMMARY:" + "Задача " * 30
+    folded = fold_line(line)
+
+    parts = folded.split("\r\n")
+    assert all(len(part.encode("utf-8")) <= 75 for part in parts)
+    assert all(part.startswith(" ") for part in parts[1:])
+    assert "".join(part[1:] if index else part for index, part in enumerate(parts)) == line
+    assert fold_line("SUMMARY:short") == "SUMMARY:short"
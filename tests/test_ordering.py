@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from app.domain.ordering import increasing_run
+
+
+def test_increasing_run_keeps_the_longest_ordered_positions() -> None:
+    # One card moved from the end to the front: everything else stays.
+    assert increasing_run([50, 10, 20, 30, 40]) == {1, 2, 3, 4}
+    run = increasing_run([3, 1, 4, 1, 5, 9, 2, 6])
+    values = [3, 1, 4, 1, 5, 9, 2, 6]
+    assert len(run) == 4
+    assert [values[position] for position in sorted(run)] == sorted(values[position] for position in run)
+    assert increasing_run([]) == set()
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pytest
+
+from app.domain.enums import RecurrenceRule
+from app.domain.recurrence import Recurrence, expand, next_occurrence, occurrences
+from app.services.task_service import TaskService
+
+from fakes import FakeRepo
+
+DAILY = RecurrenceRule.DAILY.value
+WEEKLY = RecurrenceRule.WEEKLY.value
+MONTHLY = RecurrenceRule.MONTHLY.value
+
+
+def test_expand_steps_daily_and_weekly_series_from_their_start() -> None:
+    series = {
+        "daily": Recurrence(date(2026, 1, 1), DAILY, 3),
+        "weekly": Recurrence(date(2026, 1, 5), WEEKLY, 2, until=date(2026, 3, 1)),
+        "unknown rule": Recurrence(date(2026, 1, 1), "yearly", 10),
+    }
+
+    expanded = expand(series, date(2026, 4, 1))
+
+    assert expanded["daily"][:3] == [date(2026, 1, 4), date(2026, 1, 7), date(2026, 1, 10)]
+    assert expanded["daily"][-1] == date(2026, 4, 1)
+    assert expanded["weekly"] == [date(2026, 1, 19), date(2026, 2, 2), date(2026, 2, 16)]
+    assert expanded["unknown rule"] == [date(2026, 1, 1) + timedelta(days=10 * k) for k in range(1, 10)]
+
+
+def test_monthly_keeps_the_start_day_and_clamps_short_months() -> None:
+    series = Recurrence(date(2026, 1, 31), MONTHLY)
+
+    assert occurrences(series, date(2026, 5, 31)) == [
+        date(2026, 2, 28),
+        date(2026, 3, 31),
+        date(2026, 4, 30),
+        date(2026, 5, 31),
+    ]
+    assert occurrences(Recurrence(date(2026, 1, 15), MONTHLY, 5), date(2027, 1, 1)) == [
+        date(2026, 6, 15),
+        date(2026, 11, 15),
+    ]
+
+
+def test_after_skips_to_the_first_later_occurrence() -> None:
+    daily = Recurrence(date(2020, 1, 1), DAILY)
+    monthly = Recurrence(date(2020, 1, 31), MONTHLY, 2)
+
+    assert occurrences(daily, date(2026, 1, 3), after=date(2026, 1, 1)) == [date(2026, 1, 2), date(2026, 1, 3)]
+    assert occurrences(monthly, date(2026, 1, 31), after=date(2025, 9, 30)) == [
+        date(2025, 11, 30),
+        date(2026, 1, 31),
+    ]
+    assert occurrences(daily, date(2019, 1, 1)) == []
+    assert next_occurrence(monthly, date(2025, 11, 30)) == date(2026, 1, 31)
+    assert next_occurrence(Recurrence(date(2026, 1, 1), DAILY, until=date(2026, 1, 2)), date(2026, 1, 2)) is None
+
+
+@pytest.mark.parametrize("day", [29, 30, 31])
+def test_mark_done_chain_follows_the_same_monthly_dates_as_expansion(day: int) -> None:
+    repo = FakeRepo()
+    service = TaskService(repo)
+    start = date(2026, 1, day)
+    task = repo.create_task({"title": "Rent", "due_date": start, "recurrence_rule": MONTHLY})
+
+    for _ in range(12):
+        task = repo.tasks[-1]
+        service.mark_done(task.id)
+
+    chained = [task.due_date for task in repo.tasks]
+    assert chained == [start, *occurrences(Recurrence(start, MONTHLY), date(2027, 1, 31))]
+    assert chained[1] == date(2026, 2, 28) and chained[2] == date(2026, 3, day)
@@ -0,0 +1,441 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import Iterator
+
+import pytest
+from sqlalchemy import create_engine, event, insert, make_url
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.config import SETTINGS
+from app.domain.entities import SubtaskSummary, TaskCardRow
+from app.domain.filters import TaskFilters
+from app.infra import repository
+from app.infra.db import Base
+from app.infra.models import TaskModel
+from app.infra.repository import TaskRepository
+from app.infra.search import prefix_tsquery
+from app.services.task_service import TaskService
+
+
+@pytest.fixture()
+def repo(monkeypatch) -> TaskRepository:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    monkeypatch.setattr(
+        repository,
+        "SessionLocal",
+        sessionmaker(bind=engine, autoflush=False, autocommit=False),
+    )
+    return TaskRepository()
+
+
+@pytest.fixture()
+def pg_repo() -> Iterator[TaskRepository]:
+    """The migrated Postgres database from DATABASE_URL, rolled back after the test; skipped without one."""
+    if make_url(SETTINGS.database_url).get_backend_name() != "postgresql":
+        pytest.skip("DATABASE_URL is not a Postgres database")
+    session = repository.SessionLocal()
+    try:
+        session.connection()
+    except OperationalError:
+        session.close()
+        pytest.skip("the Postgres database in DATABASE_URL is not reachable")
+    token = repository._active_session.set(session)
+    try:
+        yield TaskRepository()
+    finally:
+        repository._active_session.reset(token)
+        session.rollback()
+        session.close()
+
+
+def _seed(count: int) -> None:
+    created = datetime(2026, 1, 1, 9, 0)
+    rows = []
+    for index in range(count):
+        rows.append(
+            {
+                "title": f"Task {index}",
+                "description": "",
+                "status": "inbox" if index % 3 else "in_progress",
+                "priority": index % 4 + 1,
+                "due_date": None if index % 5 == 0 else date(2026, 2, 1) + timedelta(days=index % 4),
+                "tags": "",
+                "created_at": created + timedelta(minutes=index % 6),
+                "updated_at": created,
+                "recurrence_interval": 1,
+                "sort_order": index % 7,
+            }
+        )
+    with repository.SessionLocal() as session:
+        session.execute(insert(TaskModel), rows)
+        session.commit()
+
+
+def test_keyset_pages_match_full_listing(repo: TaskRepository) -> None:
+    _seed(157)
+    filters = TaskFilters(filter_key="all")
+
+    expected = [task.id for task in repo.list_tasks(filters)]
+    paged = [task.id for page in repo.iter_task_pages(filters, page_size=10) for task in page]
+
+    assert paged == expected
+    assert len(paged) == 157
+
+
+def test_page_reports_stats_and_end_of_results(repo: TaskRepository) -> None:
+    _seed(12)
+
+    first = repo.list_tasks_page(TaskFilters(filter_key="inbox"), limit=5, include_stats=True)
+    assert len(first.tasks) == 5
+    assert first.next_cursor is not None
+    assert first.stats is not None
+    assert first.stats["total"] == 12
+    assert first.stats["in_progress"] == 4
+
+    rest = repo.list_tasks_page(TaskFilters(filter_key="inbox"), after=first.next_cursor, limit=5)
+    assert len(rest.tasks) == 3
+    assert rest.next_cursor is None
+
+
+def test_search_falls_back_to_ilike_without_postgres(repo: TaskRepository) -> None:
+    repo.create_task({"title": "Quarterly report", "tags": "work"})
+    repo.create_task({"title": "Groceries", "description": "milk, report card"})
+    repo.create_task({"title": "Gym"})
+
+    page = repo.list_tasks_page(TaskFilters(filter_key="all", search="port"))
+
+    assert sorted(task.title for task in page.tasks) == ["Groceries", "Quarterly report"]
+
+
+def test_prefix_tsquery_matches_partial_words() -> None:
+    assert prefix_tsquery("Buil  Звіт-2") == "buil:* & звіт:* & 2:*"
+    assert prefix_tsquery("!!") is None
+
+
+def test_bulk_create_continues_sort_order_per_status(repo: TaskRepository) -> None:
+    repo.create_task({"title": "Existing", "status": "inbox"})
+    counts: list[int] = []
+    rows = ({"title": f"Imported {index}", "status": "done" if index % 2 else "inbox"} for index in range(5))
+
+    created = repo.bulk_create(rows, batch_size=2, progress=counts.append)
+
+    assert created == 5
+    assert counts == [2, 4, 5]
+    inbox = repo.list_tasks(TaskFilters(filter_key="inbox"))
+    done = repo.list_tasks(TaskFilters(filter_key="done"))
+    assert [(task.title, task.sort_order) for task in inbox] == [
+        ("Existing", 1024),
+        ("Imported 0", 2048),
+        ("Imported 2", 3072),
+        ("Imported 4", 4096),
+    ]
+    assert [task.sort_order for task in done] == [1024, 2048]
+
+
+def test_iter_task_values_streams_selected_columns_in_list_order(repo: TaskRepository) -> None:
+    _seed(30)
+    filters = TaskFilters(filter_key="inbox")
+
+    values = list(repo.iter_task_values(["id", "title"], filters, batch_size=7))
+
+    assert [task_id for task_id, _ in values] == [task.id for task in repo.list_tasks(filters)]
+    assert all(len(row) == 2 for row in values)
+
+
+def test_get_board_splits_columns_in_list_order(repo: TaskRepository) -> None:
+    _seed(20)
+    first = repo.list_tasks(TaskFilters(filter_key="in_progress"))[0]
+    done_step = repo.create_subtask(first.id, "Step one")
+    repo.create_subtask(first.id, "Step two")
+    repo.update_subtask(done_step.id, {"is_done": True})
+
+    board = repo.get_board(["inbox", "in_progress", "done"])
+
+    for status in ("inbox", "in_progress"):
+        expected = repo.list_tasks(TaskFilters(filter_key=status))
+        assert [task.id for task in board.columns[status]] == [task.id for task in expected]
+    assert board.columns["done"] == []
+    assert board.subtasks == {first.id: SubtaskSummary(total=2, done=1, titles=("Step one", "Step two"))}
+
+
+def test_subtask_summaries_count_everything_but_read_few_titles(repo: TaskRepository) -> None:
+    busy = repo.create_task({"title": "Busy"})
+    quiet = repo.create_task({"title": "Quiet"})
+    repo.create_task({"title": "Empty"})
+    for index in range(5):
+        subtask = repo.create_subtask(busy.id, f"Step {index}")
+        if index % 2 == 0:
+            repo.update_subtask(subtask.id, {"is_done": True})
+    repo.create_subtask(quiet.id, "Only")
+
+    summaries = repo.get_subtask_summaries([busy.id, quiet.id, busy.id + 2], preview=2)
+
+    assert summaries == {
+        busy.id: SubtaskSummary(total=5, done=3, titles=("Step 0", "Step 1")),
+        quiet.id: SubtaskSummary(total=1, done=0, titles=("Only",)),
+    }
+
+
+def test_card_pages_follow_task_pages(repo: TaskRepository) -> None:
+    _seed(23)
+    filters = TaskFilters(filter_key="all")
+
+    first = repo.list_cards_page(filters, limit=10, include_stats=True)
+    rest = repo.list_cards_page(filters, after=first.next_cursor, limit=20)
+
+    assert [card.id for card in first.cards + rest.cards] == [task.id for task in repo.list_tasks(filters)]
+    assert first.stats["total"] == 23
+    assert rest.next_cursor is None
+    full = repo.get_task(first.cards[0].id)
+    assert first.cards[0] == TaskCardRow.from_entity(full)
+
+
+def test_entities_are_slotted_and_share_tag_strings(repo: TaskRepository) -> None:
+    repo.create_task({"title": "One", "tags": "work, urgent"})
+    repo.create_task({"title": "Two", "tags": "work, urgent"})
+
+    first, second = repo.list_tasks(TaskFilters(filter_key="all"))
+
+    assert not hasattr(first, "__dict__")
+    assert first.tags is second.tags
+
+
+def test_reorder_rewrites_only_the_moved_task(repo: TaskRepository) -> None:
+    for index in range(5):
+        repo.create_task({"title": f"Task {index}"})
+    before = {task.id: task.sort_order for task in repo.list_tasks(TaskFilters(filter_key="inbox"))}
+    ids = list(before)
+
+    repo.reorder_tasks([ids[3], *ids[:3], ids[4]])
+    repo.reorder_tasks([ids[3], ids[0], ids[1], ids[2], ids[4]])
+
+    after = {task.id: task.sort_order for task in repo.list_tasks(TaskFilters(filter_key="inbox"))}
+    assert list(after) == [ids[3], *ids[:3], ids[4]]
+    assert {task_id for task_id in ids if after[task_id] != before[task_id]} == {ids[3]}
+
+
+def test_reorder_respaces_the_column_once_a_gap_is_used_up(repo: TaskRepository) -> None:
+    for index in range(3):
+        repo.create_task({"title": f"Task {index}"})
+    first, second, third = (task.id for task in repo.list_tasks(TaskFilters(filter_key="inbox")))
+
+    # Each drop halves the gap between the first two tasks until nothing is left.
+    for _ in range(12):
+        repo.reorder_tasks([first, third, second])
+        repo.reorder_tasks([first, second, third])
+
+    tasks = repo.list_tasks(TaskFilters(filter_key="inbox"))
+    assert [task.id for task in tasks] == [first, second, third]
+    assert len({task.sort_order for task in tasks}) == 3
+
+
+def test_batch_update_and_delete_touch_every_selected_task(repo: TaskRepository) -> None:
+    tasks = [repo.create_task({"title": f"Task {index}"}) for index in range(4)]
+    repo.create_subtask(tasks[0].id, "step")
+    selected = [tasks[2].id, tasks[0].id, tasks[1].id]
+
+    updated = repo.update_many(selected, {"status": "done"}, new_tasks=[{"title": "Next"}])
+
+    assert [task.id for task in updated] == selected
+    assert {task.status.value for task in updated} == {"done"}
+    done = repo.list_tasks(TaskFilters(filter_key="done"))
+    assert [task.id for task in done] == selected
+    assert [task.title for task in repo.list_tasks(TaskFilters(filter_key="inbox"))] == ["Task 3", "Next"]
+
+    repo.delete_many(selected)
+    assert repo.get_tasks(selected) == []
+    assert repo.get_subtask_summaries([tasks[0].id]) == {}
+
+
+def test_batch_update_ranks_in_given_order_with_a_rank_sequence(repo: TaskRepository, monkeypatch) -> None:
+    tasks = [repo.create_task({"title": f"Task {index}"}) for index in range(4)]
+    drawn = iter(range(10**6, 10**7, 1024))
+    # The Postgres branch: ranks come from the sequence, in whatever order it hands them out.
+    monkeypatch.setattr(repository, "_uses_rank_sequence", lambda session: True)
+    monkeypatch.setattr(
+        repository, "_reserve_ranks", lambda session, count: sorted(next(drawn) for _ in range(count))
+    )
+    selected = [tasks[3].id, tasks[0].id, tasks[2].id]
+
+    updated = repo.update_many(selected, {"status": "in_progress"})
+
+    assert [task.sort_order for task in updated] == sorted(task.sort_order for task in updated)
+    assert [task.id for task in repo.list_tasks(TaskFilters(filter_key="in_progress"))] == selected
+
+
+def test_unit_of_work_commits_once_and_rolls_back_on_error(repo: TaskRepository) -> None:
+    with pytest.raises(RuntimeError):
+        with repo.unit_of_work():
+            repo.create_task({"title": "Lost"})
+            raise RuntimeError("boom")
+    assert repo.list_tasks(TaskFilters(filter_key="all")) == []
+
+    with repo.unit_of_work():
+        task = repo.create_task({"title": "Kept"})
+        subtask = repo.create_subtask(task.id, "step")
+        done = repo.update_task(task.id, {"status": "done"})
+        renamed = repo.update_subtask(subtask.id, {"title": "first step"})
+
+    assert done.status.value == "done" and done.updated_at >= task.updated_at
+    assert (renamed.title, renamed.sort_order) == ("first step", 1)
+    assert repo.get_task(task.id).status.value == "done"
+    assert repo.update_task(task.id + 1, {"title": "missing"}) is None
+
+
+def test_registered_statements_take_new_values_on_every_call(repo: TaskRepository) -> None:
+    _seed(40)
+    for term, due_on in [("Task 1", date(2026, 2, 2)), ("Task 2", date(2026, 2, 3)), ("3", None)]:
+        filters = TaskFilters(filter_key="all", search=term, due_on=due_on)
+        titles = {card.title for card in repo.list_cards_page(filters, limit=100).cards}
+        expected = {
+            task.title
+            for task in repo.list_tasks(TaskFilters(filter_key="all"))
+            if term in task.title and (due_on is None or task.due_date == due_on)
+        }
+        assert titles == expected and titles
+
+    first, second = repo.list_tasks(TaskFilters(filter_key="all"))[:2]
+    assert [task.id for task in repo.get_tasks([first.id])] == [first.id]
+    assert [task.id for task in repo.get_tasks([second.id, first.id])] == sorted([first.id, second.id])
+    # Every chunk length renders its own IN list, so this one is never prepared server-side.
+    assert repository._statements.get("tasks_by_id", None).get_execution_options()["prepare"] is False
+
+
+def test_series_heads_are_the_latest_recurring_instance(repo: TaskRepository) -> None:
+    first = repo.create_task({"title": "Daily", "due_date": date(2026, 1, 1), "recurrence_rule": "daily"})
+    repo.bulk_create(
+        {"title": "Daily", "due_date": date(2026, 1, day), "recurrence_rule": "daily", "series_id": first.id}
+        for day in (3, 2)
+    )
+    other = repo.create_task({"title": "Weekly", "due_date": date(2026, 1, 1), "recurrence_rule": "weekly"})
+    repo.create_task({"title": "Plain", "due_date": date(2026, 1, 9)})
+
+    heads = repo.list_series_heads()
+
+    assert [(task.series_key, task.due_date) for task in heads] == [
+        (first.id, date(2026, 1, 3)),
+        (other.id, date(2026, 1, 1)),
+    ]
+    assert [task.series_key for task in repo.list_series_heads([other.id])] == [other.id]
+    assert repo.list_open_recurring_dues() == {
+        ("Daily", "daily"): date(2026, 1, 3),
+        ("Weekly", "weekly"): date(2026, 1, 1),
+    }
+    assert repo.count_open_due(date(2026, 1, 2), date(2026, 1, 9)) == {
+        date(2026, 1, 2): 1,
+        date(2026, 1, 3): 1,
+        date(2026, 1, 9): 1,
+    }
+
+
+def test_changing_the_rule_restarts_the_series_at_the_due_date(repo: TaskRepository) -> None:
+    first = repo.create_task({"title": "Rent", "due_date": date(2026, 1, 31), "recurrence_rule": "monthly"})
+    later = repo.create_task(
+        {
+            "title": "Rent",
+            "due_date": date(2026, 2, 28),
+            "recurrence_rule": "monthly",
+            "series_id": first.id,
+            "series_start": date(2026, 1, 31),
+        }
+    )
+
+    kept = repo.update_task(later.id, {"title": "Rent", "recurrence_rule": "monthly"})
+    moved = repo.update_many([later.id], {"recurrence_rule": "weekly", "due_date": date(2026, 3, 2)})[0]
+    root = repo.update_task(first.id, {"recurrence_rule": "weekly"})
+
+    assert kept.recurrence_start == date(2026, 1, 31)
+    assert (moved.series_key, moved.recurrence_start) == (first.id, date(2026, 3, 2))
+    assert root.series_start is None
+
+
+
+def test_moving_any_instance_restarts_its_series_at_the_new_date(repo: TaskRepository) -> None:
+    first = repo.create_task({"title": "Rent", "due_date": date(2026, 1, 31), "recurrence_rule": "monthly"})
+    later = repo.create_task(
+        {
+            "title": "Rent",
+            "due_date": date(2026, 2, 28),
+            "recurrence_rule": "monthly",
+            "series_id": first.id,
+            "series_start": date(2026, 1, 31),
+        }
+    )
+
+    resaved = repo.update_task(later.id, {"title": "Rent", "due_date": date(2026, 2, 28)})
+    moved = repo.update_task(later.id, {"due_date": date(2026, 3, 15)})
+    root = repo.update_task(first.id, {"due_date": date(2026, 2, 1)})
+    TaskService(repo).mark_done(later.id)
+
+    assert resaved.recurrence_start == date(2026, 1, 31)
+    assert moved.recurrence_start == date(2026, 3, 15)
+    assert (root.series_start, root.recurrence_start) == (None, date(2026, 2, 1))
+    assert [head.due_date for head in repo.list_series_heads([first.id])] == [date(2026, 4, 15)]
+
+def test_postgres_card_moved_to_the_end_ranks_below_the_next_append(pg_repo: TaskRepository) -> None:
+    first, second, last = [pg_repo.create_task({"title": f"Ranked {index}"}) for index in range(3)]
+
+    pg_repo.reorder_tasks([second.id, last.id, first.id])
+    appended = pg_repo.create_task({"title": "Ranked 3"})
+
+    ranks = {task.id: task.sort_order for task in pg_repo.get_tasks([first.id, second.id, last.id, appended.id])}
+    assert ranks[second.id] < ranks[last.id] < ranks[first.id] < ranks[appended.id]
+
+
+def test_postgres_bulk_create_copies_rows_ranked_from_the_sequence(pg_repo: TaskRepository) -> None:
+    before = pg_repo.create_task({"title": "Before import"})
+    rows = (
+        {"title": f"Imported {index}", "status": "done" if index % 2 else "inbox", "due_date": date(2026, 1, index + 1)}
+        for index in range(5)
+    )
+
+    created = pg_repo.bulk_create(rows, batch_size=2)
+    after = pg_repo.create_task({"title": "After import"})
+
+    imported = pg_repo.get_tasks(list(range(before.id + 1, after.id)))
+    assert created == 5
+    assert [(task.title, task.due_date) for task in imported] == [
+        (f"Imported {index}", date(2026, 1, index + 1)) for index in range(5)
+    ]
+    ranks = [before.sort_order, *(task.sort_order for task in imported), after.sort_order]
+    assert ranks == sorted(set(ranks))
+
+
+def test_postgres_reorder_writes_every_moved_rank_in_one_statement(pg_repo: TaskRepository) -> None:
+    tasks = [pg_repo.create_task({"title": f"Reversed {index}"}) for index in range(5)]
+    updates: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        if statement.startswith("UPDATE"):
+            updates.append(statement)
+
+    connection = repository._active_session.get().connection()
+    event.listen(connection, "before_cursor_execute", record)
+    try:
+        pg_repo.reorder_tasks([task.id for task in reversed(tasks)])
+    finally:
+        event.remove(connection, "before_cursor_execute", record)
+
+    assert len(updates) == 1 and "FROM (VALUES" in updates[0]
+    ranks = {task.id: task.sort_order for task in pg_repo.get_tasks([task.id for task in tasks])}
+    assert [ranks[task.id] for task in reversed(tasks)] == sorted(ranks.values())
+
+
+def test_postgres_batch_status_change_ranks_in_given_order_before_the_next_append(pg_repo: TaskRepository) -> None:
+    tasks = [pg_repo.create_task({"title": f"Batch {index}"}) for index in range(4)]
+    selected = [tasks[3].id, tasks[0].id, tasks[2].id]
+
+    updated = pg_repo.update_many(selected, {"status": "in_progress"})
+    appended = pg_repo.create_task({"title": "Batch 4", "status": "in_progress"})
+
+    assert [task.id for task in updated] == selected
+    ranks = [task.sort_order for task in updated]
+    assert ranks == sorted(set(ranks)) and ranks[-1] < appended.sort_order
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+from app.domain.entities import SubtaskSummary, TaskBoard, TaskCardRow, TaskEntity
+from app.domain.enums import TaskStatus
+from app.domain.filters import TaskCursor
+from app.ui.task_model import SUBTASKS_ROLE, TaskBoardModel, TaskListModel
+
+NOW = datetime(2026, 1, 1, 12, 0)
+
+
+def _task(task_id: int, updated_at: datetime = NOW) -> TaskCardRow:
+    return TaskCardRow(
+        id=task_id,
+        title=f"Task {task_id}",
+        status=TaskStatus.INBOX,
+        priority=2,
+        due_date=None,
+        tags="",
+        sort_order=task_id,
+        created_at=NOW,
+        updated_at=updated_at,
+    )
+
+
+def _record_signals(model: TaskListModel) -> list[str]:
+    events: list[str] = []
+    model.rowsInserted.connect(lambda *args: events.append("insert"))
+    model.rowsRemoved.connect(lambda *args: events.append("remove"))
+    model.rowsMoved.connect(lambda *args: events.append("move"))
+    model.dataChanged.connect(lambda *args: events.append("change"))
+    model.modelReset.connect(lambda: events.append("reset"))
+    return events
+
+
+def test_sync_moves_single_row_once() -> None:
+    model = TaskListModel()
+    tasks = [_task(task_id) for task_id in range(1, 11)]
+    model.set_tasks(tasks)
+    events = _record_signals(model)
+
+    reordered = tasks[1:] + tasks[:1]
+    changed = model.sync_tasks(reordered)
+
+    assert model.task_ids() == [task.id for task in reordered]
+    assert events == ["move"]
+    assert changed == set()
+
+
+def test_sync_inserts_removes_and_repaints_changed_rows() -> None:
+    model = TaskListModel()
+    tasks = [_task(task_id) for task_id in range(1, 6)]
+    model.set_tasks(tasks, {1: SubtaskSummary(1, 0, ("a",))})
+    events = _record_signals(model)
+
+    edited = replace(tasks[2], title="Edited", updated_at=NOW + timedelta(minutes=1))
+    target = [tasks[0], _task(9), tasks[1], edited, tasks[4]]
+    changed = model.sync_tasks(target, {1: SubtaskSummary(1, 1, ("a",))})
+
+    assert model.task_ids() == [1, 9, 2, 3, 5]
+    assert model.task_by_id(3).title == "Edited"
+    assert changed == {1, 3}
+    assert sorted(events) == ["change", "change", "insert", "remove"]
+
+
+def test_fetch_more_appends_pages_and_drops_outdated_ones() -> None:
+    model = TaskListModel()
+    requests: list[tuple[TaskCursor, object]] = []
+    model.set_page_loader(lambda cursor, callback: requests.append((cursor, callback)))
+    model.set_tasks([_task(1), _task(2)])
+    model.set_next_cursor(TaskCursor(2, None, 2, NOW, 2))
+
+    model.fetchMore()
+    assert not model.canFetchMore()
+    cursor, callback = requests.pop()
+    callback(cursor, [_task(3)], {3: SubtaskSummary(1, 0, ("sub",))}, None)
+    assert model.task_ids() == [1, 2, 3]
+
+    model.set_next_cursor(TaskCursor(3, None, 2, NOW, 3))
+    model.fetchMore()
+    cursor, callback = requests.pop()
+    model.set_next_cursor(None)
+    callback(cursor, [_task(4)], {}, None)
+    assert model.task_ids() == [1, 2, 3]
+
+
+def test_board_moves_card_locally_and_applies_saved_task() -> None:
+    board = TaskBoardModel({"inbox": TaskListModel(), "done": TaskListModel()})
+    summary = SubtaskSummary(total=2, done=1, titles=("a", "b"))
+    board.load(TaskBoard(columns={"inbox": [_task(1), _task(2)], "done": [_task(3)]}, subtasks={1: summary}))
+    inbox, done = board.columns["inbox"], board.columns["done"]
+
+    assert board.move_card(1, "done")
+    assert not board.move_card(1, "done")
+    assert inbox.task_ids() == [2]
+    assert done.task_ids() == [3, 1]
+    assert done.task_by_id(1).status is TaskStatus.DONE
+    assert done.data(done.index(1), SUBTASKS_ROLE) == summary
+
+    saved = TaskEntity(
+        id=1,
+        title="Renamed",
+        description="Only the detail panel needs this",
+        status=TaskStatus.DONE,
+        priority=2,
+        due_date=None,
+        tags="",
+        created_at=NOW,
+        updated_at=NOW + timedelta(minutes=1),
+        completed_at=NOW,
+        recurrence_rule=None,
+        recurrence_interval=1,
+        recurrence_end_date=None,
+        archived_at=None,
+        sort_order=9,
+    )
+    board.card_saved(1, saved)
+    assert done.task_by_id(1) == TaskCardRow.from_entity(saved)
+
+    board.card_saved(2, None)
+    assert inbox.task_ids() == []
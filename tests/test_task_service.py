@@ -1,74 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import replace
-from datetime import date, datetime
+from datetime import date
 
-from app.domain.entities import TaskEntity
+from app.domain.entities import SubtaskSummary
 from app.domain.enums import RecurrenceRule, TaskStatus
 from app.domain.filters import TaskFilters
 from app.services.task_service import TaskService
 
-
-class FakeRepo:
-    def __init__(self) -> None:
-        self.tasks: list[TaskEntity] = []
-        self._id = 1
-
-    def list_tasks(self, filters: TaskFilters) -> list[TaskEntity]:
-        return self.tasks
-
-    def get_task(self, task_id: int) -> TaskEntity | None:
-        return next((t for t in self.tasks if t.id == task_id), None)
-
-    def create_task(self, data: dict) -> TaskEntity:
-        task = TaskEntity(
-            id=self._id,
-            title=data.get("title", ""),
-            description=data.get("description", ""),
-            status=TaskStatus(data.get("status", "inbox")),
-            priority=data.get("priority", 2),
-            due_date=data.get("due_date"),
-            tags=data.get("tags", ""),
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-            completed_at=None,
-            recurrence_rule=data.get("recurrence_rule"),
-            recurrence_interval=data.get("recurrence_interval", 1),
-            recurrence_end_date=data.get("recurrence_end_date"),
-            archived_at=None,
-            sort_order=1,
-        )
-        self.tasks.append(task)
-        self._id += 1
-        return task
-
-    def update_task(self, task_id: int, data: dict) -> TaskEntity | None:
-        task = self.get_task(task_id)
-        if not task:
-            return None
-        updated = replace(
-            task,
-            status=TaskStatus(data.get("status", task.status.value)),
-            completed_at=data.get("completed_at", task.completed_at),
-            archived_at=data.get("archived_at", task.archived_at),
-        )
-        self.tasks = [updated if t.id == task_id else t for t in self.tasks]
-        return updated
-
-    def delete_task(self, task_id: int) -> None:
-        self.tasks = [t for t in self.tasks if t.id != task_id]
-
-    def get_stats(self) -> dict[str, int]:
-        return {
-            "total": len(self.tasks),
-            "in_progress": 0,
-            "done": 0,
-            "overdue": 0,
-            "due_today": 0,
-        }
-
-    def list_due_reminders(self) -> list[TaskEntity]:
-        return []
+from fakes import FakeRepo
 
 
 def test_recurring_task_creates_next_instance() -> None:
@@ -89,3 +28,151 @@ def test_recurring_task_creates_next_instance() -> None:
     assert len(repo.tasks) == 2
     next_task = repo.tasks[1]
     assert next_task.due_date == date(2026, 1, 2)
+    assert next_task.series_id == task.id
+
+    # Completing it again does not add a second instance for the same day.
+    repo.update_task(task.id, {"status": "inbox"})
+    service.mark_done(task.id)
+    assert len(repo.tasks) == 2
+
+
+def test_cached_listing_is_dropped_only_when_a_member_changes() -> None:
+    repo = FakeRepo()
+    service = TaskService(repo)
+    first = service.create_task({"title": "A", "status": "inbox"})
+    service.create_task({"title": "B", "status": "inbox"})
+
+    assert [t.title for t in service.list_tasks(TaskFilters("inbox"))] == ["A", "B"]
+    assert service.list_tasks(TaskFilters("done")) == []
+    service.list_tasks(TaskFilters("inbox"))
+    assert repo.calls["list_tasks"] == 2
+    assert service.cache_stats().hits == 1
+
+    service.update_task(first.id, {"status": TaskStatus.IN_PROGRESS.value})
+    assert [t.title for t in service.list_tasks(TaskFilters("inbox"))] == ["B"]
+    service.list_tasks(TaskFilters("done"))
+    assert repo.calls["list_tasks"] == 3
+    assert service.get_task(first.id).status == TaskStatus.IN_PROGRESS
+
+
+def test_subtask_summaries_are_cached_per_task() -> None:
+    repo = FakeRepo()
+    service = TaskService(repo)
+    first = service.create_task({"title": "A"})
+    second = repo.create_task({"title": "B"})
+    repo.create_subtask(second.id, "existing")
+
+    assert service.get_subtask_summaries([first.id, second.id]) == {
+        second.id: SubtaskSummary(1, 0, ("existing",)),
+    }
+    assert repo.calls["get_subtask_summaries"] == 1
+
+    service.create_subtask(first.id, "new")
+    assert service.get_subtask_summaries([first.id, second.id]) == {
+        first.id: SubtaskSummary(1, 0, ("new",)),
+        second.id: SubtaskSummary(1, 0, ("existing",)),
+    }
+    assert repo.calls["get_subtask_summaries"] == 2
+    stats = service.cache_stats()
+    assert (stats.hits, stats.misses) == (2, 2)
+
+
+def test_mark_done_many_recurs_once_per_open_task() -> None:
+    repo = FakeRepo()
+    service = TaskService(repo)
+    daily = repo.create_task({
+        "title": "Daily",
+        "due_date": date(2026, 1, 1),
+        "recurrence_rule": RecurrenceRule.DAILY.value,
+    })
+    done = repo.create_task({
+        "title": "Done weekly",
+        "status": "done",
+        "due_date": date(2026, 1, 1),
+        "recurrence_rule": RecurrenceRule.WEEKLY.value,
+    })
+    plain = repo.create_task({"title": "Plain"})
+    assert service.list_tasks(TaskFilters("inbox"))
+
+    tasks = service.mark_done_many([daily.id, done.id, plain.id])
+
+    assert [task.status for task in tasks] == [TaskStatus.DONE] * 3
+    assert all(task.completed_at is not None for task in tasks if task.id != done.id)
+    assert repo.calls["update_many"] == 1
+    assert repo.calls["unit_of_work"] == 1
+    assert [(t.title, t.due_date) for t in service.list_tasks(TaskFilters("inbox"))] == [
+        ("Daily", date(2026, 1, 2)),
+    ]
+
+
+def test_materialize_recurrences_creates_only_the_next_instance_of_completed_series() -> None:
+    repo = FakeRepo()
+    service = TaskService(repo)
+    daily = repo.create_task({
+        "title": "Daily",
+        "status": "done",
+        "due_date": date(2026, 1, 1),
+        "recurrence_rule": RecurrenceRule.DAILY.value,
+    })
+    repo.create_task({
+        "title": "Monthly",
+        "status": "done",
+        "due_date": date(2026, 1, 31),
+        "recurrence_rule": RecurrenceRule.MONTHLY.value,
+    })
+
+    assert service.materialize_recurrences() == 2
+    assert repo.calls["bulk_create"] == 1
+    assert repo.calls["unit_of_work"] == 1
+    assert [(t.title, t.due_date, t.series_id) for t in repo.tasks[2:]] == [
+        ("Daily", date(2026, 1, 2), daily.id),
+        ("Monthly", date(2026, 2, 28), daily.id + 1),
+    ]
+
+    # Both series now end in an open instance.
+    assert service.materialize_recurrences() == 0
+
+
+def test_materialize_recurrences_leaves_an_open_overdue_series_alone() -> None:
+    repo = FakeRepo()
+    service = TaskService(repo)
+    repo.create_task({
+        "title": "Unfinished daily",
+        "due_date": date(2026, 1, 1),
+        "recurrence_rule": RecurrenceRule.DAILY.value,
+    })
+
+    assert service.materialize_recurrences() == 0
+    assert len(repo.tasks) == 1
+
+
+def test_materialize_recurrences_skips_a_legacy_series_with_an_unlinked_open_successor() -> None:
+    repo = FakeRepo()
+    service = TaskService(repo)
+    # Completed before series were linked: the successor carries no series_id.
+    for status, due in (("done", date(2025, 10, 1)), ("inbox", date(2025, 10, 2))):
+        repo.create_task({
+            "title": "Water plants",
+            "status": status,
+            "due_date": due,
+            "recurrence_rule": RecurrenceRule.DAILY.value,
+        })
+
+    assert service.materialize_recurrences() == 0
+    assert len(repo.tasks) == 2
+
+
+def test_calendar_marks_project_series_without_creating_tasks() -> None:
+    repo = FakeRepo()
+    service = TaskService(repo)
+    repo.create_task({
+        "title": "Weekly",
+        "due_date": date(2026, 3, 2),
+        "recurrence_rule": RecurrenceRule.WEEKLY.value,
+    })
+
+    marks = service.calendar_marks(date(2026, 3, 1), date(2026, 3, 31))
+
+    assert marks.due == {date(2026, 3, 2): 1}
+    assert sorted(marks.projected) == [date(2026, 3, 9), date(2026, 3, 16), date(2026, 3, 23), date(2026, 3, 30)]
+    assert len(repo.tasks) == 1
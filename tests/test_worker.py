@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+from PySide6.QtCore import QCoreApplication
+
+from app.ui.worker import DbWorker, ExportQueue
+
+
+@pytest.fixture(scope="module", autouse=True)
+def qt_app() -> QCoreApplication:
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def test_export_queue_merges_waiting_jobs_with_the_same_key() -> None:
+    queue = ExportQueue()
+    release = threading.Event()
+    calls: list[str] = []
+    delivered: list[tuple[object, object]] = []
+    queue.finished.connect(lambda key, result: delivered.append((key, result)))
+
+    assert queue.enqueue("slow", release.wait, 5)
+    assert queue.enqueue("ics", calls.append, "first")
+    assert not queue.enqueue("ics", calls.append, "second")
+    release.set()
+    queue.flush()
+
+    assert calls == ["second"]
+    assert sorted(key for key, _ in delivered) == ["ics", "slow"]
+    assert not queue.is_busy()
+
+
+def test_export_queue_reports_failures() -> None:
+    queue = ExportQueue()
+    errors: list[Exception] = []
+    failed: list[object] = []
+    queue.failed.connect(lambda key, exc: failed.append(key))
+
+    def broken() -> None:
+        raise OSError("share is offline")
+
+    queue.enqueue("ics", broken, on_error=errors.append)
+    queue.flush()
+
+    assert failed == ["ics"]
+    assert isinstance(errors[0], OSError)
+
+
+def test_db_worker_after_pending_runs_behind_queued_jobs() -> None:
+    worker = DbWorker()
+    order: list[str] = []
+
+    worker.submit(order.append, "write")
+    worker.after_pending(lambda: order.append("export"))
+    worker.drain()
+
+    assert order == ["write", "export"]